@@ -5,6 +5,8 @@ import logging.config
 import requests
 
 from .core.logs import LoggingConfigs
+from .core.page_size_tuner import PageSizeTuner
+from .core.request_handler import RequestHandler
 from .methods import (
     AlationAuthentication,
     AlationBISource,
@@ -44,7 +46,9 @@ class Alation(object):
     def __init__(self, host: str, user_id: int = None, refresh_token: str = None,
                  access_token: str = None, validate_ssl: bool = True,
                  private_ssl_cert: str = None, disable_authentication: bool = False,
-                 client_id: str = None, client_secret: str = None):
+                 client_id: str = None, client_secret: str = None,
+                 compress_requests: bool = False, auto_page_size: bool = False,
+                 page_size_profile: str = None):
         """Creates an instance of the Alation object.
 
         Args:
@@ -57,6 +61,10 @@ class Alation(object):
             disable_authentication (bool): if True, this Alation instance can be instantiated without authenticating first.
             client_id (str, optional): OAuth client ID for client_credentials authentication.
             client_secret (str, optional): OAuth client secret for client_credentials authentication.
+            compress_requests (bool): Gzip compress large POST, PATCH and PUT request bodies.
+            auto_page_size (bool): Adapt the page size of paginated GET requests per endpoint to the
+                measured response size and duration.
+            page_size_profile (str): JSON file storing the learned page sizes between runs (auto_page_size only).
 
         Note:
             For OAuth authentication, provide client_id and client_secret.
@@ -195,6 +203,18 @@ class Alation(object):
             access_token=self.access_token, session=session, host=host
         )
 
+        if compress_requests:
+            for handler in vars(self).values():
+                if isinstance(handler, RequestHandler):
+                    handler.compress_requests = True
+
+        if auto_page_size:
+            # one tuner for all handlers, several of them read the same endpoints
+            page_size_tuner = PageSizeTuner(profile_path=page_size_profile)
+            for handler in vars(self).values():
+                if isinstance(handler, RequestHandler):
+                    handler.page_size_tuner = page_size_tuner
+
     @property
     def access_token(self) -> str:
         """Return the Alation API Access Token.
@@ -1,9 +1,14 @@
 """Work with the Alation PATCH, POST and PUT Calls Asynchronously"""
 
+import io
 import logging
+import os
 import requests
 import re
-from .request_handler import RequestHandler
+from typing import IO
+from .custom_exceptions import InvalidPostBody, UnreadableDirectory, UnsupportedPostBody
+from .jsonl import iter_file_chunks, iter_gzip_chunks
+from .request_handler import UNSUPPORTED_MEDIA_TYPE, RequestHandler
 from ..methods.job import AlationJob
 from ..models.job_model import *
 
@@ -200,7 +205,7 @@ class AsyncHandler(RequestHandler):
                 results.append(self._map_batch_error_to_job_details(batch_error))
         return results
 
-    def async_post_data_payload(self, url: str, data: any, query_params: dict = None) -> list:
+    def async_post_data_payload(self, url: str, data: any, query_params: dict = None, headers: dict = None) -> list:
         """POST the Alation Objects via an Async Job Process.
             Method to process the posts that are not lists, but data e.g. strings. Batching is not needed in these cases
             and the payload should be processed in their entirety as the contents and sequence of objects is important.
@@ -208,6 +213,8 @@ class AsyncHandler(RequestHandler):
         Args:
             url (str): POST API Call URL.
             payload (str): REST API data type payload.
+            query_params (dict): REST API POST Query Parameters
+            headers (dict): REST API POST Headers
 
         Returns:
             list: job execution results
@@ -218,7 +225,7 @@ class AsyncHandler(RequestHandler):
         results = []
         try:
             LOGGER.debug(data)
-            async_response = self.post(url, body=data, query_params=query_params)
+            async_response = self.post(url, body=data, query_params=query_params, headers=headers)
             if async_response:
                 # check if the response includes a job_id and only then fetch job details
                 if any(var in async_response.keys() for var in ("task", "job", "job_id", "job_name")):
@@ -232,12 +239,76 @@ class AsyncHandler(RequestHandler):
             LOGGER.error(f"HTTP error occurred: {e}", exc_info=True)
             # Raise all HTTP errors for consistent behavior
             raise
+        except (InvalidPostBody, UnsupportedPostBody, UnreadableDirectory):
+            # streamed payloads are validated while they are sent, fail the same way as a validated list,
+            # and an aborted crawl must not look like a finished upload
+            raise
         except Exception as batch_error:
             LOGGER.error(batch_error, exc_info=True)
             results.append(self._map_batch_error_to_job_details(batch_error))
 
         return results
 
+    def async_post_jsonl_payload(
+            self,
+            url: str,
+            payload: str | bytes | os.PathLike | IO,
+            query_params: dict = None,
+            compress: bool = False
+    ) -> list:
+        """POST a JSON Lines payload via an Async Job Process.
+
+        Files are streamed as the request body instead of being loaded into memory.
+
+        Args:
+            url (str): POST API Call URL.
+            payload (str | bytes | os.PathLike | IO): JSON Lines content, path to a JSON Lines file
+                or a file object opened for reading.
+            query_params (dict): REST API POST Query Parameters
+            compress (bool): Gzip compress the request body on the fly and send it with
+                'Content-Encoding: gzip'. If the server rejects compressed bodies, the payload is
+                sent again uncompressed, unless it is a file object that cannot be rewound.
+
+        Returns:
+            list: job execution results
+
+        Raises:
+            requests.exceptions.HTTPError: If the API returns a non-success status code.
+        """
+        if isinstance(payload, os.PathLike):
+            with open(payload, 'rb') as file_obj:
+                return self.async_post_jsonl_payload(url, file_obj, query_params=query_params, compress=compress)
+
+        if isinstance(payload, (str, bytes)):
+            if not compress:
+                return self.async_post_data_payload(url, data=payload, query_params=query_params)
+            chunks = [payload.encode('utf-8') if isinstance(payload, str) else payload]
+        elif not compress and isinstance(payload, io.BufferedIOBase):
+            # binary files are sent as they are, requests determines the content length
+            return self.async_post_data_payload(url, data=payload, query_params=query_params)
+        else:
+            chunks = iter_file_chunks(payload)
+
+        headers = None
+        start = None
+        if compress:
+            chunks = iter_gzip_chunks(chunks)
+            headers = self.headers.copy()
+            headers['Content-Encoding'] = 'gzip'
+            if hasattr(payload, 'seekable') and payload.seekable():
+                start = payload.tell()
+
+        try:
+            return self.async_post_data_payload(url, data=chunks, query_params=query_params, headers=headers)
+        except requests.exceptions.HTTPError as http_error:
+            rejected = http_error.response is not None and http_error.response.status_code == UNSUPPORTED_MEDIA_TYPE
+            if not compress or not rejected or (start is None and not isinstance(payload, (str, bytes))):
+                raise
+            LOGGER.warning('The server does not accept gzip request bodies, sending the payload uncompressed.')
+            if start is not None:
+                payload.seek(start)
+            return self.async_post_jsonl_payload(url, payload, query_params=query_params, compress=False)
+
     def async_post_dict_payload(self, url: str, payload: dict) -> dict:
         """POST the Alation Objects via an Async Job Process.
 
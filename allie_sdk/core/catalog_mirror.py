@@ -0,0 +1,374 @@
+"""Mirror Alation RDBMS Objects into a Local SQLite Database."""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Iterator
+
+from ..methods.rdbms import RDBMS_SCAN_TYPES, AlationRDBMS
+from ..models.custom_field_model import CustomFieldValue
+from ..models.rdbms_model import Column, Schema, Table
+
+LOGGER = logging.getLogger('allie_sdk_logger')
+
+# object types in load order, parents first
+MIRROR_OBJECT_TYPES = ('schema', 'table', 'column')
+# response field holding the parent id of an object type
+MIRROR_PARENT_FIELDS = {'schema': None, 'table': 'schema_id', 'column': 'table_id'}
+# sync state key used when all data sources are mirrored
+ALL_DATASOURCES = 0
+
+MIRROR_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS objects ('
+    'otype TEXT NOT NULL, id INTEGER NOT NULL, ds_id INTEGER, parent_id INTEGER, '
+    'key TEXT, name TEXT, data TEXT NOT NULL, synced_at REAL NOT NULL, PRIMARY KEY (otype, id))',
+    'CREATE INDEX IF NOT EXISTS objects_key ON objects (otype, key)',
+    'CREATE INDEX IF NOT EXISTS objects_ds_id ON objects (otype, ds_id)',
+    'CREATE INDEX IF NOT EXISTS objects_parent_id ON objects (otype, parent_id)',
+    'CREATE TABLE IF NOT EXISTS custom_field_values ('
+    'otype TEXT NOT NULL, oid INTEGER NOT NULL, field_id INTEGER NOT NULL, value TEXT, '
+    'PRIMARY KEY (otype, oid, field_id))',
+    'CREATE INDEX IF NOT EXISTS custom_field_values_field_id ON custom_field_values (otype, field_id)',
+    'CREATE TABLE IF NOT EXISTS sync_state ('
+    'otype TEXT NOT NULL, ds_id INTEGER NOT NULL, max_id INTEGER, full_sync_at REAL, delta_sync_at REAL, '
+    'PRIMARY KEY (otype, ds_id))',
+)
+
+
+class CatalogMirror:
+    """Keep a local SQLite copy of the Alation RDBMS Schemas, Tables and Columns.
+
+    The objects are stored with their custom field values and indexed by id,
+    key, data source and parent object, so repeated lookups do not need any
+    API calls. The first refresh runs a full sync. Later refreshes only fetch
+    the objects with ids above the highest id mirrored so far, since the
+    RDBMS API has no filter on the modification time. Updates and deletions
+    of existing objects are picked up by the next full sync, which is run
+    once the last full sync is older than full_sync_interval seconds, or by
+    calling refresh_objects for the ids known to have changed.
+
+    """
+
+    def __init__(
+            self,
+            rdbms: AlationRDBMS,
+            database_path: str | os.PathLike,
+            ds_ids: list[int] = None,
+            full_sync_interval: float = None
+    ):
+        """Creates an instance of the CatalogMirror object.
+
+        Args:
+            rdbms (AlationRDBMS): RDBMS methods used to fetch the objects, e.g. Alation(...).rdbms.
+            database_path (str | os.PathLike): SQLite file of the mirror. Use ':memory:' for a temporary mirror.
+            ds_ids (list[int]): Data sources to mirror. All data sources are mirrored if not set.
+            full_sync_interval (float): Seconds after which refresh runs a full sync again.
+                Only new objects are fetched by refresh if not set.
+
+        """
+        self.rdbms = rdbms
+        self.database_path = database_path
+        self.ds_ids = list(ds_ids) if ds_ids else [ALL_DATASOURCES]
+        self.full_sync_interval = full_sync_interval
+
+        self.connection = sqlite3.connect(database_path)
+        for statement in MIRROR_SCHEMA:
+            self.connection.execute(statement)
+        self.connection.commit()
+
+    def close(self):
+        """Close the SQLite database."""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def refresh(self) -> dict[str, int]:
+        """Bring the mirror up to date.
+
+        A full sync is run for every data source and object type that was never
+        synced or whose last full sync is older than full_sync_interval, a delta
+        sync of the new objects otherwise.
+
+        Returns:
+            dict[str, int]: Number of objects fetched per object type.
+
+        """
+        fetched = dict.fromkeys(MIRROR_OBJECT_TYPES, 0)
+        for ds_id in self.ds_ids:
+            for otype in MIRROR_OBJECT_TYPES:
+                state = self.connection.execute(
+                    'SELECT max_id, full_sync_at FROM sync_state WHERE otype = ? AND ds_id = ?', (otype, ds_id)
+                ).fetchone()
+                expired = (state is not None and self.full_sync_interval is not None
+                           and time.time() - state[1] > self.full_sync_interval)
+
+                if state is None or expired:
+                    fetched[otype] += self._full_sync(otype, ds_id)
+                else:
+                    fetched[otype] += self._delta_sync(otype, ds_id, state[0])
+
+        LOGGER.info('Catalog mirror refreshed: %s schemas, %s tables and %s columns fetched.',
+                    fetched['schema'], fetched['table'], fetched['column'])
+        return fetched
+
+    def full_sync(self) -> dict[str, int]:
+        """Fetch all objects again and drop the objects that no longer exist.
+
+        Returns:
+            dict[str, int]: Number of objects fetched per object type.
+
+        """
+        fetched = dict.fromkeys(MIRROR_OBJECT_TYPES, 0)
+        for ds_id in self.ds_ids:
+            for otype in MIRROR_OBJECT_TYPES:
+                fetched[otype] += self._full_sync(otype, ds_id)
+        return fetched
+
+    def refresh_objects(self, otype: str, ids: list[int]) -> int:
+        """Fetch specific objects again, e.g. after they were patched.
+
+        Objects that no longer exist are removed from the mirror.
+
+        Args:
+            otype (str): 'schema', 'table' or 'column'.
+            ids (list[int]): Object ids.
+
+        Returns:
+            int: Number of objects fetched.
+
+        """
+        url = self._endpoint(otype)
+        ids = list(ids)
+        records = self.rdbms.get_many_by_id(url, {'id': ids})
+
+        with self.connection:
+            found = {record['id'] for record in records}
+            self._delete_objects(otype, [object_id for object_id in ids if object_id not in found])
+            self._store(otype, records)
+        return len(records)
+
+    def _full_sync(self, otype: str, ds_id: int) -> int:
+        synced_at = time.time()
+        records = self._fetch(otype, ds_id)
+
+        with self.connection:
+            self._store(otype, records, synced_at)
+            # everything not returned by the full sync was deleted in Alation
+            scope, params = self._scope(ds_id)
+            stale = [row[0] for row in self.connection.execute(
+                f'SELECT id FROM objects WHERE otype = ? AND synced_at < ?{scope}', (otype, synced_at, *params))]
+            self._delete_objects(otype, stale)
+            self._save_state(otype, ds_id, records, full_sync_at=synced_at)
+
+        LOGGER.debug('Full sync of %s objects of data source %s: %s objects.', otype, ds_id, len(records))
+        return len(records)
+
+    def _delta_sync(self, otype: str, ds_id: int, max_id: int | None) -> int:
+        records = self._fetch(otype, ds_id, {'id__gt': max_id} if max_id is not None else None)
+
+        with self.connection:
+            self._store(otype, records)
+            self._save_state(otype, ds_id, records)
+
+        LOGGER.debug('Delta sync of %s objects of data source %s: %s new objects.', otype, ds_id, len(records))
+        return len(records)
+
+    def _fetch(self, otype: str, ds_id: int, params: dict = None) -> list[dict]:
+        params = dict(params or {})
+        if ds_id != ALL_DATASOURCES:
+            params['ds_id'] = ds_id
+        return self.rdbms.get(self._endpoint(otype), query_params=params) or []
+
+    def _store(self, otype: str, records: list[dict], synced_at: float = None):
+        synced_at = synced_at or time.time()
+        parent_field = MIRROR_PARENT_FIELDS[otype]
+
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO objects (otype, id, ds_id, parent_id, key, name, data, synced_at) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            ((otype, record['id'], record.get('ds_id'), record.get(parent_field) if parent_field else None,
+              record.get('key'), record.get('name'), json.dumps(record), synced_at) for record in records)
+        )
+        self.connection.executemany(
+            'DELETE FROM custom_field_values WHERE otype = ? AND oid = ?',
+            ((otype, record['id']) for record in records)
+        )
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO custom_field_values (otype, oid, field_id, value) VALUES (?, ?, ?, ?)',
+            ((otype, record['id'], custom_field['field_id'], json.dumps(custom_field.get('value')))
+             for record in records for custom_field in record.get('custom_fields') or [])
+        )
+
+    def _delete_objects(self, otype: str, ids: list[int]):
+        self.connection.executemany('DELETE FROM objects WHERE otype = ? AND id = ?', ((otype, i) for i in ids))
+        self.connection.executemany(
+            'DELETE FROM custom_field_values WHERE otype = ? AND oid = ?', ((otype, i) for i in ids))
+
+    def _save_state(self, otype: str, ds_id: int, records: list[dict], full_sync_at: float = None):
+        max_id = max((record['id'] for record in records), default=None)
+        now = time.time()
+        if full_sync_at is not None:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO sync_state (otype, ds_id, max_id, full_sync_at, delta_sync_at) '
+                'VALUES (?, ?, ?, ?, ?)', (otype, ds_id, max_id, full_sync_at, now)
+            )
+        else:
+            self.connection.execute(
+                'UPDATE sync_state SET max_id = COALESCE(MAX(max_id, ?), max_id, ?), delta_sync_at = ? '
+                'WHERE otype = ? AND ds_id = ?', (max_id, max_id, now, otype, ds_id)
+            )
+
+    @staticmethod
+    def _scope(ds_id: int) -> tuple[str, tuple]:
+        if ds_id == ALL_DATASOURCES:
+            return '', ()
+        return ' AND ds_id = ?', (ds_id,)
+
+    @staticmethod
+    def _endpoint(otype: str) -> str:
+        if otype not in MIRROR_OBJECT_TYPES:
+            raise ValueError(f"Unsupported object type '{otype}'. Supported types: {MIRROR_OBJECT_TYPES}.")
+        return RDBMS_SCAN_TYPES[otype][0]
+
+    def get(self, otype: str, object_id: int) -> Schema | Table | Column | None:
+        """Look up a mirrored object by id.
+
+        Args:
+            otype (str): 'schema', 'table' or 'column'.
+            object_id (int): Object id.
+
+        Returns:
+            Schema | Table | Column | None: The object or None if it is not mirrored.
+
+        """
+        self._endpoint(otype)
+        row = self.connection.execute(
+            'SELECT data FROM objects WHERE otype = ? AND id = ?', (otype, object_id)).fetchone()
+        return self._to_model(otype, row[0]) if row else None
+
+    def get_by_key(self, otype: str, key: str) -> Schema | Table | Column | None:
+        """Look up a mirrored object by key, e.g. '7.sales.public.orders'.
+
+        Args:
+            otype (str): 'schema', 'table' or 'column'.
+            key (str): Object key.
+
+        Returns:
+            Schema | Table | Column | None: The object or None if it is not mirrored.
+
+        """
+        self._endpoint(otype)
+        row = self.connection.execute(
+            'SELECT data FROM objects WHERE otype = ? AND key = ?', (otype, key)).fetchone()
+        return self._to_model(otype, row[0]) if row else None
+
+    def find(self, otype: str, ds_id: int = None, parent_id: int = None) -> list[Schema | Table | Column]:
+        """List mirrored objects, ordered by id.
+
+        Args:
+            otype (str): 'schema', 'table' or 'column'.
+            ds_id (int): Only return objects of this data source.
+            parent_id (int): Only return the tables of this schema or the columns of this table.
+
+        Returns:
+            list[Schema | Table | Column]: Mirrored objects.
+
+        """
+        self._endpoint(otype)
+        query = 'SELECT data FROM objects WHERE otype = ?'
+        params = [otype]
+        if ds_id is not None:
+            query += ' AND ds_id = ?'
+            params.append(ds_id)
+        if parent_id is not None:
+            query += ' AND parent_id = ?'
+            params.append(parent_id)
+
+        return [self._to_model(otype, row[0]) for row in self.connection.execute(f'{query} ORDER BY id', params)]
+
+    def get_records(self, otype: str, ds_id: int = None) -> list[dict]:
+        """Return mirrored objects as the API response dicts, e.g. as the current state for
+        AlationRDBMS.sync_metadata.
+
+        Args:
+            otype (str): 'schema', 'table' or 'column'.
+            ds_id (int): Only return objects of this data source.
+
+        Returns:
+            list[dict]: API response dicts ordered by id.
+
+        """
+        return list(self.iter_records(otype, ds_id))
+
+    def iter_records(self, otype: str, ds_id: int = None, order_by: str = 'id') -> Iterator[dict]:
+        """Yield mirrored objects as the API response dicts without loading all of them.
+
+        Args:
+            otype (str): 'schema', 'table' or 'column'.
+            ds_id (int): Only return objects of this data source.
+            order_by (str): 'id' or 'key'. Ordered by key, the records can be compared with
+                snapshot_diff.diff_sorted.
+
+        Returns:
+            Iterator[dict]: API response dicts.
+
+        Raises:
+            ValueError: If the object type or the ordering is not supported.
+
+        """
+        self._endpoint(otype)
+        if order_by not in ('id', 'key'):
+            raise ValueError(f"Unsupported ordering '{order_by}'. Supported orderings: ('id', 'key').")
+        scope, params = self._scope(ds_id if ds_id is not None else ALL_DATASOURCES)
+        rows = self.connection.execute(
+            f'SELECT data FROM objects WHERE otype = ?{scope} ORDER BY {order_by}', (otype, *params))
+        for row in rows:
+            yield json.loads(row[0])
+
+    def get_custom_field_values(self, otype: str, object_id: int) -> list[CustomFieldValue]:
+        """Return the mirrored custom field values of an object.
+
+        Args:
+            otype (str): 'schema', 'table' or 'column'.
+            object_id (int): Object id.
+
+        Returns:
+            list[CustomFieldValue]: Custom field values ordered by field id.
+
+        """
+        self._endpoint(otype)
+        rows = self.connection.execute(
+            'SELECT field_id, value FROM custom_field_values WHERE otype = ? AND oid = ? ORDER BY field_id',
+            (otype, object_id)
+        )
+        return [
+            CustomFieldValue.from_api_response(
+                {'otype': otype, 'oid': object_id, 'field_id': field_id, 'value': json.loads(value)})
+            for field_id, value in rows
+        ]
+
+    def count(self, otype: str, ds_id: int = None) -> int:
+        """Return the number of mirrored objects.
+
+        Args:
+            otype (str): 'schema', 'table' or 'column'.
+            ds_id (int): Only count objects of this data source.
+
+        Returns:
+            int: Number of objects.
+
+        """
+        self._endpoint(otype)
+        scope, params = self._scope(ds_id if ds_id is not None else ALL_DATASOURCES)
+        return self.connection.execute(
+            f'SELECT COUNT(*) FROM objects WHERE otype = ?{scope}', (otype, *params)).fetchone()[0]
+
+    @staticmethod
+    def _to_model(otype: str, data: str) -> Schema | Table | Column:
+        return RDBMS_SCAN_TYPES[otype][2].from_api_response(json.loads(data))
@@ -0,0 +1,86 @@
+"""Column-oriented Containers for Bulk API Results."""
+
+import json
+
+
+class ColumnarResult(dict):
+    """Column-oriented API result mapping each field name to a list of values.
+
+    Values are taken as-is from the JSON response, so nested structures
+    (e.g. custom fields) are kept as plain dicts and lists.
+
+    """
+
+    @classmethod
+    def from_records(cls, records: list, columns: list) -> 'ColumnarResult':
+        """Build the column arrays from a list of API response dicts.
+
+        Args:
+            records (list): API response dicts.
+            columns (list): Field names to extract. Missing fields are returned as None.
+
+        Returns:
+            ColumnarResult: Column-oriented result.
+
+        """
+        return cls({column: [record.get(column) for record in records] for column in columns})
+
+    @property
+    def num_rows(self) -> int:
+        """Return the number of rows in the result.
+
+        Returns:
+            int: Number of rows.
+
+        """
+        for values in self.values():
+            return len(values)
+        return 0
+
+    def to_pandas(self):
+        """Convert the result into a pandas DataFrame.
+
+        Returns:
+            pandas.DataFrame: Result as a DataFrame.
+
+        Raises:
+            ImportError: If pandas is not installed.
+
+        """
+        try:
+            import pandas
+        except ImportError as import_error:
+            raise ImportError(
+                "pandas is required to convert a ColumnarResult to a DataFrame. "
+                "Install it with 'pip install pandas'.") from import_error
+
+        return pandas.DataFrame(dict(self), columns=list(self.keys()))
+
+    def to_arrow(self):
+        """Convert the result into a pyarrow Table.
+
+        Columns with nested values (e.g. custom_fields or index) are stored as
+        JSON strings, since their values are not consistently typed across
+        rows (a custom field value may be a string or a list of objects).
+
+        Returns:
+            pyarrow.Table: Result as an Arrow Table.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+
+        """
+        try:
+            import pyarrow
+        except ImportError as import_error:
+            raise ImportError(
+                "pyarrow is required to convert a ColumnarResult to an Arrow Table. "
+                "Install it with 'pip install pyarrow'.") from import_error
+
+        columns = {}
+        for name, values in self.items():
+            if any(isinstance(value, (dict, list)) for value in values):
+                values = [None if value is None else json.dumps(value, default=str) for value in values]
+            columns[name] = values
+        return pyarrow.table(columns)
+
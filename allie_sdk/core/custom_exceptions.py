@@ -1,5 +1,7 @@
 """Custom Exceptions to use across the SDK."""
 
+RESULT_FORMATS = ('objects', 'columnar', 'lazy')
+
 
 class UnsupportedQueryParams(Exception):
     pass
@@ -13,6 +15,10 @@ class InvalidPostBody(Exception):
     pass
 
 
+class UnreadableDirectory(Exception):
+    pass
+
+
 def validate_query_params(parameters: any, expected_type: any):
     """Validate the Query Parameters used in an Alation REST API Call.
 
@@ -27,6 +33,20 @@ def validate_query_params(parameters: any, expected_type: any):
             f"Please use '{'.'.join((expected_type.__module__, expected_type.__qualname__))}'")
 
 
+def validate_result_format(result_format: str, supported_formats: tuple = RESULT_FORMATS):
+    """Validate the requested result format of an Alation REST API Get Call.
+
+    Args:
+        result_format (str): Requested result format.
+        supported_formats (tuple): Result formats supported by the calling method.
+
+    """
+    if result_format not in supported_formats:
+        raise ValueError(
+            f"Unsupported result format '{result_format}'\n"
+            f"Please use one of: {', '.join(supported_formats)}")
+
+
 def validate_rest_payload(payload: list, expected_types: tuple):
     """Validate the Body used in an Alation REST API Call.
 
@@ -35,12 +55,15 @@ def validate_rest_payload(payload: list, expected_types: tuple):
         expected_types (tuple): Expected Dataclass Object Type.
 
     """
-    type_locations = ""
-    for object_type in expected_types:
-        type_locations += f"- {'.'.join((object_type.__module__, object_type.__qualname__))}\n"
+    expected_types = tuple(expected_types)
 
     for item in payload:
-            if not isinstance(item, tuple(expected_types)):
+            if not isinstance(item, expected_types):
+                # only build the error message when it is needed since this runs for every payload item
+                type_locations = ""
+                for object_type in expected_types:
+                    type_locations += f"- {'.'.join((object_type.__module__, object_type.__qualname__))}\n"
+
                 raise UnsupportedPostBody(
                     f"Unsupported type '{type(item)}' was passed for API Body Payload\n"
                     f"Please use:\n {type_locations}")
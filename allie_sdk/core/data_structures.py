@@ -3,9 +3,127 @@
 import inspect
 from dataclasses import dataclass, fields
 from datetime import datetime
+from functools import cache, lru_cache
+from typing import NamedTuple
+
+TIMESTAMP_FORMATS = ('%Y-%m-%dT%H:%M:%S.%fZ', '%Y-%m-%dT%H:%M:%S.%f%z')
+TIMESTAMP_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def parse_timestamp(s_date: str) -> datetime | None:
+    """Parse an Alation API timestamp.
+
+    Timestamps with a 'Z' suffix are returned as naive datetimes, timestamps
+    with a UTC offset as timezone aware datetimes. The common
+    'YYYY-MM-DDTHH:MM:SS.ffffff' forms are handled by datetime.fromisoformat,
+    anything else falls back to strptime. The API returns the same
+    timestamps over and over (e.g. bulk updated custom field values), so
+    results are memoized.
+
+    Args:
+        s_date (str): Timestamp returned by the Alation API.
+
+    Returns:
+        datetime | None: Parsed timestamp or None if the format is not supported.
+
+    """
+    if len(s_date) > 20 and s_date[10] == 'T' and s_date[19] == '.':
+        try:
+            # strptime's %f accepts at most 6 fractional digits
+            if s_date[-1] == 'Z' and len(s_date) <= 27:
+                return datetime.fromisoformat(s_date[:-1])
+            if s_date[-6] in '+-' and s_date[-3] == ':' and len(s_date) <= 32:
+                return datetime.fromisoformat(s_date)
+        except ValueError:
+            pass
+
+    for pattern in TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(s_date, pattern)
+        except ValueError:
+            pass
+
+    return None
+
+
+@cache
+def init_parameters(cls: type) -> frozenset:
+    """Return the names of the constructor parameters of a class.
+
+    The signature of a class never changes after its creation, so the
+    result is computed once per class and cached for all later calls.
+
+    Args:
+        cls (type): Class to inspect.
+
+    Returns:
+        frozenset: Names of the parameters accepted by the class constructor.
+
+    """
+    return frozenset(inspect.signature(cls).parameters)
+
+
+@cache
+def field_names(cls: type) -> tuple:
+    """Return the names of the dataclass fields of a class in definition order.
+
+    Args:
+        cls (type): Dataclass to inspect.
+
+    Returns:
+        tuple: Names of the dataclass fields.
+
+    """
+    return tuple(item.name for item in fields(cls))
+
+
+@cache
+def projection_record(cls: type, projection: tuple) -> type:
+    """Return a NamedTuple class holding a subset of the fields of a model.
+
+    The record classes are created once per model and field list.
+
+    Args:
+        cls (type): Dataclass the fields belong to.
+        projection (tuple): Field names in the order of the record.
+
+    Returns:
+        type: NamedTuple class named after the model, e.g. ColumnRecord.
+
+    Raises:
+        ValueError: If a field name is not a field of the model.
+
+    """
+    types = {item.name: item.type for item in fields(cls)}
+    unknown = [name for name in projection if name not in types]
+    if unknown:
+        raise ValueError(f"Unknown fields {unknown} for {cls.__name__}. Valid fields: {list(types)}.")
+    return NamedTuple(f'{cls.__name__}Record', [(name, types[name]) for name in projection])
+
+
+def non_null_fields_dict(obj) -> dict:
+    """Return the fields of a dataclass instance that are not None.
+
+    Unlike dataclasses.asdict, field values are neither copied nor
+    converted recursively, which keeps payload generation cheap for bulk
+    uploads with hundreds of thousands of items.
+
+    Args:
+        obj (any): Dataclass instance.
+
+    Returns:
+        dict: Field names mapped to their values.
+
+    """
+    return {
+        name: value for name in field_names(type(obj))
+        if (value := getattr(obj, name)) is not None
+    }
+
 
 # Base data class with method that we want to use across all other data classes
-@dataclass
+@dataclass(slots=True)
 class BaseClass:
     # noinspection PyArgumentList
     # This method makes sure that we can deal with API responses
@@ -15,20 +133,105 @@ class BaseClass:
     # By using method you can handle this exception gracefully. 
     @classmethod
     def from_api_response(cls, body_params: dict):
+        parameters = init_parameters(cls)
         return cls(**{
             k: v for k, v in body_params.items()
-            if k in inspect.signature(cls).parameters
+            if k in parameters
         })
 
     @staticmethod
     def convert_timestamp(s_date: str) -> datetime:
-        tz_formats = ['%Y-%m-%dT%H:%M:%S.%fZ', '%Y-%m-%dT%H:%M:%S.%f%z']
+        if not isinstance(s_date, str):
+            return None
+        return parse_timestamp(s_date)
+
 
-        for pattern in tz_formats:
+class LazyModel:
+    """Read-only proxy that keeps an API response as a raw dict.
+
+    Attributes are parsed by the wrapped model class only when they are
+    accessed and the parsed value is cached, so reading `id` or `key` does
+    not pay for converting nested custom fields or timestamps.
+
+    """
+    __slots__ = ('_model_class', '_record', '_values')
+
+    def __init__(self, model_class: type, record: dict):
+        """Creates an instance of the LazyModel object.
+
+        Args:
+            model_class (type): BaseClass subclass the record is parsed into.
+            record (dict): API response dict.
+
+        """
+        self._model_class = model_class
+        self._record = record
+        self._values = {}
+
+    def __getattr__(self, name: str):
+        if name.startswith('_') or name not in init_parameters(self._model_class):
+            # _model_class is not set yet while copy or pickle build a new instance, so it must not
+            # be looked up through __getattr__ again
             try:
-                return datetime.strptime(s_date, pattern)
-            except:
-                pass
+                class_name = object.__getattribute__(self, '_model_class').__name__
+            except AttributeError:
+                class_name = type(self).__name__
+            raise AttributeError(f"'{class_name}' object has no attribute '{name}'")
+
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+
+        value = self._record.get(name)
+        if name in self._record and isinstance(value, (str, list, dict)):
+            # let the model run its own conversion (timestamps, nested objects) for this field only
+            value = getattr(self._model_class.from_api_response({name: value}), name)
+        elif name not in self._record:
+            value = getattr(self._model_class.from_api_response({}), name)
+
+        self._values[name] = value
+        return value
+
+    def __reduce__(self):
+        return LazyModel, (self._model_class, self._record)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyModel):
+            other = other.to_model()
+        return self.to_model() == other
+
+    def __repr__(self) -> str:
+        return f'LazyModel({self._model_class.__name__}, {self._record!r})'
+
+    @property
+    def model_class(self) -> type:
+        """Return the model class the record is parsed into.
+
+        Returns:
+            type: Model class.
+
+        """
+        return self._model_class
+
+    @property
+    def raw(self) -> dict:
+        """Return the unparsed API response dict.
+
+        Returns:
+            dict: API response dict.
+
+        """
+        return self._record
+
+    def to_model(self):
+        """Parse the complete record into the model class.
+
+        Returns:
+            BaseClass: Fully parsed model object.
+
+        """
+        return self._model_class.from_api_response(self._record)
 
 
 @dataclass
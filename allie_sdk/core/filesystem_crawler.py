@@ -0,0 +1,294 @@
+"""Crawl File Systems for the Alation Virtual File System Bulk Metadata API."""
+
+import json
+import logging
+import os
+import posixpath
+import sqlite3
+import stat
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Callable, Iterator
+
+from .custom_exceptions import UnreadableDirectory
+from ..models.virtual_filesystem_model import VirtualFileSystemItem
+
+try:
+    import grp
+    import pwd
+except ImportError:  # Windows
+    grp = None
+    pwd = None
+
+LOGGER = logging.getLogger('allie_sdk_logger')
+
+VFS_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+@dataclass
+class CrawlProgress:
+    directories: int = field(default=0)
+    files: int = field(default=0)
+    reused_directories: int = field(default=0)
+    failed_directories: int = field(default=0)
+
+
+@lru_cache(maxsize=None)
+def _owner_name(uid: int) -> str:
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+@lru_cache(maxsize=None)
+def _group_name(gid: int) -> str:
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
+
+def _format_timestamp(timestamp: float) -> str | None:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime(VFS_TIMESTAMP_FORMAT)
+
+
+class FileSystemCrawler:
+    """Walk a directory tree and yield VirtualFileSystemItem objects.
+
+    Directories are listed by a pool of worker threads with os.scandir (or
+    by an fsspec-like filesystem object) while the items are yielded one
+    directory listing at a time, so the items can be streamed straight into
+    AlationVirtualFileSystem.post_metadata(..., stream=True). Every directory
+    is yielded before its contents. The crawl root becomes '/' in Alation.
+
+    An optional mtime index (SQLite file) stores the listing of every local
+    directory. Directories whose modification time did not change since the
+    last crawl are not scanned again and their stored listing is reused.
+    Note that a directory's modification time only changes when entries are
+    added, removed or renamed, so size and timestamp changes of files in an
+    otherwise unchanged directory are not detected. Delete the index file to
+    force a full scan.
+
+    A directory that cannot be listed aborts the crawl, since an upload without
+    its subtree would remove the subtree from Alation. Set skip_unreadable to
+    leave such directories out instead.
+
+    """
+
+    def __init__(
+            self,
+            root_path: str | os.PathLike,
+            workers: int = 8,
+            mtime_index_path: str | os.PathLike = None,
+            progress_callback: Callable[[CrawlProgress], None] = None,
+            progress_interval: int = 10000,
+            filesystem=None,
+            skip_unreadable: bool = False
+    ):
+        """Creates an instance of the FileSystemCrawler object.
+
+        Args:
+            root_path (str | os.PathLike): Directory to crawl.
+            workers (int): Number of directories listed concurrently.
+            mtime_index_path (str | os.PathLike): SQLite file used to skip unchanged directories.
+                Only supported for local file systems.
+            progress_callback (Callable[[CrawlProgress], None]): Called every progress_interval items
+                and once the crawl is finished.
+            progress_interval (int): Number of items between two progress_callback calls.
+            filesystem (any): fsspec-like filesystem object implementing ls(path, detail=True).
+                Local directories are crawled with os.scandir if not set.
+            skip_unreadable (bool): Log and leave out directories that cannot be listed instead of
+                aborting the crawl.
+
+        Raises:
+            ValueError: If an mtime index is used with a filesystem object.
+
+        """
+        if filesystem is not None and mtime_index_path is not None:
+            raise ValueError('mtime_index_path is only supported for local file systems.')
+
+        self.root_path = os.fspath(root_path) if filesystem is None else str(root_path)
+        self.workers = workers
+        self.mtime_index_path = mtime_index_path
+        self.progress_callback = progress_callback
+        self.progress_interval = progress_interval
+        self.filesystem = filesystem
+        self.skip_unreadable = skip_unreadable
+        self.progress = CrawlProgress()
+
+    def crawl(self) -> Iterator[VirtualFileSystemItem]:
+        """Walk the directory tree.
+
+        Returns:
+            Iterator[VirtualFileSystemItem]: Directories and files below the crawl root.
+
+        Raises:
+            UnreadableDirectory: If a directory cannot be listed and skip_unreadable is not set.
+
+        """
+        self.progress = CrawlProgress()
+        index = self._open_index() if self.mtime_index_path else None
+        # (local path, virtual path) of the directories still to be listed
+        pending_directories = deque([(self.root_path, '/')])
+        listings = deque()
+        next_report = self.progress_interval
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                while pending_directories or listings:
+                    # keep a bounded number of listings in flight, in discovery order
+                    while pending_directories and len(listings) < 2 * self.workers:
+                        local_path, virtual_path = pending_directories.popleft()
+                        cached = self._read_index(index, virtual_path) if index else None
+                        listings.append(
+                            (local_path, virtual_path, executor.submit(self._list_directory, local_path, cached))
+                        )
+
+                    local_path, virtual_path, listing = listings.popleft()
+                    entries, mtime_ns, reused = listing.result()
+                    if entries is None:
+                        self.progress.failed_directories += 1
+                        continue
+
+                    self.progress.directories += 1
+                    if reused:
+                        self.progress.reused_directories += 1
+                    elif index:
+                        self._write_index(index, virtual_path, mtime_ns, entries)
+
+                    for entry in entries:
+                        yield VirtualFileSystemItem(path=virtual_path, **entry)
+
+                        if entry['is_directory']:
+                            pending_directories.append((
+                                self._join_local(local_path, entry['name']),
+                                posixpath.join(virtual_path, entry['name'])
+                            ))
+                        else:
+                            self.progress.files += 1
+
+                        if self.progress.directories + self.progress.files >= next_report:
+                            next_report += self.progress_interval
+                            self._report_progress()
+
+            if index:
+                self._finish_index(index)
+            self._report_progress()
+        finally:
+            if index:
+                index.close()
+
+    def _report_progress(self):
+        LOGGER.info(
+            'Crawled %s directories (%s unchanged) and %s files.',
+            self.progress.directories, self.progress.reused_directories, self.progress.files
+        )
+        if self.progress_callback:
+            self.progress_callback(self.progress)
+
+    def _join_local(self, local_path: str, name: str) -> str:
+        if self.filesystem is not None:
+            return f"{local_path.rstrip('/')}/{name}"
+        return os.path.join(local_path, name)
+
+    def _list_directory(self, local_path: str, cached: tuple | None) -> tuple:
+        """List a directory (runs in a worker thread).
+
+        Args:
+            local_path (str): Directory to list.
+            cached (tuple | None): (mtime_ns, entries) stored in the mtime index.
+
+        Returns:
+            tuple: (entries, mtime_ns, reused). entries is None if the directory cannot be read.
+
+        Raises:
+            UnreadableDirectory: If the directory cannot be read and skip_unreadable is not set.
+
+        """
+        try:
+            if self.filesystem is not None:
+                return self._list_fsspec_directory(local_path), None, False
+
+            mtime_ns = os.stat(local_path).st_mtime_ns
+            if cached and cached[0] == mtime_ns:
+                return cached[1], mtime_ns, True
+
+            with os.scandir(local_path) as scanner:
+                entries = [self._entry_to_dict(entry) for entry in scanner]
+            entries.sort(key=lambda entry: entry['name'])
+            return entries, mtime_ns, False
+        except OSError as os_error:
+            if not self.skip_unreadable:
+                raise UnreadableDirectory(f'Unable to list directory {local_path}: {os_error}') from os_error
+            LOGGER.warning('Unable to list directory %s: %s', local_path, os_error)
+            return None, None, False
+
+    @staticmethod
+    def _entry_to_dict(entry: os.DirEntry) -> dict:
+        # symlinks are not followed to avoid cycles, they are listed as files
+        entry_stat = entry.stat(follow_symlinks=False)
+        is_directory = stat.S_ISDIR(entry_stat.st_mode)
+        return {
+            'name': entry.name,
+            'is_directory': is_directory,
+            'size_in_bytes': None if is_directory else entry_stat.st_size,
+            'ts_last_modified': _format_timestamp(entry_stat.st_mtime),
+            'ts_last_accessed': _format_timestamp(entry_stat.st_atime),
+            'owner': _owner_name(entry_stat.st_uid) if pwd else None,
+            'group': _group_name(entry_stat.st_gid) if grp else None,
+            'permission_bits': int(format(stat.S_IMODE(entry_stat.st_mode) & 0o777, 'o')),
+        }
+
+    def _list_fsspec_directory(self, local_path: str) -> list[dict]:
+        entries = []
+        for detail in self.filesystem.ls(local_path, detail=True):
+            name = posixpath.basename(detail['name'].rstrip('/'))
+            is_directory = detail.get('type') == 'directory'
+            modified = detail.get('mtime', detail.get('LastModified'))
+            if isinstance(modified, datetime):
+                modified = modified.timestamp()
+            entries.append({
+                'name': name,
+                'is_directory': is_directory,
+                'size_in_bytes': None if is_directory else detail.get('size'),
+                'ts_last_modified': _format_timestamp(modified),
+            })
+        entries.sort(key=lambda entry: entry['name'])
+        return entries
+
+    def _open_index(self) -> sqlite3.Connection:
+        # the crawl generator may be resumed from another thread than the one that started it
+        index = sqlite3.connect(self.mtime_index_path, check_same_thread=False)
+        index.execute(
+            'CREATE TABLE IF NOT EXISTS listings ('
+            'path TEXT PRIMARY KEY, mtime_ns INTEGER, entries TEXT, seen INTEGER)'
+        )
+        index.execute('UPDATE listings SET seen = 0')
+        return index
+
+    @staticmethod
+    def _read_index(index: sqlite3.Connection, virtual_path: str) -> tuple | None:
+        row = index.execute('SELECT mtime_ns, entries FROM listings WHERE path = ?', (virtual_path,)).fetchone()
+        index.execute('UPDATE listings SET seen = 1 WHERE path = ?', (virtual_path,))
+        if row:
+            return row[0], json.loads(row[1])
+        return None
+
+    @staticmethod
+    def _write_index(index: sqlite3.Connection, virtual_path: str, mtime_ns: int, entries: list):
+        index.execute(
+            'INSERT OR REPLACE INTO listings (path, mtime_ns, entries, seen) VALUES (?, ?, ?, 1)',
+            (virtual_path, mtime_ns, json.dumps(entries))
+        )
+
+    @staticmethod
+    def _finish_index(index: sqlite3.Connection):
+        # drop the listings of directories that no longer exist
+        index.execute('DELETE FROM listings WHERE seen = 0')
+        index.commit()
@@ -0,0 +1,174 @@
+"""Stream JSON Lines Payloads for the Alation Bulk Metadata APIs."""
+
+import json
+import multiprocessing
+import os
+import sys
+import zlib
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from typing import IO, Iterable, Iterator
+
+JSONL_CHUNK_SIZE = 1024 * 1024
+JSONL_SHARD_SIZE = 10000
+
+
+def iter_jsonl_chunks(
+        payloads: Iterable[dict],
+        chunk_size: int = JSONL_CHUNK_SIZE,
+        leading_newline: bool = False
+) -> Iterator[bytes]:
+    """Serialize payload dicts to JSON Lines and yield them as UTF-8 encoded chunks.
+
+    Only one chunk is held in memory at a time, so the generator can be passed
+    directly as a request body and is sent with chunked transfer encoding.
+
+    Args:
+        payloads (Iterable[dict]): Payload dicts, one per JSON line.
+        chunk_size (int): Approximate size of the yielded chunks in bytes.
+        leading_newline (bool): Start the body with a line feed (forces a non-empty body).
+
+    Returns:
+        Iterator[bytes]: JSON Lines chunks.
+
+    """
+    buffer = [b'\n'] if leading_newline else []
+    buffered = len(buffer)
+    separator = b''
+
+    for payload in payloads:
+        line = separator + json.dumps(payload).encode('utf-8')
+        separator = b'\n'
+        buffer.append(line)
+        buffered += len(line)
+
+        if buffered >= chunk_size:
+            yield b''.join(buffer)
+            buffer = []
+            buffered = 0
+
+    if buffer:
+        yield b''.join(buffer)
+
+
+def _serialize_shard(items: list) -> bytes:
+    """Serialize the POST payloads of a shard of items to JSON Lines.
+
+    Module level function so it can be pickled and run in a worker process.
+
+    Args:
+        items (list): Items implementing generate_api_post_payload.
+
+    Returns:
+        bytes: UTF-8 encoded JSON Lines of the shard.
+
+    """
+    return '\n'.join(json.dumps(item.generate_api_post_payload()) for item in items).encode('utf-8')
+
+
+def _create_executor(workers: int) -> Executor:
+    """Create the pool used to serialize shards in parallel.
+
+    Threads run the serialization in parallel on free-threaded Python builds
+    and avoid pickling the items, otherwise separate processes are used. The
+    processes are not forked from the (possibly multi-threaded) caller, since
+    forking a process with running threads can deadlock.
+
+    Args:
+        workers (int): Number of workers.
+
+    Returns:
+        Executor: Thread or process pool.
+
+    """
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    if gil_enabled:
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(start_method))
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def iter_jsonl_chunks_parallel(
+        items: Iterable,
+        workers: int = None,
+        shard_size: int = JSONL_SHARD_SIZE,
+        leading_newline: bool = False
+) -> Iterator[bytes]:
+    """Serialize items to JSON Lines in parallel and yield the chunks in the original order.
+
+    The items are split into shards of shard_size items which are serialized
+    by a pool of workers. At most two shards per worker are in flight at a
+    time, so the items can be a generator and memory use stays bounded.
+
+    Args:
+        items (Iterable): Items implementing generate_api_post_payload. They must be picklable.
+        workers (int): Number of workers, defaults to the number of CPUs.
+        shard_size (int): Number of items serialized per task.
+        leading_newline (bool): Start the body with a line feed (forces a non-empty body).
+
+    Returns:
+        Iterator[bytes]: JSON Lines chunks, one per shard.
+
+    """
+    if leading_newline:
+        yield b'\n'
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = 2 * workers
+    items = iter(items)
+    separator = b''
+
+    with _create_executor(workers) as executor:
+        pending = deque()
+
+        while True:
+            while len(pending) < max_pending:
+                shard = list(islice(items, shard_size))
+                if not shard:
+                    break
+                pending.append(executor.submit(_serialize_shard, shard))
+
+            if not pending:
+                break
+
+            yield separator + pending.popleft().result()
+            separator = b'\n'
+
+
+def iter_file_chunks(file_obj: IO, chunk_size: int = JSONL_CHUNK_SIZE) -> Iterator[bytes]:
+    """Read a file object in chunks and yield them as UTF-8 encoded bytes.
+
+    Args:
+        file_obj (IO): Binary or text file object opened for reading.
+        chunk_size (int): Number of bytes (or characters for text files) read at a time.
+
+    Returns:
+        Iterator[bytes]: File content chunks.
+
+    """
+    while True:
+        chunk = file_obj.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+
+def iter_gzip_chunks(chunks: Iterable[bytes], compresslevel: int = 6) -> Iterator[bytes]:
+    """Gzip compress a stream of chunks on the fly.
+
+    Args:
+        chunks (Iterable[bytes]): Uncompressed chunks.
+        compresslevel (int): zlib compression level (1-9).
+
+    Returns:
+        Iterator[bytes]: Gzip compressed chunks.
+
+    """
+    # wbits=31 writes the gzip header and trailer
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
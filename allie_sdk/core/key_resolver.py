@@ -0,0 +1,272 @@
+"""Resolve Alation RDBMS Object Keys to Ids."""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from ..methods.rdbms import RDBMS_SCAN_TYPES, AlationRDBMS
+from .request_handler import MAX_URL_LENGTH
+
+LOGGER = logging.getLogger('allie_sdk_logger')
+
+RESOLVER_OBJECT_TYPES = ('schema', 'table', 'column')
+# only request the fields needed for the key -> id map, keeps the pages tiny
+RESOLVER_VALUES = 'id,key'
+BULK_LOAD_THRESHOLD = 1000
+
+
+class LRUCache:
+    """Thread-safe least recently used cache with optional time to live."""
+
+    def __init__(self, max_size: int, ttl: float = None):
+        """Creates an instance of the LRUCache object.
+
+        Args:
+            max_size (int): Maximum number of entries. The least recently used entry is evicted first.
+            ttl (float): Seconds after which an entry expires. Entries do not expire if not set.
+
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return a cached value and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Cache a value, evicting the least recently used entry if the cache is full."""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """Remove a cached value and return it."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self):
+        """Remove all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def split_key(key: str) -> list[str]:
+    """Split an object key into its parts, e.g. '7.public."a.b"' -> ['7', 'public', 'a.b'].
+
+    Args:
+        key (str): RDBMS object key. Parts containing dots are double-quoted.
+
+    Returns:
+        list[str]: Key parts with the quotes removed.
+
+    """
+    parts = []
+    part = []
+    quoted = False
+    position = 0
+    while position < len(key):
+        character = key[position]
+        if character == '"':
+            if quoted and key[position + 1:position + 2] == '"':
+                # escaped quote inside a quoted part
+                part.append('"')
+                position += 1
+            else:
+                quoted = not quoted
+        elif character == '.' and not quoted:
+            parts.append(''.join(part))
+            part = []
+        else:
+            part.append(character)
+        position += 1
+    parts.append(''.join(part))
+    return parts
+
+
+class KeyResolver:
+    """Resolve RDBMS object keys to ids (and back) with cached lookups.
+
+    Keys are resolved in batches: the keys of one data source are looked up
+    with 'name' filters, split into chunks that keep the request URLs below
+    max_url_length (see RequestHandler.get_many_by_id), only requesting the id and key of the
+    matching objects. Once a data source has bulk_load_threshold unresolved
+    keys in a single call, the complete key -> id map of the data source is
+    loaded instead. Complete maps are kept for the max_datasources most
+    recently used data sources, single lookups for the max_keys most
+    recently used keys, both for ttl seconds.
+
+    """
+
+    def __init__(
+            self,
+            rdbms: AlationRDBMS,
+            ttl: float = 3600,
+            max_datasources: int = 8,
+            max_keys: int = 100000,
+            max_url_length: int = MAX_URL_LENGTH,
+            bulk_load_threshold: int = BULK_LOAD_THRESHOLD
+    ):
+        """Creates an instance of the KeyResolver object.
+
+        Args:
+            rdbms (AlationRDBMS): RDBMS methods used to look up the objects, e.g. Alation(...).rdbms.
+            ttl (float): Seconds a resolved id is cached. Cached ids never expire if None.
+            max_datasources (int): Number of complete data source maps kept in memory.
+            max_keys (int): Number of single key lookups kept in memory.
+            max_url_length (int): Maximum length of a lookup request URL, the names or ids are
+                split into chunks accordingly.
+            bulk_load_threshold (int): Number of unresolved keys of a data source from which on
+                the complete map of the data source is loaded.
+
+        """
+        self.rdbms = rdbms
+        self.max_url_length = max_url_length
+        self.bulk_load_threshold = bulk_load_threshold
+        self._maps = LRUCache(max_datasources, ttl)
+        self._keys = LRUCache(max_keys, ttl)
+
+    def load(self, otype: str, ds_id: int) -> dict[str, int]:
+        """Load the complete key -> id map of a data source.
+
+        Args:
+            otype (str): 'schema', 'table' or 'column'.
+            ds_id (int): Data source id.
+
+        Returns:
+            dict[str, int]: Key -> id map.
+
+        """
+        url = self._endpoint(otype)
+        records = self.rdbms.get(url, query_params={'ds_id': ds_id, 'values': RESOLVER_VALUES}) or []
+        key_map = {record['key']: record['id'] for record in records}
+        self._maps.put((otype, ds_id), key_map)
+        LOGGER.debug('Loaded %s %s keys of data source %s.', len(key_map), otype, ds_id)
+        return key_map
+
+    def resolve(self, otype: str, keys: list[str]) -> dict[str, int]:
+        """Resolve object keys to ids.
+
+        Args:
+            otype (str): 'schema', 'table' or 'column'.
+            keys (list[str]): Object keys, e.g. '7.sales.public.orders.amount'. Keys of several
+                data sources can be mixed.
+
+        Returns:
+            dict[str, int]: Key -> id of every key found. Unknown keys are left out.
+
+        """
+        url = self._endpoint(otype)
+        resolved = {}
+        unresolved = {}
+
+        for key in dict.fromkeys(keys):
+            ds_id = int(split_key(key)[0])
+            key_map = self._maps.get((otype, ds_id))
+            object_id = key_map.get(key) if key_map is not None else self._keys.get((otype, key))
+            if object_id is not None:
+                resolved[key] = object_id
+            elif key_map is None:
+                # a key missing from a complete map does not exist, no need to ask the API
+                unresolved.setdefault(ds_id, []).append(key)
+
+        for ds_id, ds_keys in unresolved.items():
+            if len(ds_keys) >= self.bulk_load_threshold:
+                key_map = self.load(otype, ds_id)
+                resolved.update((key, key_map[key]) for key in ds_keys if key in key_map)
+            else:
+                resolved.update(self._lookup(otype, url, ds_id, ds_keys))
+
+        return resolved
+
+    def resolve_one(self, otype: str, key: str) -> int | None:
+        """Resolve a single object key to its id.
+
+        Args:
+            otype (str): 'schema', 'table' or 'column'.
+            key (str): Object key.
+
+        Returns:
+            int | None: Object id or None if the key does not exist.
+
+        """
+        return self.resolve(otype, [key]).get(key)
+
+    def resolve_ids(self, otype: str, ids: list[int]) -> dict[int, str]:
+        """Resolve object ids to keys with 'id' filters.
+
+        Args:
+            otype (str): 'schema', 'table' or 'column'.
+            ids (list[int]): Object ids.
+
+        Returns:
+            dict[int, str]: Id -> key of every id found. The resolved keys are cached for resolve.
+
+        """
+        url = self._endpoint(otype)
+        keys = {}
+        params = {'id': ids, 'values': RESOLVER_VALUES}
+        for record in self.rdbms.get_many_by_id(url, params, max_url_length=self.max_url_length):
+            keys[record['id']] = record['key']
+            self._keys.put((otype, record['key']), record['id'])
+        return keys
+
+    def invalidate(self, otype: str = None, ds_id: int = None):
+        """Drop cached ids, e.g. after objects were deleted or renamed.
+
+        Args:
+            otype (str): Only drop the complete map of this object type (requires ds_id).
+            ds_id (int): Only drop the complete map of this data source (requires otype).
+                All cached ids are dropped if otype or ds_id is not set.
+
+        """
+        if otype is not None and ds_id is not None:
+            self._maps.pop((otype, ds_id))
+        else:
+            self._maps.clear()
+            self._keys.clear()
+
+    def _lookup(self, otype: str, url: str, ds_id: int, keys: list[str]) -> dict[str, int]:
+        # objects are filtered by name, other objects with the same name are ignored by matching the key
+        wanted = set(keys)
+        names = list(dict.fromkeys(self._object_name(otype, key) for key in keys))
+        resolved = {}
+        params = {'ds_id': ds_id, 'name': names, 'values': RESOLVER_VALUES}
+        records = self.rdbms.get_many_by_id(url, params, chunk_field='name', max_url_length=self.max_url_length)
+        for record in records:
+            if record['key'] in wanted:
+                resolved[record['key']] = record['id']
+                self._keys.put((otype, record['key']), record['id'])
+        return resolved
+
+    @staticmethod
+    def _object_name(otype: str, key: str) -> str:
+        parts = split_key(key)
+        if otype == 'schema':
+            # schema names may contain dots (e.g. 'database.schema'), everything after the ds_id
+            return '.'.join(parts[1:])
+        return parts[-1]
+
+    @staticmethod
+    def _endpoint(otype: str) -> str:
+        if otype not in RESOLVER_OBJECT_TYPES:
+            raise ValueError(f"Unsupported object type '{otype}'. Supported types: {RESOLVER_OBJECT_TYPES}.")
+        return RDBMS_SCAN_TYPES[otype][0]
@@ -0,0 +1,193 @@
+"""Adapt the Page Size of Paginated GET Requests per Endpoint."""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from dataclasses import asdict, dataclass, field
+from urllib.parse import urlparse
+
+LOGGER = logging.getLogger('allie_sdk_logger')
+
+MIN_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 10000
+TARGET_PAGE_BYTES = 2 * 1024 * 1024
+TARGET_PAGE_SECONDS = 2.0
+# numeric path segments (object ids) are replaced so that e.g. /folder/1/ and /folder/2/ share a profile
+ID_SEGMENT_PATTERN = re.compile(r'/\d+(?=/|$)')
+
+
+@dataclass
+class EndpointProfile:
+    page_size: int
+    server_max: int = field(default=None)
+    pages: int = field(default=0)
+
+
+class PageSizeTuner:
+    """Learn the page size of paginated GET requests per endpoint.
+
+    Every full page is measured (response size and duration) and the page size
+    of the endpoint is moved towards the number of objects fitting into
+    target_page_bytes and target_page_seconds, whichever is smaller. The page
+    size at most doubles or halves per page and always stays between
+    min_page_size and max_page_size. If the server returns fewer objects than
+    requested while announcing a next page, the number of objects returned is
+    remembered as the server limit of the endpoint.
+
+    The learned page sizes can be stored in a small JSON profile and are
+    loaded again when the tuner is created with the same profile_path.
+
+    """
+
+    def __init__(
+            self,
+            initial_page_size: int = 1000,
+            min_page_size: int = MIN_PAGE_SIZE,
+            max_page_size: int = MAX_PAGE_SIZE,
+            target_page_bytes: int = TARGET_PAGE_BYTES,
+            target_page_seconds: float = TARGET_PAGE_SECONDS,
+            profile_path: str | os.PathLike = None
+    ):
+        """Creates an instance of the PageSizeTuner object.
+
+        Args:
+            initial_page_size (int): Page size of endpoints without a profile.
+            min_page_size (int): Smallest page size used.
+            max_page_size (int): Largest page size used.
+            target_page_bytes (int): Preferred response size of a page in bytes.
+            target_page_seconds (float): Preferred duration of a page request in seconds.
+            profile_path (str | os.PathLike): JSON file the learned page sizes are loaded from and saved to.
+
+        """
+        self.initial_page_size = initial_page_size
+        self.min_page_size = min_page_size
+        self.max_page_size = max_page_size
+        self.target_page_bytes = target_page_bytes
+        self.target_page_seconds = target_page_seconds
+        self.profile_path = profile_path
+        self.profiles: dict[str, EndpointProfile] = {}
+        self._lock = threading.Lock()
+        # set when a profile changed since the last save
+        self._changed = False
+
+        if profile_path and os.path.exists(profile_path):
+            self.load()
+
+    @staticmethod
+    def endpoint_key(url: str) -> str:
+        """Return the profile key of a request URL.
+
+        Args:
+            url (str): Request URL or path, with or without query string.
+
+        Returns:
+            str: URL path with numeric segments replaced by '{id}'.
+
+        """
+        path = urlparse(url).path or '/'
+        return ID_SEGMENT_PATTERN.sub('/{id}', path)
+
+    def page_size(self, url: str) -> int:
+        """Return the page size to request from an endpoint.
+
+        Args:
+            url (str): Request URL or path.
+
+        Returns:
+            int: Page size.
+
+        """
+        profile = self.profiles.get(self.endpoint_key(url))
+        if profile is None:
+            return self._clamp(self.initial_page_size)
+        return profile.page_size
+
+    def record(self, url: str, limit: int, objects: int, size_in_bytes: int, seconds: float,
+               has_next_page: bool) -> int:
+        """Measure a page and update the page size of the endpoint.
+
+        Args:
+            url (str): Request URL or path.
+            limit (int): Page size requested.
+            objects (int): Number of objects returned.
+            size_in_bytes (int): Size of the response body.
+            seconds (float): Duration of the request.
+            has_next_page (bool): Whether the server announced a next page.
+
+        Returns:
+            int: Page size to request next.
+
+        """
+        key = self.endpoint_key(url)
+        with self._lock:
+            profile = self.profiles.get(key)
+            if profile is None:
+                profile = self.profiles[key] = EndpointProfile(page_size=self._clamp(self.initial_page_size))
+                self._changed = True
+
+            if not has_next_page or objects == 0:
+                # the last page is not full, its size tells nothing about the objects per page
+                return profile.page_size
+
+            if objects < limit and profile.server_max != objects:
+                profile.server_max = objects
+                self._changed = True
+
+            per_object_bytes = size_in_bytes / objects
+            per_object_seconds = seconds / objects
+            candidates = [self.target_page_bytes / per_object_bytes] if per_object_bytes else []
+            if per_object_seconds:
+                candidates.append(self.target_page_seconds / per_object_seconds)
+            target = int(min(candidates)) if candidates else self.max_page_size
+
+            # move at most by a factor of two of the current page size to smooth out outliers
+            page_size = self._clamp(
+                max(profile.page_size // 2, min(profile.page_size * 2, target)), profile.server_max)
+            if page_size != profile.page_size:
+                LOGGER.debug('Page size of %s changed from %s to %s.', key, profile.page_size, page_size)
+                self._changed = True
+            profile.page_size = page_size
+            profile.pages += 1
+            return page_size
+
+    def load(self):
+        """Load the learned page sizes from the profile file."""
+        with open(self.profile_path, 'r', encoding='utf-8') as profile_file:
+            try:
+                stored = json.load(profile_file)
+            except json.JSONDecodeError:
+                LOGGER.warning('Ignoring the invalid page size profile %s.', self.profile_path)
+                return
+
+        with self._lock:
+            self.profiles = {
+                key: EndpointProfile(**values) for key, values in stored.items()
+            }
+
+    def save(self):
+        """Write the learned page sizes to the profile file if a page size changed since the last save.
+
+        Safe to call from several threads, e.g. after every paginated request.
+        """
+        if not self.profile_path:
+            return
+
+        with self._lock:
+            if not self._changed:
+                return
+            stored = {key: asdict(profile) for key, profile in self.profiles.items()}
+
+            # replace the file in one step so that concurrent readers never see a partial profile
+            directory = os.path.dirname(os.path.abspath(self.profile_path))
+            with tempfile.NamedTemporaryFile(
+                    'w', encoding='utf-8', dir=directory, suffix='.tmp', delete=False) as profile_file:
+                json.dump(stored, profile_file, indent=2, sort_keys=True)
+            os.replace(profile_file.name, self.profile_path)
+            self._changed = False
+
+    def _clamp(self, page_size: int, server_max: int = None) -> int:
+        upper = self.max_page_size if server_max is None else min(self.max_page_size, server_max)
+        return max(1, min(max(page_size, self.min_page_size), upper))
@@ -0,0 +1,191 @@
+"""Compare Desired Alation RDBMS Objects with their Current State."""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field, fields, replace
+
+from ..models.rdbms_model import (
+    SchemaItem, SchemaPatchItem, TableItem, TablePatchItem, ColumnItem, ColumnPatchItem
+)
+
+# desired item class -> (object type, patch item class)
+RDBMS_DIFF_TYPES = {
+    SchemaItem: ('schema', SchemaPatchItem),
+    TableItem: ('table', TablePatchItem),
+    ColumnItem: ('column', ColumnPatchItem),
+}
+
+LOGGER = logging.getLogger('allie_sdk_logger')
+
+
+@dataclass
+class RDBMSDiff:
+    post: list = field(default_factory=list)
+    patch: list = field(default_factory=list)
+    unchanged: int = field(default=0)
+    jobs: list = field(default_factory=list)
+
+
+def _normalize(value):
+    """Normalize a payload value so that API responses and POST payloads compare equal."""
+    if isinstance(value, dict):
+        return {
+            key: item.lower() if key == 'otype' and isinstance(item, str) else _normalize(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def content_hash(payload: dict) -> str:
+    """Return a stable hash of a payload.
+
+    Args:
+        payload (dict): POST payload or API response fields.
+
+    Returns:
+        str: SHA-256 hex digest of the normalized payload.
+
+    """
+    serialized = json.dumps(_normalize(payload), sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+def _comparable_fields(payload: dict) -> dict:
+    comparable = {key: value for key, value in payload.items() if key not in ('key', 'custom_fields')}
+    for custom_field in payload.get('custom_fields') or []:
+        comparable[('custom_field', custom_field['field_id'])] = custom_field.get('value')
+    return comparable
+
+
+def _current_fields(record: dict, names) -> dict:
+    custom_fields = {custom_field['field_id']: custom_field.get('value')
+                     for custom_field in record.get('custom_fields') or []}
+    return {
+        name: custom_fields.get(name[1]) if isinstance(name, tuple) else record.get(name)
+        for name in names
+    }
+
+
+def _hashable(values: dict) -> dict:
+    # json keys must be strings, custom field keys are (marker, field_id) tuples
+    return {f'{name[0]}:{name[1]}' if isinstance(name, tuple) else name: value for name, value in values.items()}
+
+
+def diff_rdbms_items(desired: list, current: list[dict]) -> RDBMSDiff:
+    """Compare desired RDBMS items with the current objects and return the minimal changes.
+
+    Only the fields set on a desired item and returned in the current object are compared,
+    custom fields by field id.
+    Items without a current object are posted. Changed items are patched by id with
+    the changed fields only, or posted if a changed field cannot be patched (e.g. the
+    column_type of a column).
+
+    Args:
+        desired (list): SchemaItem, TableItem or ColumnItem objects of one type.
+        current (list[dict]): Current objects as returned by the API (e.g. AlationRDBMS.get or
+            CatalogMirror.get_records), matched to the desired items by key.
+
+    Returns:
+        RDBMSDiff: Items to post and patch items to patch.
+
+    """
+    current_by_key = {record['key']: record for record in current or []}
+    diff = RDBMSDiff()
+
+    for item in desired:
+        patch_class = RDBMS_DIFF_TYPES[type(item)][1]
+        record = current_by_key.get(item.key)
+        if record is None:
+            diff.post.append(item)
+            continue
+
+        # fields the API does not return (e.g. the owner of a table) cannot be compared, they are
+        # left out instead of being reported as changed on every run
+        wanted = {
+            name: value for name, value in _comparable_fields(item.generate_api_post_payload()).items()
+            if (('custom_fields' if isinstance(name, tuple) else name) in record)
+        }
+        existing = _current_fields(record, wanted)
+        if content_hash(_hashable(wanted)) == content_hash(_hashable(existing)):
+            diff.unchanged += 1
+            continue
+
+        changed = [name for name in wanted if _normalize(wanted[name]) != _normalize(existing[name])]
+        patchable = {patch_field.name for patch_field in fields(patch_class)}
+        if any(not isinstance(name, tuple) and name not in patchable for name in changed):
+            diff.post.append(item)
+            continue
+
+        patch_item = patch_class(id=record['id'], key=item.key)
+        changed_custom_fields = {name[1] for name in changed if isinstance(name, tuple)}
+        for name in changed:
+            if not isinstance(name, tuple):
+                setattr(patch_item, name, getattr(item, name))
+        if changed_custom_fields:
+            patch_item.custom_fields = [
+                custom_field for custom_field in item.custom_fields if custom_field.field_id in changed_custom_fields
+            ]
+        diff.patch.append(patch_item)
+
+    return diff
+
+
+def _is_set(value) -> bool:
+    # mirrors generate_api_patch_payload: booleans are sent unless None, other fields if truthy
+    if isinstance(value, bool):
+        return True
+    return bool(value)
+
+
+def coalesce_patch_items(items: list) -> list:
+    """Merge patch items that update the same object into one patch item per object.
+
+    Items are matched by id, or by key if they have no id (an item with both is matched
+    by either). Fields are merged in list order, a later item overwrites the fields it
+    sets and keeps the others. Custom fields are merged by field id the same way.
+
+    Args:
+        items (list): SchemaPatchItem, TablePatchItem or ColumnPatchItem objects.
+
+    Returns:
+        list: One patch item per object, in the order the objects first appear. The passed
+            items are not modified.
+
+    """
+    merged = []
+    by_id = {}
+    by_key = {}
+
+    for item in items:
+        item_id = getattr(item, 'id', None)
+        position = by_id.get(item_id) if item_id is not None else None
+        if position is None and item.key is not None:
+            position = by_key.get(item.key)
+
+        if position is None:
+            position = len(merged)
+            merged.append(replace(item, custom_fields=list(item.custom_fields) if item.custom_fields else None))
+        else:
+            target = merged[position]
+            for item_field in fields(item):
+                value = getattr(item, item_field.name)
+                if item_field.name == 'custom_fields':
+                    if value:
+                        custom_fields = {custom_field.field_id: custom_field for custom_field in target.custom_fields or []}
+                        custom_fields.update((custom_field.field_id, custom_field) for custom_field in value)
+                        target.custom_fields = list(custom_fields.values())
+                elif _is_set(value):
+                    setattr(target, item_field.name, value)
+
+        target = merged[position]
+        if getattr(target, 'id', None) is not None:
+            by_id[target.id] = position
+        if target.key is not None:
+            by_key[target.key] = position
+
+    if len(merged) < len(items):
+        LOGGER.debug('Coalesced %s patch items into %s.', len(items), len(merged))
+    return merged
@@ -0,0 +1,191 @@
+"""Schedule Dependent Alation RDBMS Load Batches as a DAG."""
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable
+
+LOGGER = logging.getLogger('allie_sdk_logger')
+
+LOAD_STAGES = ('schema', 'table', 'column', 'child_column')
+
+
+@dataclass
+class LoadBatch:
+    stage: str
+    schema_key: str
+    items: list
+    depends_on: list = field(default_factory=list)
+
+
+@dataclass
+class RDBMSLoadResult:
+    jobs: list = field(default_factory=list)
+    failed_batches: list = field(default_factory=list)
+    skipped_batches: list = field(default_factory=list)
+
+    @property
+    def successful(self) -> bool:
+        return not self.failed_batches and not self.skipped_batches
+
+
+def parent_key(key: str, parent_keys: list[str]) -> str | None:
+    """Return the longest parent key that the key starts with.
+
+    Args:
+        key (str): Object key, e.g. '7.sales.public.orders'.
+        parent_keys (list[str]): Candidate parent keys sorted by length, longest first.
+
+    Returns:
+        str | None: Parent key or None if no candidate matches.
+
+    """
+    for candidate in parent_keys:
+        if key.startswith(f'{candidate}.'):
+            return candidate
+    return None
+
+
+def build_load_batches(
+        schemas: list,
+        tables: list,
+        columns: list,
+        child_columns: list,
+        batch_size: int
+) -> list[LoadBatch]:
+    """Split the hierarchy into batches and link every batch to the batches it depends on.
+
+    Tables depend on the schema batch that contains their schema, columns on all table batches
+    of their schema and child columns on all column batches of their schema. Objects whose parent
+    is not part of the load (e.g. it exists already) have no dependency.
+
+    Args:
+        schemas (list): SchemaItem objects.
+        tables (list): TableItem objects.
+        columns (list): ColumnItem objects.
+        child_columns (list): RootColumnChildrenPatchItem objects.
+        batch_size (int): Maximum number of objects per batch.
+
+    Returns:
+        list[LoadBatch]: Batches in stage order.
+
+    """
+    schema_keys = sorted({schema.key for schema in schemas}, key=len, reverse=True)
+    table_keys = sorted({table.key for table in tables}, key=len, reverse=True)
+    table_schemas = {table.key: parent_key(table.key, schema_keys) for table in tables}
+
+    def schema_of(key: str) -> str | None:
+        # columns are matched to a table first so that schema names containing dots are resolved
+        table = parent_key(key, table_keys)
+        if table is not None:
+            return table_schemas[table]
+        return parent_key(key, schema_keys)
+
+    grouped = {
+        'schema': {schema.key: [schema] for schema in schemas},
+        'table': {},
+        'column': {},
+        'child_column': {},
+    }
+    for table in tables:
+        grouped['table'].setdefault(table_schemas[table.key], []).append(table)
+    for column in columns:
+        grouped['column'].setdefault(schema_of(column.key), []).append(column)
+    for child in child_columns:
+        grouped['child_column'].setdefault(schema_of(child.parent_key), []).append(child)
+
+    batches = []
+    # schema_key -> batches of the previous stage
+    previous = {}
+    for stage in LOAD_STAGES:
+        current = {}
+        if stage == 'schema':
+            # schemas are small, they are loaded in shared batches
+            for start in range(0, len(schemas), batch_size):
+                batch = LoadBatch(stage, None, schemas[start:start + batch_size])
+                batches.append(batch)
+                for schema in batch.items:
+                    current[schema.key] = [batch]
+        else:
+            for schema_key, items in grouped[stage].items():
+                for start in range(0, len(items), batch_size):
+                    batch = LoadBatch(stage, schema_key, items[start:start + batch_size],
+                                      depends_on=list(previous.get(schema_key, [])))
+                    batches.append(batch)
+                    current.setdefault(schema_key, []).append(batch)
+        # objects of a later stage may skip a stage, e.g. columns of tables that exist already
+        for schema_key, stage_batches in previous.items():
+            current.setdefault(schema_key, stage_batches)
+        previous = current
+
+    return batches
+
+
+def run_load_batches(
+        batches: list[LoadBatch],
+        load: Callable[[LoadBatch], list],
+        max_concurrency: int
+) -> RDBMSLoadResult:
+    """Run the batches as soon as the batches they depend on succeeded.
+
+    Args:
+        batches (list[LoadBatch]): Batches with their dependencies.
+        load (Callable[[LoadBatch], list]): Loads a batch and returns the job details.
+        max_concurrency (int): Number of batches loaded at the same time.
+
+    Returns:
+        RDBMSLoadResult: Job details of all loaded batches, the failed batches and the batches
+            skipped because a batch they depend on failed.
+
+    """
+    result = RDBMSLoadResult()
+    waiting_on = {id(batch): len(batch.depends_on) for batch in batches}
+    dependents = {id(batch): [] for batch in batches}
+    for batch in batches:
+        for dependency in batch.depends_on:
+            dependents[id(dependency)].append(batch)
+
+    ready = [batch for batch in batches if not batch.depends_on]
+    skipped = set()
+
+    def skip(batch: LoadBatch):
+        if id(batch) in skipped:
+            return
+        skipped.add(id(batch))
+        result.skipped_batches.append(batch)
+        for dependent in dependents[id(batch)]:
+            skip(dependent)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        running = {}
+        while ready or running:
+            while ready:
+                batch = ready.pop(0)
+                running[executor.submit(load, batch)] = batch
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch = running.pop(future)
+                try:
+                    jobs = future.result()
+                    failed = any(job.status == 'failed' for job in jobs)
+                    result.jobs.extend(jobs)
+                except Exception as load_error:
+                    LOGGER.error('Loading a %s batch of schema %s failed: %s', batch.stage, batch.schema_key, load_error)
+                    failed = True
+
+                if failed:
+                    result.failed_batches.append(batch)
+                    for dependent in dependents[id(batch)]:
+                        skip(dependent)
+                    continue
+
+                for dependent in dependents[id(batch)]:
+                    waiting_on[id(dependent)] -= 1
+                    if waiting_on[id(dependent)] == 0 and id(dependent) not in skipped:
+                        ready.append(dependent)
+
+    if result.failed_batches:
+        LOGGER.warning('%s batches failed, %s dependent batches were skipped.',
+                       len(result.failed_batches), len(result.skipped_batches))
+    return result
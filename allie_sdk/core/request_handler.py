@@ -1,24 +1,37 @@
 """Route all Alation API Calls through the same core request functions."""
 
+import gzip
 import json
 import logging
 import requests
+import time
 from requests.auth import HTTPBasicAuth
+from typing import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
-from urllib.parse import urlparse
+from urllib.parse import parse_qsl, quote_plus, urlencode, urlparse
 from requests.adapters import HTTPAdapter, Retry
+from .jsonl import iter_file_chunks, iter_gzip_chunks
+from .data_structures import BaseParams
+from .page_size_tuner import PageSizeTuner
 from ..models.job_model import *
 
 API_LOGGER = logging.getLogger("allie_sdk_logger")
 RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
 SUCCESS_CODES = [200, 201, 202, 204]
+COMPRESSION_THRESHOLD = 64 * 1024
+UNSUPPORTED_MEDIA_TYPE = 415
+# conservative limit, many proxies and load balancers reject request lines above 8 KB
+MAX_URL_LENGTH = 4000
 
 
 class RequestHandler(object):
     """Route all Alation API Calls through same core request functions."""
 
     def __init__(self, session: requests.Session, host: str, access_token: str = None,
-                 page_size: int = 1000):
+                 page_size: int = 1000, compress_requests: bool = False,
+                 compression_threshold: int = COMPRESSION_THRESHOLD,
+                 page_size_tuner: PageSizeTuner = None):
         """Creates an instance of the RequestHandler object.
 
         Args:
@@ -26,11 +39,19 @@ class RequestHandler(object):
             host (str): Alation URL.
             access_token (str): Alation REST API Access Token.
             page_size (int): Page size of REST API Get Calls.
+            compress_requests (bool): Gzip compress POST, PATCH and PUT bodies (Content-Encoding: gzip).
+            compression_threshold (int): Minimum size in bytes of in-memory bodies to be compressed.
+                Streamed bodies are always compressed.
+            page_size_tuner (PageSizeTuner): Adapt the page size of paginated GET calls per endpoint
+                instead of using page_size.
 
         """
         self.s = session
         self.host = host.rstrip('/')
         self.page_size = page_size
+        self.compress_requests = compress_requests
+        self.compression_threshold = compression_threshold
+        self.page_size_tuner = page_size_tuner
 
         retries = Retry(total=5, backoff_factor=0.2, status_forcelist=RETRY_STATUS_CODES)
         self.s.mount('http://', HTTPAdapter(max_retries=retries))
@@ -118,6 +139,8 @@ class RequestHandler(object):
             query_params: dict = None,
             pagination: bool = True,
             body: any = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None,
     ) -> any:
         """API Get Request.
 
@@ -126,6 +149,9 @@ class RequestHandler(object):
             query_params (dict): GET API Call Query Parameters.
             pagination (bool): Fetch all API results that meet the Query Parameters.
             body (any): Optional GET Request Body.
+            max_items (int): Stop paginating once this many items were returned.
+            stop_when (Callable[[dict], bool]): Called with every returned item. Stop paginating after
+                the first item it returns True for, the item is the last one returned.
 
         Returns:
             any: API Response Body in JSON.
@@ -136,12 +162,19 @@ class RequestHandler(object):
         returned_items = []
         if query_params is None:
             query_params = {}
+        tuner = self.page_size_tuner if pagination else None
         if pagination:
-            query_params['limit'] = self.page_size
+            page_size = tuner.page_size(url) if tuner else self.page_size
+            query_params['limit'] = page_size if max_items is None else max(1, min(page_size, max_items))
+            if query_params['limit'] != page_size:
+                # pages cut short by max_items tell nothing about the page size of the endpoint
+                tuner = None
 
+        started = time.perf_counter()
         api_response = self._api_single_get(
             self.host + url, params=query_params, body=body
         )
+        limit = query_params.get('limit')
         # Check status and raise error if needed
         if api_response.status_code not in SUCCESS_CODES:
             api_response.raise_for_status()
@@ -153,10 +186,21 @@ class RequestHandler(object):
                 return api_response.content.decode("utf-8")
             except UnicodeDecodeError:
                 return api_response.content
+        page_objects = len(returned_items) if isinstance(returned_items, list) else 1
+
+        limited = isinstance(returned_items, list) and (max_items is not None or stop_when is not None)
+        stop = False
+        if limited:
+            returned_items, stop = self._limit_items([], returned_items, max_items, stop_when)
 
         if pagination:
-            while 'X-Next-Page' in api_response.headers:
+            while not stop and 'X-Next-Page' in api_response.headers:
                 next_url = api_response.headers.get('X-Next-Page')
+                if tuner and isinstance(returned_items, list):
+                    limit = self._tune_page_size(url, limit, page_objects, api_response, started)
+                    next_url = self._replace_limit(next_url, limit)
+
+                started = time.perf_counter()
                 api_response = self._api_single_get(self.host + next_url)
                 
                 # Check status of paginated request and raise error if needed
@@ -164,10 +208,207 @@ class RequestHandler(object):
                     api_response.raise_for_status()
                 
                 response_data = api_response.json()
-                returned_items.extend(response_data)
+                page_objects = len(response_data) if isinstance(response_data, list) else 1
+                if limited:
+                    returned_items, stop = self._limit_items(returned_items, response_data, max_items, stop_when)
+                else:
+                    returned_items.extend(response_data)
+
+            if tuner and isinstance(returned_items, list):
+                if not stop:
+                    # the last page was not cut short by max_items or stop_when
+                    self._tune_page_size(url, limit, page_objects, api_response, started)
+                tuner.save()
 
         return returned_items
 
+    def _tune_page_size(
+            self, url: str, limit: int, objects: int, api_response: requests.Response, started: float) -> int:
+        """Report a page to the page size tuner.
+
+        Args:
+            url (str): GET API Call URL.
+            limit (int): Page size requested.
+            objects (int): Number of objects returned by the page.
+            api_response (requests.Response): API GET Response of the page.
+            started (float): time.perf_counter() value when the request was sent.
+
+        Returns:
+            int: Page size to request next.
+
+        """
+        return self.page_size_tuner.record(
+            url,
+            limit=limit,
+            objects=objects,
+            size_in_bytes=len(api_response.content),
+            seconds=time.perf_counter() - started,
+            has_next_page='X-Next-Page' in api_response.headers
+        )
+
+    @staticmethod
+    def _replace_limit(next_url: str, limit: int) -> str:
+        """Replace the limit query parameter of a next page URL.
+
+        Args:
+            next_url (str): X-Next-Page URL.
+            limit (int): New page size.
+
+        Returns:
+            str: URL requesting limit objects. URLs without a limit parameter are returned unchanged.
+
+        """
+        parsed_url = urlparse(next_url)
+        params = parse_qsl(parsed_url.query, keep_blank_values=True)
+        if not any(key == 'limit' for key, _ in params):
+            return next_url
+
+        params = [(key, str(limit) if key == 'limit' else value) for key, value in params]
+        return parsed_url._replace(query=urlencode(params)).geturl()
+
+    def get_many_by_id(
+            self,
+            url: str,
+            query_params: dict | BaseParams,
+            chunk_field: str = 'id',
+            max_url_length: int = MAX_URL_LENGTH,
+            max_workers: int = 4,
+            dedupe_key: str | None = 'id'
+    ) -> list:
+        """API Get Request for a large set of filter values, e.g. thousands of ids.
+
+        The values of chunk_field are split into chunks whose request URL stays below
+        max_url_length. Every chunk is fetched with its own pagination, the chunks are
+        fetched concurrently and the results are merged in chunk order. An empty list
+        of values returns no objects, without chunk_field all objects are fetched. Empty
+        filters of a BaseParams object are dropped, i.e. treated as not set.
+
+        Args:
+            url (str): GET API Call URL.
+            query_params (dict | BaseParams): GET API Call Query Parameters, e.g. a TableParams object.
+            chunk_field (str): Set-valued query parameter to split, e.g. 'id' or 'oid'.
+            max_url_length (int): Maximum length of a request URL.
+            max_workers (int): Number of chunks fetched concurrently.
+            dedupe_key (str | None): Field identifying an object. Objects returned by several chunks
+                are only returned once. Set to None to keep all objects.
+
+        Returns:
+            list: API Response Body in JSON.
+
+        Raises:
+            ValueError: If the other query parameters alone exceed max_url_length.
+            requests.HTTPError: If the API returns a non-success status code.
+        """
+        if isinstance(query_params, BaseParams):
+            query_params = query_params.generate_params_dict()
+        params = dict(query_params or {})
+        values = params.pop(chunk_field, None)
+        if values is None:
+            return self.get(url, query_params=params) or []
+        if not isinstance(values, (list, set, tuple, frozenset)):
+            values = [values]
+        values = list(dict.fromkeys(values))
+        if not values:
+            # an empty filter matches no objects, it must not fetch the whole endpoint
+            return []
+
+        chunks = self._chunk_values(url, params, chunk_field, values, max_url_length)
+        API_LOGGER.debug(f'Fetching {len(values)} {chunk_field} values in {len(chunks)} chunks.')
+
+        def fetch_chunk(chunk: list) -> list:
+            return self.get(url, query_params={**params, chunk_field: chunk}) or []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch_chunk, chunks))
+
+        if dedupe_key is None:
+            return [item for result in results for item in result]
+
+        seen = set()
+        returned_items = []
+        for result in results:
+            for item in result:
+                key = item.get(dedupe_key) if isinstance(item, dict) else None
+                if key is not None:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                returned_items.append(item)
+        return returned_items
+
+    def _chunk_values(self, url: str, params: dict, chunk_field: str, values: list, max_url_length: int) -> list[list]:
+        """Split filter values into chunks that keep the request URL below max_url_length.
+
+        Args:
+            url (str): GET API Call URL.
+            params (dict): Query parameters sent with every chunk.
+            chunk_field (str): Name of the query parameter to split.
+            values (list): Values to split.
+            max_url_length (int): Maximum length of a request URL.
+
+        Returns:
+            list[list]: Chunks of values.
+
+        Raises:
+            ValueError: If the other query parameters alone exceed max_url_length.
+
+        """
+        # the page size is added to the query string by get
+        base_params = {**params, 'limit': self.page_size}
+        base_length = len(self.host + url) + 1 + len(urlencode(base_params, doseq=True))
+        budget = max_url_length - base_length
+        parameter_length = len(quote_plus(chunk_field)) + 2  # '&' and '='
+        if budget < parameter_length + 1:
+            raise ValueError(f'The query parameters exceed the maximum URL length of {max_url_length}.')
+
+        chunks = []
+        chunk = []
+        chunk_length = 0
+        for value in values:
+            value_length = parameter_length + len(quote_plus(str(value)))
+            if chunk and chunk_length + value_length > budget:
+                chunks.append(chunk)
+                chunk = []
+                chunk_length = 0
+            chunk.append(value)
+            chunk_length += value_length
+        chunks.append(chunk)
+        return chunks
+
+    @staticmethod
+    def _limit_items(
+            items: list,
+            page: list,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> tuple[list, bool]:
+        """Add the items of a page until max_items is reached or stop_when matches.
+
+        Args:
+            items (list): Items returned so far.
+            page (list): Items of the next page.
+            max_items (int): Maximum number of items.
+            stop_when (Callable[[dict], bool]): Predicate marking the last item to return.
+
+        Returns:
+            tuple[list, bool]: The items and whether pagination should stop.
+
+        """
+        stop = False
+        if max_items is not None and len(items) + len(page) >= max_items:
+            page = page[:max_items - len(items)]
+            stop = True
+
+        if stop_when is not None:
+            for position, item in enumerate(page):
+                if stop_when(item):
+                    page = page[:position + 1]
+                    stop = True
+                    break
+
+        items.extend(page)
+        return items, stop
+
     def patch(self, url: str, body: any, query_params: dict = None, headers: dict = None) -> dict:
         """API Patch Request.
 
@@ -194,7 +435,7 @@ class RequestHandler(object):
         if isinstance(body, dict) or isinstance(body, list):
             body = json.dumps(body, default=str)
 
-        api_response = self.s.patch(self.host + url, data=body, params=query_params, headers=headers)
+        api_response = self._send_body(self.s.patch, self.host + url, body, headers, params=query_params)
 
         try:
             response_data = api_response.json()
@@ -459,11 +700,12 @@ class RequestHandler(object):
             else:
                 request_body = body
 
-        api_response = self.s.put(
+        api_response = self._send_body(
+            self.s.put,
             self.host + url,
-            data=request_body,
+            request_body,
+            headers,
             params=query_params,
-            headers=headers,
             files=files,
         )
 
@@ -590,11 +832,12 @@ class RequestHandler(object):
         if isinstance(body, dict) or isinstance(body, list):
             body = json.dumps(body, default=str)
 
-        api_response = self.s.post(
+        api_response = self._send_body(
+            self.s.post,
             url,
-            data=body,
+            body,
+            headers,
             params=params,
-            headers=headers,
             files=files,
         )
 
@@ -629,6 +872,102 @@ class RequestHandler(object):
 
         return api_response
 
+    def _send_body(self, send: Callable, url: str, body: any, headers: dict, **kwargs) -> requests.Response:
+        """Send a request with a body, gzip compressed if enabled.
+
+        If the server rejects the compressed body with '415 Unsupported Media Type',
+        compression is turned off for this handler and in-memory bodies and seekable
+        files are sent again uncompressed. Other streamed bodies cannot be sent twice.
+
+        Args:
+            send (Callable): Session method sending the request, e.g. self.s.post.
+            url (str): API Call URL.
+            body (any): Request body: str, bytes, a file object or an iterable of bytes.
+            headers (dict): API Call Headers.
+            **kwargs: Further arguments passed to the session method.
+
+        Returns:
+            requests.Response: API Response.
+
+        Raises:
+            requests.HTTPError: If the server rejects a gzip encoded body that cannot be sent again.
+
+        """
+        compressed_body = self._compress_body(body, headers, kwargs.get('files'))
+        if compressed_body is None:
+            api_response = send(url, data=body, headers=headers, **kwargs)
+            if api_response.status_code == UNSUPPORTED_MEDIA_TYPE and any(
+                    key.lower() == 'content-encoding' for key in headers):
+                # the body was encoded by the caller, only the caller can send it again
+                raise self._compression_rejected(url, api_response)
+            return api_response
+
+        # remember the position of seekable files to send them again if compression is rejected
+        start = body.tell() if hasattr(body, 'seekable') and body.seekable() else None
+        compressed_headers = {**headers, 'Content-Encoding': 'gzip'}
+        api_response = send(url, data=compressed_body, headers=compressed_headers, **kwargs)
+
+        if api_response.status_code == UNSUPPORTED_MEDIA_TYPE:
+            API_LOGGER.warning(f'{self._format_log_url(url)} does not accept gzip request bodies, '
+                               'disabling request compression.')
+            self.compress_requests = False
+            if start is not None:
+                body.seek(start)
+            elif not isinstance(body, (str, bytes)):
+                raise self._compression_rejected(url, api_response)
+            api_response = send(url, data=body, headers=headers, **kwargs)
+
+        return api_response
+
+    def _compression_rejected(self, url: str, api_response: requests.Response) -> requests.HTTPError:
+        """Build the error raised when a gzip encoded body was rejected and cannot be sent again.
+
+        Args:
+            url (str): API Call URL.
+            api_response (requests.Response): '415 Unsupported Media Type' API Response.
+
+        Returns:
+            requests.HTTPError: Error including the response.
+
+        """
+        return requests.HTTPError(
+            f'{self._format_log_url(url)} does not accept gzip request bodies (415 Unsupported Media Type) '
+            'and the streamed body cannot be sent again. Retry the upload without compression, '
+            'e.g. with compress=False.',
+            response=api_response
+        )
+
+    def _compress_body(self, body: any, headers: dict, files: dict = None) -> bytes | Iterator[bytes] | None:
+        """Gzip compress a request body.
+
+        In-memory bodies are compressed in one go, so the body can be sent again by
+        the retry logic. Streamed bodies are compressed chunk by chunk while they are sent.
+
+        Args:
+            body (any): Request body.
+            headers (dict): API Call Headers.
+            files (dict): API Call upload files.
+
+        Returns:
+            bytes | Iterator[bytes] | None: Compressed body or None if the body is not compressed.
+
+        """
+        if not self.compress_requests or body is None or files:
+            return None
+        if any(key.lower() == 'content-encoding' for key in headers):
+            # the body is encoded already
+            return None
+
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        if isinstance(body, bytes):
+            if len(body) < self.compression_threshold:
+                return None
+            return gzip.compress(body, compresslevel=6, mtime=0)
+        if hasattr(body, 'read'):
+            return iter_gzip_chunks(iter_file_chunks(body))
+        return iter_gzip_chunks(body)
+
     @staticmethod
     def _log_success(details: dict, message: str):
         """Log the REST API Success Message.
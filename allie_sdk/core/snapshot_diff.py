@@ -0,0 +1,256 @@
+"""Compare Two Catalog Snapshots Object by Object."""
+
+import gzip
+import json
+import logging
+import os
+import tempfile
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .rdbms_diff import content_hash
+
+LOGGER = logging.getLogger('allie_sdk_logger')
+
+CHANGE_TYPES = ('added', 'removed', 'changed')
+SNAPSHOT_DIFF_PARTITIONS = 64
+
+
+@dataclass
+class SnapshotChange:
+    change: str
+    key: str | tuple
+    old: dict = field(default=None)
+    new: dict = field(default=None)
+    # field name -> (old value, new value), changed objects only
+    fields: dict = field(default_factory=dict)
+
+
+def record_key(record: dict, key: str | tuple[str, ...]) -> str | tuple:
+    """Return the key of a record.
+
+    Args:
+        record (dict): Snapshot record.
+        key (str | tuple[str, ...]): Key field, or several fields for a composite key
+            (e.g. ('otype', 'oid', 'field_id') for custom field values).
+
+    Returns:
+        str | tuple: Key value.
+
+    """
+    if isinstance(key, str):
+        return record[key]
+    return tuple(record[name] for name in key)
+
+
+def _flatten(record: dict, ignore_fields: tuple[str, ...]) -> dict:
+    # custom fields are compared by field id, so their order does not matter
+    flat = {name: value for name, value in record.items() if name not in ignore_fields and name != 'custom_fields'}
+    if 'custom_fields' not in ignore_fields:
+        for custom_field in record.get('custom_fields') or []:
+            flat[f"custom_fields.{custom_field.get('field_id')}"] = custom_field.get('value')
+    return flat
+
+
+def field_changes(old: dict, new: dict, ignore_fields: tuple[str, ...] = ()) -> dict:
+    """Return the fields that differ between two versions of a record.
+
+    Args:
+        old (dict): Record of the old snapshot.
+        new (dict): Record of the new snapshot.
+        ignore_fields (tuple[str, ...]): Fields that are not compared, e.g. timestamps.
+
+    Returns:
+        dict: Field name -> (old value, new value). Custom fields are named
+            'custom_fields.<field_id>'. Missing fields have the value None.
+
+    """
+    old_fields = _flatten(old, ignore_fields)
+    new_fields = _flatten(new, ignore_fields)
+    return {
+        name: (old_fields.get(name), new_fields.get(name))
+        for name in dict.fromkeys([*old_fields, *new_fields])
+        if old_fields.get(name) != new_fields.get(name)
+    }
+
+
+def _compare(key, old: dict, new: dict, ignore_fields: tuple[str, ...]) -> SnapshotChange | None:
+    if not ignore_fields and content_hash(old) == content_hash(new):
+        return None
+    changes = field_changes(old, new, ignore_fields)
+    if not changes:
+        return None
+    return SnapshotChange('changed', key, old, new, changes)
+
+
+def diff_sorted(
+        old_records: Iterable[dict],
+        new_records: Iterable[dict],
+        key: str | tuple[str, ...] = 'key',
+        ignore_fields: tuple[str, ...] = ()
+) -> Iterator[SnapshotChange]:
+    """Compare two snapshots that are both ordered by key with a sorted merge.
+
+    Only one record of each snapshot is held in memory, e.g. for
+    CatalogMirror.iter_records(otype, order_by='key').
+
+    Args:
+        old_records (Iterable[dict]): Records of the old snapshot, ordered by key.
+        new_records (Iterable[dict]): Records of the new snapshot, ordered by key.
+        key (str | tuple[str, ...]): Key field(s) identifying an object.
+        ignore_fields (tuple[str, ...]): Fields that are not compared.
+
+    Returns:
+        Iterator[SnapshotChange]: Added, removed and changed objects in key order.
+
+    Raises:
+        ValueError: If a snapshot is not ordered by key or contains a key twice.
+
+    """
+    def ordered(records: Iterable[dict], name: str) -> Iterator[tuple]:
+        previous = None
+        for record in records:
+            current = record_key(record, key)
+            if previous is not None and current <= previous:
+                raise ValueError(f'The {name} snapshot is not ordered by key: {current!r} follows {previous!r}.')
+            previous = current
+            yield current, record
+
+    old_iter = ordered(old_records, 'old')
+    new_iter = ordered(new_records, 'new')
+    old = next(old_iter, None)
+    new = next(new_iter, None)
+
+    while old is not None or new is not None:
+        if new is None or (old is not None and old[0] < new[0]):
+            yield SnapshotChange('removed', old[0], old=old[1])
+            old = next(old_iter, None)
+        elif old is None or new[0] < old[0]:
+            yield SnapshotChange('added', new[0], new=new[1])
+            new = next(new_iter, None)
+        else:
+            change = _compare(new[0], old[1], new[1], ignore_fields)
+            if change is not None:
+                yield change
+            old = next(old_iter, None)
+            new = next(new_iter, None)
+
+
+def diff_snapshots(
+        old_records: Iterable[dict],
+        new_records: Iterable[dict],
+        key: str | tuple[str, ...] = 'key',
+        ignore_fields: tuple[str, ...] = (),
+        partitions: int = SNAPSHOT_DIFF_PARTITIONS,
+        work_dir: str | os.PathLike = None
+) -> Iterator[SnapshotChange]:
+    """Compare two snapshots in any order with a hash-partitioned join.
+
+    Both snapshots are first split into partitions by a hash of the key and
+    spilled to compressed temporary files. The partitions are then compared
+    one at a time, holding only the old records of one partition in memory,
+    about 1/partitions of the old snapshot. Use more partitions for larger
+    snapshots.
+
+    Args:
+        old_records (Iterable[dict]): Records of the old snapshot, e.g. iter_snapshot_records(...).
+        new_records (Iterable[dict]): Records of the new snapshot.
+        key (str | tuple[str, ...]): Key field(s) identifying an object.
+        ignore_fields (tuple[str, ...]): Fields that are not compared.
+        partitions (int): Number of partitions.
+        work_dir (str | os.PathLike): Directory for the temporary partition files. The system
+            temporary directory is used if not set.
+
+    Returns:
+        Iterator[SnapshotChange]: Added, removed and changed objects, grouped by partition.
+
+    Raises:
+        ValueError: If the old snapshot contains a key twice.
+
+    """
+    with tempfile.TemporaryDirectory(prefix='allie_snapshot_diff_', dir=work_dir) as temporary_dir:
+        temporary_dir = Path(temporary_dir)
+        old_count = _partition(old_records, key, temporary_dir / 'old', partitions)
+        new_count = _partition(new_records, key, temporary_dir / 'new', partitions)
+        LOGGER.debug('Comparing %s old and %s new records in %s partitions.', old_count, new_count, partitions)
+
+        for partition in range(partitions):
+            old_by_key = {}
+            for record in _read_partition(temporary_dir / 'old', partition):
+                record_id = _hashable_key(record_key(record, key))
+                if record_id in old_by_key:
+                    raise ValueError(f'The old snapshot contains the key {record_id!r} more than once.')
+                old_by_key[record_id] = record
+
+            for new in _read_partition(temporary_dir / 'new', partition):
+                record_id = _hashable_key(record_key(new, key))
+                old = old_by_key.pop(record_id, None)
+                if old is None:
+                    yield SnapshotChange('added', record_id, new=new)
+                    continue
+                change = _compare(record_id, old, new, ignore_fields)
+                if change is not None:
+                    yield change
+
+            for record_id, old in old_by_key.items():
+                yield SnapshotChange('removed', record_id, old=old)
+
+
+def _hashable_key(value) -> str | tuple:
+    # composite keys are read back from JSON as lists
+    return tuple(value) if isinstance(value, list) else value
+
+
+def _partition(records: Iterable[dict], key: str | tuple[str, ...], directory: Path, partitions: int) -> int:
+    directory.mkdir()
+    files = [gzip.open(directory / f'{partition:05d}.jsonl.gz', 'wt', encoding='utf-8', compresslevel=1)
+             for partition in range(partitions)]
+    count = 0
+    try:
+        for record in records:
+            serialized_key = json.dumps(record_key(record, key), default=str)
+            partition = zlib.crc32(serialized_key.encode('utf-8')) % partitions
+            files[partition].write(json.dumps(record, default=str))
+            files[partition].write('\n')
+            count += 1
+    finally:
+        for partition_file in files:
+            partition_file.close()
+    return count
+
+
+def _read_partition(directory: Path, partition: int) -> Iterator[dict]:
+    with gzip.open(directory / f'{partition:05d}.jsonl.gz', 'rt', encoding='utf-8') as partition_file:
+        for line in partition_file:
+            yield json.loads(line)
+
+
+def write_changes(changes: Iterable[SnapshotChange], path: str | os.PathLike) -> dict[str, int]:
+    """Write changes to a gzip compressed JSON Lines file, one change per line.
+
+    Args:
+        changes (Iterable[SnapshotChange]): Changes returned by diff_sorted or diff_snapshots.
+        path (str | os.PathLike): Output file.
+
+    Returns:
+        dict[str, int]: Number of added, removed and changed objects.
+
+    """
+    counts = dict.fromkeys(CHANGE_TYPES, 0)
+    with gzip.open(path, 'wt', encoding='utf-8') as changes_file:
+        for change in changes:
+            counts[change.change] += 1
+            line = {
+                'change': change.change,
+                'key': change.key,
+                'old': change.old,
+                'new': change.new,
+                'fields': {name: {'old': old, 'new': new} for name, (old, new) in change.fields.items()},
+            }
+            changes_file.write(json.dumps(line, default=str))
+            changes_file.write('\n')
+    LOGGER.info('Snapshot changes: %s added, %s removed, %s changed.',
+                counts['added'], counts['removed'], counts['changed'])
+    return counts
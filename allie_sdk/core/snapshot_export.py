@@ -0,0 +1,390 @@
+"""Export Alation Data Source Snapshots to Partitioned JSON Lines or Parquet Files."""
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator
+
+from ..alation import Alation
+from ..methods.rdbms import RDBMS_SCAN_TYPES
+from ..models.dataflow_model import DataflowPayload
+from ..models.rdbms_model import ColumnParams, SchemaParams, TableParams
+
+LOGGER = logging.getLogger('allie_sdk_logger')
+
+SNAPSHOT_DATASETS = ('schema', 'table', 'column', 'custom_field_value', 'tag', 'dataflow')
+SNAPSHOT_FORMATS = ('jsonl', 'parquet')
+SNAPSHOT_OBJECT_TYPES = ('schema', 'table', 'column')
+# ids per shard, shard boundaries are multiples of the shard size so they stay the same between runs
+SNAPSHOT_SHARD_SIZE = 50000
+MANIFEST_FILE = 'manifest.json'
+# RDBMS object type -> otype used by the custom field value and tag APIs
+ALATION_OTYPES = {'schema': 'schema', 'table': 'table', 'column': 'attribute'}
+SNAPSHOT_PARAMS = {'schema': SchemaParams, 'table': TableParams, 'column': ColumnParams}
+FILE_EXTENSIONS = {'jsonl': '.jsonl.gz', 'parquet': '.parquet'}
+
+
+@dataclass
+class SnapshotShard:
+    name: str
+    dataset: str
+    fetch: Callable[[], dict[str, list[dict]]] = field(repr=False)
+
+
+@dataclass
+class SnapshotExportResult:
+    rows: dict = field(default_factory=dict)
+    exported_shards: int = field(default=0)
+    resumed_shards: int = field(default=0)
+    failed_shards: list = field(default_factory=list)
+
+    @property
+    def successful(self) -> bool:
+        return not self.failed_shards
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class SnapshotExporter:
+    """Export the metadata of a data source to files for offline analysis and backups.
+
+    Schemas, tables and columns are fetched in id range shards of shard_size
+    ids, custom field values are taken from the fetched objects. Tags are
+    fetched per tag and kept if they are assigned to the data source or one of
+    its objects, dataflows are fetched by id. Every shard is written to its own
+    part file as soon as it was fetched, so at most max_workers shards are held
+    in memory, and recorded in the manifest file of the export. Running the
+    export again with the same output directory skips the recorded shards.
+
+    Output layout, with one part file per shard::
+
+        <output_dir>/manifest.json
+        <output_dir>/table/part-000003.jsonl.gz
+        <output_dir>/custom_field_value/otype=table/part-000003.jsonl.gz
+
+    """
+
+    def __init__(
+            self,
+            alation: Alation,
+            output_dir: str | os.PathLike,
+            format: str = 'jsonl',
+            shard_size: int = SNAPSHOT_SHARD_SIZE,
+            max_workers: int = 4
+    ):
+        """Creates an instance of the SnapshotExporter object.
+
+        Args:
+            alation (Alation): Alation instance used to fetch the objects.
+            output_dir (str | os.PathLike): Directory of the export.
+            format (str): 'jsonl' for gzip compressed JSON Lines or 'parquet' (requires pyarrow).
+            shard_size (int): Number of ids per schema, table and column shard.
+            max_workers (int): Number of shards fetched and written concurrently.
+
+        Raises:
+            ValueError: If the format is not supported.
+            ImportError: If the format is 'parquet' and pyarrow is not installed.
+
+        """
+        if format not in SNAPSHOT_FORMATS:
+            raise ValueError(f"Unsupported format '{format}'. Supported formats: {SNAPSHOT_FORMATS}.")
+        if format == 'parquet':
+            try:
+                import pyarrow.parquet  # noqa: F401
+            except ImportError as import_error:
+                raise ImportError(
+                    "pyarrow is required to export snapshots to Parquet. "
+                    "Install it with 'pip install pyarrow'.") from import_error
+
+        self.alation = alation
+        self.output_dir = Path(output_dir)
+        self.format = format
+        self.shard_size = shard_size
+        self.max_workers = max_workers
+        self._manifest = None
+        self._lock = threading.Lock()
+
+    def export(
+            self,
+            ds_id: int,
+            datasets: tuple[str, ...] = SNAPSHOT_DATASETS,
+            dataflow_ids: list[int | str] = None
+    ) -> SnapshotExportResult:
+        """Export a data source, or resume an interrupted export of it.
+
+        Args:
+            ds_id (int): Data source id.
+            datasets (tuple[str, ...]): Datasets to export, see SNAPSHOT_DATASETS.
+            dataflow_ids (list[int | str]): Ids or external ids of the dataflows to export. The
+                API cannot list the dataflows of a data source, so the dataflow dataset is only
+                exported if they are passed in.
+
+        Returns:
+            SnapshotExportResult: Rows written per dataset, the number of exported and
+                resumed shards and the names of the shards that failed.
+
+        Raises:
+            ValueError: If a dataset is not supported or the output directory contains an
+                export of another data source, format or shard size.
+
+        """
+        unknown = [dataset for dataset in datasets if dataset not in SNAPSHOT_DATASETS]
+        if unknown:
+            raise ValueError(f"Unsupported datasets {unknown}. Supported datasets: {SNAPSHOT_DATASETS}.")
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._manifest = self._load_manifest(ds_id)
+        result = SnapshotExportResult()
+
+        shards = []
+        for shard in self._plan(ds_id, datasets, dataflow_ids):
+            if shard.name in self._manifest['shards']:
+                result.resumed_shards += 1
+            else:
+                shards.append(shard)
+        if result.resumed_shards:
+            LOGGER.info('Resuming the export of data source %s, %s shards were exported already.',
+                        ds_id, result.resumed_shards)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._export_shard, shard): shard for shard in shards}
+            for future in as_completed(futures):
+                shard = futures[future]
+                try:
+                    rows = future.result()
+                except Exception as export_error:
+                    LOGGER.error('Exporting shard %s failed: %s', shard.name, export_error)
+                    result.failed_shards.append(shard.name)
+                    continue
+                result.exported_shards += 1
+                for dataset, count in rows.items():
+                    result.rows[dataset] = result.rows.get(dataset, 0) + count
+
+        with self._lock:
+            self._manifest['completed_at'] = None if result.failed_shards else time.time()
+            self._save_manifest()
+
+        LOGGER.info('Exported %s shards of data source %s, %s failed.',
+                    result.exported_shards, ds_id, len(result.failed_shards))
+        return result
+
+    def _plan(self, ds_id: int, datasets: tuple[str, ...], dataflow_ids: list | None) -> list[SnapshotShard]:
+        shards = []
+        for otype in SNAPSHOT_OBJECT_TYPES:
+            if otype not in datasets and 'custom_field_value' not in datasets:
+                continue
+            first_id = self._probe_id(otype, ds_id, 'id')
+            if first_id is None:
+                continue
+            last_id = self._probe_id(otype, ds_id, '-id')
+            for number in range(first_id // self.shard_size, last_id // self.shard_size + 1):
+                shards.append(SnapshotShard(
+                    f'{otype}/{number:06d}', otype,
+                    self._object_fetcher(otype, ds_id, number, datasets)))
+
+        if 'tag' in datasets:
+            shards.append(SnapshotShard('tag/000000', 'tag', lambda: {'tag': self._fetch_tags(ds_id)}))
+        if 'dataflow' in datasets and dataflow_ids:
+            shards.append(SnapshotShard('dataflow/000000', 'dataflow', lambda: self._fetch_dataflows(dataflow_ids)))
+        return shards
+
+    def _probe_id(self, otype: str, ds_id: int, order_by: str) -> int | None:
+        getter = getattr(self.alation.rdbms, f'get_{otype}s')
+        params = SNAPSHOT_PARAMS[otype](ds_id={ds_id}, order_by=order_by)
+        records = getter(params, max_items=1, fields=['id'])
+        return records[0].id if records else None
+
+    def _object_fetcher(self, otype: str, ds_id: int, number: int, datasets: tuple[str, ...]) -> Callable:
+        def fetch() -> dict[str, list[dict]]:
+            lower = number * self.shard_size
+            params = SNAPSHOT_PARAMS[otype](ds_id={ds_id}, id__gte={lower}, id__lt={lower + self.shard_size})
+            # the records are written as returned by the API, no need to parse them into models
+            records = self.alation.rdbms.get(
+                RDBMS_SCAN_TYPES[otype][0], query_params=params.generate_params_dict()) or []
+
+            datasets_rows = {}
+            if otype in datasets:
+                datasets_rows[otype] = records
+            if 'custom_field_value' in datasets:
+                datasets_rows[f'custom_field_value/otype={ALATION_OTYPES[otype]}'] = [
+                    {'otype': ALATION_OTYPES[otype], 'oid': record['id'],
+                     'field_id': custom_field.get('field_id'), 'value': custom_field.get('value')}
+                    for record in records for custom_field in record.get('custom_fields') or []
+                ]
+            return datasets_rows
+        return fetch
+
+    def _fetch_tags(self, ds_id: int) -> list[dict]:
+        tag_handler = self.alation.tag
+        tags = tag_handler.get_tags()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            tagged = list(executor.map(
+                lambda tag: tag_handler.get_objects_tagged_with_specific_tag(tag.name), tags))
+
+        # only the tagged objects are looked up, the objects of the data source are not loaded
+        candidates = {}
+        for tag, tagged_objects in zip(tags, tagged):
+            for tagged_object in tagged_objects:
+                subject = tagged_object.subject
+                if subject is None:
+                    continue
+                candidates.setdefault((subject.otype, subject.id), []).append({
+                    'tag_id': tag.id,
+                    'tag_name': tag.name,
+                    'otype': subject.otype,
+                    'oid': subject.id,
+                    'ts_tagged': tagged_object.ts_tagged.isoformat() if tagged_object.ts_tagged else None,
+                })
+
+        members = {('data', ds_id), ('data', str(ds_id))}
+        for otype, alation_otype in ALATION_OTYPES.items():
+            ids = {oid for candidate_otype, oid in candidates if candidate_otype == alation_otype}
+            if ids:
+                url = RDBMS_SCAN_TYPES[otype][0]
+                records = self.alation.rdbms.get_many_by_id(url, {'id': ids, 'ds_id': {ds_id}, 'values': 'id'})
+                members.update((alation_otype, record['id']) for record in records)
+
+        return [row for subject, rows in candidates.items() if subject in members for row in rows]
+
+    def _fetch_dataflows(self, dataflow_ids: list[int | str]) -> dict[str, list[dict]]:
+        payload: DataflowPayload = self.alation.dataflow.get_dataflows(object_ids=list(dataflow_ids))
+        return {
+            'dataflow': [asdict(dataflow) for dataflow in payload.dataflow_objects],
+            'dataflow_path': [{'path': [[asdict(item) for item in segment] for segment in path]}
+                              for path in payload.paths],
+        }
+
+    def _export_shard(self, shard: SnapshotShard) -> dict[str, int]:
+        datasets_rows = shard.fetch()
+        files = {}
+        json_fields = {}
+        part = shard.name.rsplit('/', 1)[1]
+        for dataset, rows in datasets_rows.items():
+            if not rows:
+                continue
+            relative_path = f'{dataset}/part-{part}{FILE_EXTENSIONS[self.format]}'
+            json_fields[dataset] = self._write_part(self.output_dir / relative_path, rows)
+            files[dataset] = relative_path
+
+        with self._lock:
+            self._manifest['shards'][shard.name] = {
+                'files': files,
+                'rows': {dataset: len(rows) for dataset, rows in datasets_rows.items() if rows},
+                'json_fields': {dataset: names for dataset, names in json_fields.items() if names},
+                'exported_at': time.time(),
+            }
+            self._save_manifest()
+        LOGGER.debug('Exported shard %s.', shard.name)
+        return {dataset.split('/')[0]: len(rows) for dataset, rows in datasets_rows.items()}
+
+    def _write_part(self, path: Path, rows: list[dict]) -> list[str]:
+        """Write the rows of a shard to a part file.
+
+        The file is written to a temporary path first and then renamed, so a part file
+        is either complete or missing.
+
+        Args:
+            path (Path): Part file.
+            rows (list[dict]): Rows of the shard.
+
+        Returns:
+            list[str]: Fields stored as JSON strings (Parquet only).
+
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f'{path.name}.tmp')
+        json_fields = []
+
+        if self.format == 'jsonl':
+            with gzip.open(temporary_path, 'wt', encoding='utf-8') as part_file:
+                for row in rows:
+                    part_file.write(json.dumps(row, default=_json_default))
+                    part_file.write('\n')
+        else:
+            import pyarrow
+            import pyarrow.parquet
+
+            # nested values (custom fields, multi-value fields) are not consistently typed
+            json_fields = sorted({
+                name for row in rows for name, value in row.items() if isinstance(value, (dict, list))
+            })
+            names = list(dict.fromkeys(name for row in rows for name in row))
+            columns = {
+                name: [
+                    json.dumps(row.get(name), default=_json_default)
+                    if name in json_fields and row.get(name) is not None else row.get(name)
+                    for row in rows
+                ]
+                for name in names
+            }
+            pyarrow.parquet.write_table(pyarrow.table(columns), temporary_path)
+
+        os.replace(temporary_path, path)
+        return json_fields
+
+    def _load_manifest(self, ds_id: int) -> dict:
+        manifest_path = self.output_dir / MANIFEST_FILE
+        if not manifest_path.exists():
+            return {'ds_id': ds_id, 'format': self.format, 'shard_size': self.shard_size,
+                    'started_at': time.time(), 'completed_at': None, 'shards': {}}
+
+        manifest = json.loads(manifest_path.read_text())
+        expected = {'ds_id': ds_id, 'format': self.format, 'shard_size': self.shard_size}
+        found = {name: manifest.get(name) for name in expected}
+        if found != expected:
+            raise ValueError(f'{self.output_dir} contains another export {found}, expected {expected}.')
+        return manifest
+
+    def _save_manifest(self):
+        manifest_path = self.output_dir / MANIFEST_FILE
+        temporary_path = manifest_path.with_name(f'{MANIFEST_FILE}.tmp')
+        temporary_path.write_text(json.dumps(self._manifest, indent=2))
+        os.replace(temporary_path, manifest_path)
+
+
+def iter_snapshot_records(snapshot_dir: str | os.PathLike, dataset: str) -> Iterator[dict]:
+    """Read the records of a dataset of an export, one part file at a time.
+
+    Args:
+        snapshot_dir (str | os.PathLike): Output directory of a SnapshotExporter.
+        dataset (str): Dataset name, e.g. 'table' or 'custom_field_value'.
+
+    Returns:
+        Iterator[dict]: Records in shard order.
+
+    """
+    snapshot_dir = Path(snapshot_dir)
+    manifest = json.loads((snapshot_dir / MANIFEST_FILE).read_text())
+
+    for name in sorted(manifest['shards']):
+        shard = manifest['shards'][name]
+        for part_dataset in sorted(shard['files']):
+            if part_dataset != dataset and not part_dataset.startswith(f'{dataset}/'):
+                continue
+            path = snapshot_dir / shard['files'][part_dataset]
+            if manifest['format'] == 'jsonl':
+                with gzip.open(path, 'rt', encoding='utf-8') as part_file:
+                    for line in part_file:
+                        yield json.loads(line)
+            else:
+                import pyarrow.parquet
+
+                json_fields = shard.get('json_fields', {}).get(part_dataset, [])
+                for batch in pyarrow.parquet.ParquetFile(path).iter_batches():
+                    for row in batch.to_pylist():
+                        for name in json_fields:
+                            if row.get(name) is not None:
+                                row[name] = json.loads(row[name])
+                        yield row
@@ -2,6 +2,7 @@
 
 import logging
 import requests
+from typing import Callable
 
 from ..core.async_handler import AsyncHandler
 from ..core.custom_exceptions import *
@@ -25,11 +26,19 @@ class AlationBISource(AsyncHandler):
 
         self._bi_source_endpoint = '/integration/v2/bi/server/'
 
-    def get_bi_servers(self, query_params: BIServerParams = None) -> list[BIServer]:
+    def get_bi_servers(
+            self,
+            query_params: BIServerParams = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list[BIServer]:
         """Get multiple Alation BI Servers.
 
         Args:
             query_params (BIServerParams): REST API Get Filter Values
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             list: Alation BI Servers
@@ -37,7 +46,7 @@ class AlationBISource(AsyncHandler):
         """
         validate_query_params(query_params, BIServerParams)
         params = query_params.generate_params_dict() if query_params else None
-        bi_servers = self.get(self._bi_source_endpoint, query_params=params)
+        bi_servers = self.get(self._bi_source_endpoint, query_params=params, max_items=max_items, stop_when=stop_when)
 
         if bi_servers:
             return [BIServer.from_api_response(bi_server) for bi_server in bi_servers]
@@ -124,12 +133,21 @@ class AlationBISource(AsyncHandler):
             raise
 
 
-    def get_bi_folders(self, bi_server_id: int, query_params: BIFolderParams = None) -> list[BIFolder]:
+    def get_bi_folders(
+            self,
+            bi_server_id: int,
+            query_params: BIFolderParams = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list[BIFolder]:
         """Get multiple Alation BI Folders.
 
         Args:
             bi_server_id (int): Alation BI Server ID to get BI folders from.
             query_params (BIFolderParams): REST API Get Filter Values.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             list: Alation BI Folders
@@ -140,6 +158,8 @@ class AlationBISource(AsyncHandler):
         bi_folders = self.get(
             url = f'{self._bi_source_endpoint}{bi_server_id}/folder/'
             , query_params=params
+            , max_items=max_items
+            , stop_when=stop_when
         )
 
         if bi_folders:
@@ -313,12 +333,21 @@ class AlationBISource(AsyncHandler):
             return [JobDetails.from_api_response(item) for item in async_results]
         return []
 
-    def get_bi_reports(self, bi_server_id: int, query_params: BIReportParams = None) -> list:
+    def get_bi_reports(
+            self,
+            bi_server_id: int,
+            query_params: BIReportParams = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list:
         """Get multiple Alation BI Reports.
 
         Args:
             bi_server_id (int): Alation BI Server ID to get BI reports from.
             query_params (BIReportParams): REST API Get Filter Values.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             list: Alation BI Reports
@@ -327,7 +356,12 @@ class AlationBISource(AsyncHandler):
         validate_query_params(query_params, BIReportParams)
         params = query_params.generate_params_dict() if query_params else None
 
-        bi_reports = self.get(f'{self._bi_source_endpoint}{bi_server_id}/report/', query_params=params)
+        bi_reports = self.get(
+            f'{self._bi_source_endpoint}{bi_server_id}/report/',
+            query_params=params,
+            max_items=max_items,
+            stop_when=stop_when
+        )
 
         if bi_reports:
             return [BIReport.from_api_response(bi_report) for bi_report in bi_reports]
@@ -491,6 +525,8 @@ class AlationBISource(AsyncHandler):
             self
             , bi_server_id: str
             , query_params: Optional[BIReportColumnParams] = None
+            , max_items: int = None
+            , stop_when: Callable[[dict], bool] = None
     ) -> list[BIReportColumn]:
         """
         GET a set of report columns from a specified BI Server.
@@ -498,6 +534,9 @@ class AlationBISource(AsyncHandler):
         Args:
             server_id (str): The ID of the BI server.
             query_params (BIReportColumnParams): REST API Get Filter Values.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             list[BIReportColumn]: A list of ReportColumn objects.
@@ -506,7 +545,7 @@ class AlationBISource(AsyncHandler):
         params = query_params.generate_params_dict() if query_params else None
 
         url = f"{self._bi_source_endpoint}{bi_server_id}/report/column/"
-        bi_report_columns = self.get(url=url, query_params=params)
+        bi_report_columns = self.get(url=url, query_params=params, max_items=max_items, stop_when=stop_when)
 
         if bi_report_columns:
             return [BIReportColumn.from_api_response(data) for data in bi_report_columns]
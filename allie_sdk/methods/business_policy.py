@@ -2,6 +2,7 @@
 
 import logging
 import requests
+from typing import Callable
 
 # from ..core.request_handler import RequestHandler
 from ..core.async_handler import AsyncHandler
@@ -29,11 +30,16 @@ class AlationBusinessPolicy(AsyncHandler):
     def get_business_policies(
             self
             , query_params:BusinessPolicyParams = None
+            , max_items: int = None
+            , stop_when: Callable[[dict], bool] = None
     ) -> list[BusinessPolicy]:
         """Query multiple Alation Business Policies and return their details
         
         Args:
             query_params (BusinessPolicyParams): REST API Business Policy Query Parameters.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
             
         Returns:
             list[BusinessPolicy]: Alation Business Policies
@@ -44,7 +50,12 @@ class AlationBusinessPolicy(AsyncHandler):
         validate_query_params(query_params, BusinessPolicyParams)
         params = query_params.generate_params_dict() if query_params else None
 
-        business_policies = self.get('/integration/v1/business_policies/', query_params = params)
+        business_policies = self.get(
+            '/integration/v1/business_policies/',
+            query_params = params,
+            max_items = max_items,
+            stop_when = stop_when
+        )
 
         if business_policies:
             business_policies_checked = [BusinessPolicy.from_api_response(business_policy) for business_policy in business_policies]
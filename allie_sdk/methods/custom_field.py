@@ -2,10 +2,13 @@
 
 import logging
 import requests
+from typing import Callable
 import urllib.parse
 
 from ..core.async_handler import AsyncHandler
-from ..core.custom_exceptions import validate_query_params, validate_rest_payload
+from ..core.columnar import ColumnarResult
+from ..core.data_structures import field_names
+from ..core.custom_exceptions import validate_query_params, validate_rest_payload, validate_result_format
 from ..models.custom_field_model import *
 from ..models.job_model import *
 
@@ -30,11 +33,19 @@ class AlationCustomField(AsyncHandler):
         self.host = host
         self.session = session
 
-    def get_custom_fields(self, query_params: CustomFieldParams = None) -> list[CustomField]:
+    def get_custom_fields(
+            self,
+            query_params: CustomFieldParams = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list[CustomField]:
         """Get the details of all Alation Custom Fields.
 
         Args:
             query_params (CustomFieldParams): REST API Get Filter Values.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             list: Alation Custom Fields
@@ -45,25 +56,51 @@ class AlationCustomField(AsyncHandler):
         validate_query_params(query_params, CustomFieldParams)
         params = query_params.generate_params_dict() if query_params else None
         
-        custom_fields = self.get('/integration/v2/custom_field/', query_params=params)
+        custom_fields = self.get(
+            '/integration/v2/custom_field/',
+            query_params=params,
+            max_items=max_items,
+            stop_when=stop_when
+        )
         return [CustomField.from_api_response(custom_field) for custom_field in custom_fields]
 
-    def get_custom_field_values(self, query_params: CustomFieldValueParams = None) -> list[CustomFieldValue]:
+    def get_custom_field_values(
+            self,
+            query_params: CustomFieldValueParams = None,
+            format: str = 'objects',
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list[CustomFieldValue] | ColumnarResult:
         """Get the details of all Alation Custom Field Values.
 
         Args:
             query_params (CustomFieldValueParams): REST  API Get Filter Values.
+            format (str): 'objects' to return CustomFieldValue objects or 'columnar' to return
+                a ColumnarResult with one list of values per field.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
-            list: Alation Custom Field Values
+            list | ColumnarResult: Alation Custom Field Values
 
         Raises:
             requests.HTTPError: If the API returns a non-success status code.
+            ValueError: If an unsupported format is requested.
         """
         validate_query_params(query_params, CustomFieldValueParams)
+        validate_result_format(format, ('objects', 'columnar'))
         params = query_params.generate_params_dict() if query_params else None
         
-        custom_field_values = self.get('/integration/v2/custom_field_value/', query_params=params)
+        custom_field_values = self.get(
+            '/integration/v2/custom_field_value/',
+            query_params=params,
+            max_items=max_items,
+            stop_when=stop_when
+        )
+        if format == 'columnar':
+            return ColumnarResult.from_records(
+                custom_field_values or [], field_names(CustomFieldValue))
         return [CustomFieldValue.from_api_response(value) for value in custom_field_values]
 
     def get_a_builtin_custom_field(self, field_name: str) -> CustomField:
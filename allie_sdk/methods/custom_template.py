@@ -2,6 +2,7 @@
 
 import logging
 import requests
+from typing import Callable
 
 from ..core.request_handler import RequestHandler
 from ..models.custom_template_model import *
@@ -21,11 +22,19 @@ class AlationCustomTemplate(RequestHandler):
         """
         super().__init__(session = session, host = host, access_token = access_token)
         
-    def get_custom_templates (self, query_params:CustomTemplateParams = None) -> list[CustomTemplate]:
+    def get_custom_templates(
+            self,
+            query_params:CustomTemplateParams = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list[CustomTemplate]:
         """Use the Custom Template API to retrieve details on all Custom Templates
         
         Args:
             query_params (CustomTemplateParams): REST API Custom Template Query Parameters.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
  
         Returns:
             list[CustomTemplate]: List of Alation Custom Template objects
@@ -36,7 +45,12 @@ class AlationCustomTemplate(RequestHandler):
         validate_query_params(query_params, CustomTemplateParams)
         params = query_params.generate_params_dict() if query_params else None
 
-        custom_templates = self.get(url = '/integration/v1/custom_template/', query_params = params)
+        custom_templates = self.get(
+            url = '/integration/v1/custom_template/',
+            query_params = params,
+            max_items = max_items,
+            stop_when = stop_when
+        )
         
         if custom_templates:
             custom_template_checked = [CustomTemplate.from_api_response(ct) for ct in custom_templates]
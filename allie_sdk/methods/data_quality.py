@@ -2,6 +2,7 @@
 
 import logging
 import requests
+from typing import Callable
 
 from ..core.async_handler import AsyncHandler
 from ..core.custom_exceptions import validate_query_params, validate_rest_payload
@@ -25,11 +26,19 @@ class AlationDataQuality(AsyncHandler):
         """
         super().__init__(access_token, session, host)
 
-    def get_data_quality_fields(self, query_params: DataQualityFieldParams = None) -> list[DataQualityField]:
+    def get_data_quality_fields(
+            self,
+            query_params: DataQualityFieldParams = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list[DataQualityField]:
         """Query multiple Alation Data Quality Fields.
 
         Args:
              query_params (DataQualityFieldParams): REST API Get Filter Values.
+             max_items (int): Stop paginating once this many objects were returned.
+             stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                 after the first object it returns True for.
 
         Returns:
             list: Alation Data Quality Fields
@@ -43,6 +52,8 @@ class AlationDataQuality(AsyncHandler):
         dq_fields = self.get(
             url = '/integration/v1/data_quality/fields/'
             , query_params=params
+            , max_items=max_items
+            , stop_when=stop_when
         )
         return [DataQualityField.from_api_response(item) for item in dq_fields]
 
@@ -82,11 +93,19 @@ class AlationDataQuality(AsyncHandler):
         if async_results:
             return [JobDetailsDataQuality.from_api_response(item) for item in async_results]
 
-    def get_data_quality_values(self, query_params: DataQualityValueParams = None) -> list[DataQualityValue]:
+    def get_data_quality_values(
+            self,
+            query_params: DataQualityValueParams = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list[DataQualityValue]:
         """Query multiple Alation Data Quality Values.
 
         Args:
             query_params (DataQualityValueParams): REST API Get Filter Values.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             list: DataQualityValue Values
@@ -97,7 +116,12 @@ class AlationDataQuality(AsyncHandler):
         validate_query_params(query_params, DataQualityValueParams)
         params = query_params.generate_params_dict() if query_params else None
         
-        dq_values = self.get('/integration/v1/data_quality/values/', query_params=params)
+        dq_values = self.get(
+            '/integration/v1/data_quality/values/',
+            query_params=params,
+            max_items=max_items,
+            stop_when=stop_when
+        )
         
         if dq_values:
             return [DataQualityValue.from_api_response(value) for value in dq_values]
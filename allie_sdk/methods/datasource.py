@@ -1,5 +1,6 @@
 import logging
 import requests
+from typing import Callable
 
 # from ..core.request_handler import RequestHandler
 from ..core.request_handler import RequestHandler
@@ -29,11 +30,19 @@ class AlationDatasource(RequestHandler):
         """
         super().__init__(session = session, host = host, access_token=access_token)
 
-    def get_ocf_datasources(self, query_params:OCFDatasourceParams = None) -> list[OCFDatasource]:
+    def get_ocf_datasources(
+            self,
+            query_params:OCFDatasourceParams = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list[OCFDatasource]:
         """Query multiple Alation datasources and return their details
         
         Args:
             query_params (OCFDatasourceParams): REST API Datasources Query Parameters.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
             
         Returns:
             list[OCFDatasource]: Alation Datasources
@@ -44,18 +53,31 @@ class AlationDatasource(RequestHandler):
         validate_query_params(query_params, OCFDatasourceParams)
         params = query_params.generate_params_dict() if query_params else None
 
-        datasources = self.get(url = '/integration/v2/datasource/', query_params = params)
+        datasources = self.get(
+            url = '/integration/v2/datasource/',
+            query_params = params,
+            max_items = max_items,
+            stop_when = stop_when
+        )
 
         if datasources:
             datasources_checked = [OCFDatasource.from_api_response(datasource) for datasource in datasources]
             return datasources_checked
         return []
 
-    def get_native_datasources(self, query_params:NativeDatasourceParams = None) -> list[NativeDatasource]:
+    def get_native_datasources(
+            self,
+            query_params:NativeDatasourceParams = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list[NativeDatasource]:
         """Query multiple Alation datasources and return their details
         
         Args:
             query_params (NativeDatasourceParams): REST API Datasources Query Parameters.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
             
         Returns:
             list[NativeDatasource]: Alation NativeDatasources
@@ -66,7 +88,12 @@ class AlationDatasource(RequestHandler):
         validate_query_params(query_params, NativeDatasourceParams)
         params = query_params.generate_params_dict() if query_params else None
 
-        datasources = self.get(url = '/integration/v1/datasource/', query_params = params)
+        datasources = self.get(
+            url = '/integration/v1/datasource/',
+            query_params = params,
+            max_items = max_items,
+            stop_when = stop_when
+        )
 
         if datasources:
             datasources_checked = [NativeDatasource.from_api_response(datasource) for datasource in datasources]
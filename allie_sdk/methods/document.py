@@ -1,9 +1,11 @@
 import logging
 import requests
+from typing import Callable
 
 # from ..core.request_handler import RequestHandler
 from ..core.async_handler import AsyncHandler
 from ..core.custom_exceptions import *
+from ..core.data_structures import LazyModel
 from ..models.document_model import *
 from ..models.custom_field_model import *
 from ..models.custom_template_model import *
@@ -23,24 +25,44 @@ class AlationDocument(AsyncHandler):
         """
         super().__init__(session = session, host = host, access_token=access_token)
 
-    def get_documents(self, query_params:DocumentParams = None) -> list[Document]:
+    def get_documents(
+        self
+        , query_params:DocumentParams = None
+        , format: str = 'objects'
+        , max_items: int = None
+        , stop_when: Callable[[dict], bool] = None
+    ) -> list[Document] | list[LazyModel]:
         """Query multiple Alation Documents and return their details
         
         Args:
             query_params (DocumentParams): REST API Documents Query Parameters.
+            format (str): 'objects' to return Document objects or 'lazy' to return
+                LazyModel proxies that parse fields on access.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
             
         Returns:
-            list[Document]: Alation Documents
+            list[Document] | list[LazyModel]: Alation Documents
             
         Raises:
             requests.HTTPError: If the API returns a non-success status code.
+            ValueError: If an unsupported format is requested.
         """
 
         validate_query_params(query_params, DocumentParams)
+        validate_result_format(format, ('objects', 'lazy'))
         params = query_params.generate_params_dict() if query_params else None
 
-        documents = self.get('/integration/v2/document/', query_params = params)
+        documents = self.get(
+            '/integration/v2/document/',
+            query_params = params,
+            max_items = max_items,
+            stop_when = stop_when
+        )
 
+        if format == 'lazy':
+            return [LazyModel(Document, document) for document in documents or []]
         if documents:
             documents_checked = [Document.from_api_response(document) for document in documents]
             return documents_checked
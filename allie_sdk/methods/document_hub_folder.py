@@ -1,5 +1,6 @@
 import logging
 import requests
+from typing import Callable
 
 # from ..core.request_handler import RequestHandler
 from ..core.async_handler import AsyncHandler
@@ -26,10 +27,15 @@ class AlationDocumentHubFolder(AsyncHandler):
     def get_document_hub_folders(
             self
             , query_params:DocumentHubFolderParams = None
+            , max_items: int = None
+            , stop_when: Callable[[dict], bool] = None
     ) -> list[DocumentHubFolder]:
         """Query multiple Alation Document Hub Folders and return their details
         Args:
             query_params (DocumentHubFolderParams): REST API Documents Query Parameters.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
         Returns:
             list: Alation Documents
         """
@@ -37,7 +43,12 @@ class AlationDocumentHubFolder(AsyncHandler):
         validate_query_params(query_params, DocumentHubFolderParams)
         params = query_params.generate_params_dict() if query_params else None
 
-        document_hub_folders = self.get('/integration/v2/folder/', query_params = params)
+        document_hub_folders = self.get(
+            '/integration/v2/folder/',
+            query_params = params,
+            max_items = max_items,
+            stop_when = stop_when
+        )
 
         if document_hub_folders:
             document_hub_folders_checked = [DocumentHubFolder.from_api_response(document_hub_folder) for document_hub_folder in document_hub_folders]
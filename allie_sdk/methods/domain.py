@@ -2,6 +2,7 @@
 
 import logging
 import requests
+from typing import Callable
 
 
 from ..core.request_handler import RequestHandler
@@ -42,11 +43,16 @@ class AlationDomain(AsyncHandler):
     def get_domains(
         self
         , query_params: DomainParams = None
+        , max_items: int = None
+        , stop_when: Callable[[dict], bool] = None
     ) -> list[Domain]:
         """Get the details of all Alation Domain.
 
         Args:
             query_params (DomainParams): REST API Get Filter Values.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             list: Alation Domain
@@ -59,6 +65,8 @@ class AlationDomain(AsyncHandler):
         domains = self.get(
             url = '/integration/v2/domain/'
             , query_params = params
+            , max_items=max_items
+            , stop_when=stop_when
         )
 
         if domains:
@@ -2,6 +2,7 @@
 
 import logging
 import requests
+from typing import Callable
 
 from ..core.async_handler import AsyncHandler
 from ..core.custom_exceptions import validate_query_params, validate_rest_payload
@@ -25,11 +26,19 @@ class AlationGlossaryTerm(AsyncHandler):
         """
         super().__init__(access_token, session, host)
 
-    def get_glossary_terms(self, query_params: GlossaryTermParams = None) -> list[GlossaryTerm]:
+    def get_glossary_terms(
+            self,
+            query_params: GlossaryTermParams = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list[GlossaryTerm]:
         """Get the details of all Alation Glossary Terms.
 
         Args:
             query_params (GlossaryTermParams): REST API Get Filter Values.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             list: Alation Glossary Terms
@@ -38,7 +47,12 @@ class AlationGlossaryTerm(AsyncHandler):
         try:
             validate_query_params(query_params, GlossaryTermParams)
             params = query_params.generate_params_dict() if query_params else None
-            glossary_terms = self.get('/integration/v2/term/', query_params=params)
+            glossary_terms = self.get(
+                '/integration/v2/term/',
+                query_params=params,
+                max_items=max_items,
+                stop_when=stop_when
+            )
 
             if glossary_terms:
                 return [GlossaryTerm.from_api_response(term) for term in glossary_terms]
@@ -2,6 +2,7 @@
 
 import logging
 import requests
+from typing import Callable
 
 from ..core.request_handler import RequestHandler
 from ..core.custom_exceptions import validate_query_params
@@ -19,11 +20,19 @@ class AlationGroup(RequestHandler):
         """
         super().__init__(session = session, host = host, access_token = access_token)
 
-    def get_groups(self, query_params:GroupParams = None) -> list[Group]:
+    def get_groups(
+            self,
+            query_params:GroupParams = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list[Group]:
         """Get Alation groups.
 
         Args:
             query_params (GroupParams, optional): Query parameters for filtering groups. Defaults to None.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             list[Group]: List of Alation groups.
@@ -34,7 +43,12 @@ class AlationGroup(RequestHandler):
         validate_query_params(query_params, GroupParams)
         params = query_params.generate_params_dict() if query_params else None
 
-        groups = self.get(url = '/integration/v1/group/', query_params = params)
+        groups = self.get(
+            url = '/integration/v1/group/',
+            query_params = params,
+            max_items = max_items,
+            stop_when = stop_when
+        )
 
         if groups:
             groups_checked = [Group.from_api_response(g) for g in groups]
@@ -2,6 +2,7 @@
 
 import logging
 import requests
+from typing import Callable
 
 from ..core.request_handler import RequestHandler
 from ..core.custom_exceptions import *
@@ -24,11 +25,16 @@ class AlationPolicyGroup(RequestHandler):
     def get_policy_groups(
             self
             , query_params: PolicyGroupParams = None
+            , max_items: int = None
+            , stop_when: Callable[[dict], bool] = None
         ) -> list[PolicyGroup]:
         """Get policy groups.
 
         Args:
             query_params (PolicyGroupParams): REST API Get Filter Values.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             list[PolicyGroup]: List of policy groups.
@@ -40,7 +46,12 @@ class AlationPolicyGroup(RequestHandler):
         params = query_params.generate_params_dict() if query_params else None
 
         # Note: The policy group API endpoint does not have a trailing slash! It won't work with one. Status: Jan 2024
-        policy_groups = self.get('/integration/v1/policy_group', query_params = params)
+        policy_groups = self.get(
+            '/integration/v1/policy_group',
+            query_params = params,
+            max_items = max_items,
+            stop_when = stop_when
+        )
 
         if policy_groups:
             policy_groups_result = [PolicyGroup.from_api_response(pg) for pg in policy_groups]
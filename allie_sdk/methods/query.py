@@ -2,6 +2,7 @@
 
 import logging
 import requests
+from typing import Callable
 
 from ..core.request_handler import RequestHandler
 from ..core.custom_exceptions import InvalidPostBody, validate_rest_payload, validate_query_params
@@ -59,12 +60,17 @@ class AlationQuery(RequestHandler):
     def get_queries(
         self
         , query_params: QueryParams = None
+        , max_items: int = None
+        , stop_when: Callable[[dict], bool] = None
     ) -> list[Query]:
         """
         Get a queries based on certain search parameters
 
         Args:
             query_params (QueryParams): The query search parameters.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             Query: The Query object.
@@ -76,7 +82,9 @@ class AlationQuery(RequestHandler):
 
         queries = self.get(
             url=f"/integration/v1/query/",
-            query_params = params
+            query_params = params,
+            max_items = max_items,
+            stop_when = stop_when
         )
 
         if queries:
@@ -2,9 +2,15 @@
 
 import logging
 import requests
+from typing import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 
 from ..core.async_handler import AsyncHandler
-from ..core.custom_exceptions import validate_query_params, validate_rest_payload
+from ..core.columnar import ColumnarResult
+from ..core.data_structures import LazyModel, field_names, projection_record
+from ..core.rdbms_diff import RDBMS_DIFF_TYPES, RDBMSDiff, coalesce_patch_items, diff_rdbms_items
+from ..core.rdbms_loader import LoadBatch, RDBMSLoadResult, build_load_batches, run_load_batches
+from ..core.custom_exceptions import validate_query_params, validate_rest_payload, validate_result_format
 from ..models.rdbms_model import (
 
     Schema, SchemaItem, SchemaParams, SchemaPatchItem,
@@ -17,6 +23,13 @@ from ..models.job_model import *
 
 LOGGER = logging.getLogger('allie_sdk_logger')
 
+# object type -> (endpoint, query params class, model class)
+RDBMS_SCAN_TYPES = {
+    'schema': ('/integration/v2/schema/', SchemaParams, Schema),
+    'table': ('/integration/v2/table/', TableParams, Table),
+    'column': ('/integration/v2/column/', ColumnParams, Column),
+}
+
 
 class AlationRDBMS(AsyncHandler):
     """Alation REST API Relational Integration Methods."""
@@ -32,24 +45,41 @@ class AlationRDBMS(AsyncHandler):
         """
         super().__init__(access_token, session, host)
 
-    def get_schemas(self, query_params: SchemaParams = None) -> list[Schema]:
+    def get_schemas(
+            self,
+            query_params: SchemaParams = None,
+            format: str = 'objects',
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None,
+            fields: list[str] = None
+    ) -> list[Schema] | list[LazyModel] | list[tuple] | ColumnarResult:
         """Query multiple Alation RDBMS Schemas.
 
         Args:
             query_params (SchemaParams): REST API Get Filter Values.
+            format (str): 'objects' to return Schema objects, 'lazy' to return LazyModel
+                proxies that parse fields on access or 'columnar' to return a
+                ColumnarResult with one list of values per field.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
+            fields (list[str]): Only request these Schema fields (e.g. ['id', 'key']) and return
+                lightweight SchemaRecord named tuples, or a ColumnarResult of these fields for
+                format='columnar'. Values are returned as-is from the API response. Cannot be
+                combined with format='lazy'.
 
         Returns:
-            list: Alation RDBMS Schemas.
+            list | ColumnarResult: Alation RDBMS Schemas.
 
         """
         try:
             validate_query_params(query_params, SchemaParams)
-            params = query_params.generate_params_dict() if query_params else None
-            schemas = self.get('/integration/v2/schema/', query_params=params)
+            validate_result_format(format)
+            params = query_params.generate_params_dict() if query_params else {}
+            projection = self._apply_projection(params, Schema, fields, format)
+            schemas = self.get('/integration/v2/schema/', query_params=params, max_items=max_items, stop_when=stop_when)
 
-            if schemas:
-                return [Schema.from_api_response(schema) for schema in schemas]
-            return []
+            return self._convert_records(schemas, Schema, format, projection)
         except requests.exceptions.HTTPError:
             # Re-raise the error
             raise
@@ -98,24 +128,41 @@ class AlationRDBMS(AsyncHandler):
             return [JobDetailsRdbms.from_api_response(item) for item in async_results]
         return []
 
-    def get_tables(self, query_params: TableParams = None) -> list[Table]:
+    def get_tables(
+            self,
+            query_params: TableParams = None,
+            format: str = 'objects',
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None,
+            fields: list[str] = None
+    ) -> list[Table] | list[LazyModel] | list[tuple] | ColumnarResult:
         """Query multiple Alation RDBMS Tables.
 
         Args:
             query_params (TableParams): REST API Get Filter Values.
+            format (str): 'objects' to return Table objects, 'lazy' to return LazyModel
+                proxies that parse fields on access or 'columnar' to return a
+                ColumnarResult with one list of values per field.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
+            fields (list[str]): Only request these Table fields (e.g. ['id', 'key']) and return
+                lightweight TableRecord named tuples, or a ColumnarResult of these fields for
+                format='columnar'. Values are returned as-is from the API response. Cannot be
+                combined with format='lazy'.
 
         Returns:
-            list: Alation RDBMS Tables.
+            list | ColumnarResult: Alation RDBMS Tables.
 
         """
         try:
             validate_query_params(query_params, TableParams)
-            params = query_params.generate_params_dict() if query_params else None
-            tables = self.get('/integration/v2/table/', query_params=params)
+            validate_result_format(format)
+            params = query_params.generate_params_dict() if query_params else {}
+            projection = self._apply_projection(params, Table, fields, format)
+            tables = self.get('/integration/v2/table/', query_params=params, max_items=max_items, stop_when=stop_when)
 
-            if tables:
-                return [Table.from_api_response(table) for table in tables]
-            return []
+            return self._convert_records(tables, Table, format, projection)
         except requests.exceptions.HTTPError:
             # Re-raise the error
             raise
@@ -164,34 +211,54 @@ class AlationRDBMS(AsyncHandler):
             return [JobDetailsRdbms.from_api_response(item) for item in async_results]
         return []
 
-    def get_columns(self, query_params: ColumnParams = None) -> list[Column]:
+    def get_columns(
+            self,
+            query_params: ColumnParams = None,
+            format: str = 'objects',
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None,
+            fields: list[str] = None
+    ) -> list[Column] | list[LazyModel] | list[tuple] | ColumnarResult:
         """Query multiple Alation RDBMS Columns.
 
         Args:
             query_params (ColumnParams): REST API Get Filter Values.
+            format (str): 'objects' to return Column objects, 'lazy' to return LazyModel
+                proxies that parse fields on access or 'columnar' to return a
+                ColumnarResult with one list of values per field.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
+            fields (list[str]): Only request these Column fields (e.g. ['id', 'key']) and return
+                lightweight ColumnRecord named tuples, or a ColumnarResult of these fields for
+                format='columnar'. Values are returned as-is from the API response. Cannot be
+                combined with format='lazy'.
 
         Returns:
-            list: Alation RDBMS Tables.
+            list | ColumnarResult: Alation RDBMS Columns.
 
         """
         try:
             validate_query_params(query_params, ColumnParams)
-            params = query_params.generate_params_dict() if query_params else None
-            columns = self.get('/integration/v2/column/', query_params=params)
+            validate_result_format(format)
+            params = query_params.generate_params_dict() if query_params else {}
+            projection = self._apply_projection(params, Column, fields, format)
+            columns = self.get('/integration/v2/column/', query_params=params, max_items=max_items, stop_when=stop_when)
 
-            if columns:
-                return [Column.from_api_response(column) for column in columns]
-            return []
+            return self._convert_records(columns, Column, format, projection)
         except requests.exceptions.HTTPError:
             # Re-raise the error
             raise
 
-    def patch_columns(self, ds_id: int, columns: list[ColumnPatchItem]) -> list[JobDetailsRdbms]:
+    def patch_columns(self, ds_id: int, columns: list[ColumnPatchItem], coalesce: bool = True) -> list[JobDetailsRdbms]:
         """Patch (Update) Alation Column Objects.
 
         Args:
             ds_id (int): ID of the Alation Columns' Parent Datasource.
             columns (list): Alation Columns to be updated.
+            coalesce (bool): Merge the items updating the same column (matched by id or key) into
+                one item before sending them. Later items overwrite the fields they set, custom
+                fields are merged by field id.
 
         Returns:
             list[JobDetailsRdbms]: result of the job
@@ -201,6 +268,8 @@ class AlationRDBMS(AsyncHandler):
         """
         item: ColumnPatchItem
         validate_rest_payload(columns, (ColumnPatchItem,))
+        if coalesce:
+            columns = coalesce_patch_items(columns)
         payload = [item.generate_api_patch_payload() for item in columns]
         async_results = self.async_patch(f'/integration/v2/column/?ds_id={ds_id}', payload)
 
@@ -239,6 +308,55 @@ class AlationRDBMS(AsyncHandler):
         except requests.exceptions.HTTPError:
             raise
 
+    def get_child_columns_many(
+            self,
+            column_ids: Iterable[int],
+            query_params: ChildColumnParams = None,
+            max_workers: int = 8
+    ) -> Iterator[tuple[int, ColumnChildren | None]]:
+        """Fetch the child columns of many STRUCT columns concurrently.
+
+        Duplicate ids are fetched once. The results are yielded as soon as they arrive, so their
+        order differs from the order of the ids. At most two requests per worker are queued at a
+        time, so column_ids can be a generator and memory use stays bounded. Rate limited
+        requests (429) are retried with backoff by the session like every other request.
+
+        Args:
+            column_ids (Iterable[int]): IDs of the parent columns.
+            query_params (ChildColumnParams): Optional filters applied to every column.
+            max_workers (int): Number of concurrent requests. Keep it at or below 10, the
+                connection pool size of the session.
+
+        Returns:
+            Iterator[tuple[int, ColumnChildren | None]]: (column id, child columns) per distinct column id.
+
+        Raises:
+            requests.HTTPError: If the API returns a non-success status code.
+        """
+        validate_query_params(query_params, ChildColumnParams)
+        seen = set()
+        unique_ids = (column_id for column_id in column_ids if not (column_id in seen or seen.add(column_id)))
+        max_pending = 2 * max_workers
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        pending = {}
+        try:
+            while True:
+                for column_id in unique_ids:
+                    pending[executor.submit(self.get_child_columns, column_id, query_params)] = column_id
+                    if len(pending) >= max_pending:
+                        break
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+        finally:
+            # stop the queued requests if the caller stops iterating or a request failed
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def patch_child_columns(
             self,
             ds_id: int,
@@ -319,3 +437,244 @@ class AlationRDBMS(AsyncHandler):
         if async_results:
             return [JobDetailsRdbms.from_api_response(item) for item in async_results]
         return []
+
+    def parallel_scan(
+            self,
+            object_type: str,
+            query_params: SchemaParams | TableParams | ColumnParams = None,
+            shards: int = 8,
+            ordered: bool = True,
+            format: str = 'objects'
+    ) -> list | ColumnarResult:
+        """Query Alation RDBMS Schemas, Tables or Columns with concurrent id range scans.
+
+        The lowest and highest id matching the query parameters are probed first. The id range
+        is then split into shards of equal width which are fetched concurrently, each with its
+        own pagination, and the results are merged.
+
+        Args:
+            object_type (str): 'schema', 'table' or 'column'.
+            query_params (SchemaParams | TableParams | ColumnParams): REST API Get Filter Values matching the object type.
+            shards (int): Number of id ranges fetched concurrently.
+            ordered (bool): Return the objects ordered by id. Otherwise the shards are merged as they complete.
+            format (str): 'objects', 'lazy' or 'columnar', see get_schemas.
+
+        Returns:
+            list | ColumnarResult: Alation RDBMS Objects.
+
+        Raises:
+            ValueError: If the object type or the result format is not supported.
+            requests.HTTPError: If the API returns a non-success status code.
+
+        """
+        if object_type not in RDBMS_SCAN_TYPES:
+            raise ValueError(f"Unsupported object type '{object_type}'. Supported types: {tuple(RDBMS_SCAN_TYPES)}.")
+        url, params_class, model = RDBMS_SCAN_TYPES[object_type]
+        validate_query_params(query_params, params_class)
+        validate_result_format(format)
+        params = query_params.generate_params_dict() if query_params else {}
+
+        min_id = self._probe_id(url, params, 'id')
+        if min_id is None:
+            return self._convert_records([], model, format)
+        max_id = self._probe_id(url, params, '-id')
+
+        shards = max(1, min(shards, max_id - min_id + 1))
+        bounds = [min_id + (max_id + 1 - min_id) * shard // shards for shard in range(shards + 1)]
+        LOGGER.info('Scanning %s ids %s to %s in %s shards.', object_type, min_id, max_id, shards)
+
+        def scan_shard(lower: int, upper: int) -> list:
+            shard_params = {**params, 'id__gte': lower, 'id__lt': upper}
+            return self.get(url, query_params=shard_params) or []
+
+        records = []
+        with ThreadPoolExecutor(max_workers=shards) as executor:
+            futures = [executor.submit(scan_shard, bounds[i], bounds[i + 1]) for i in range(shards)]
+            if ordered:
+                for future in futures:
+                    records.extend(sorted(future.result(), key=lambda record: record['id']))
+            else:
+                for future in as_completed(futures):
+                    records.extend(future.result())
+
+        return self._convert_records(records, model, format)
+
+    def sync_metadata(
+            self,
+            ds_id: int,
+            items: list[SchemaItem] | list[TableItem] | list[ColumnItem],
+            current: list[dict] = None,
+            dry_run: bool = False
+    ) -> RDBMSDiff:
+        """Bring Alation RDBMS Schemas, Tables or Columns to a desired state, only sending what changed.
+
+        The desired items are compared with the current objects by key: new objects are posted,
+        changed objects are patched with the changed fields only and unchanged objects are skipped.
+
+        Args:
+            ds_id (int): ID of the Alation Objects' Parent Datasource.
+            items (list[SchemaItem] | list[TableItem] | list[ColumnItem]): Desired objects of one type.
+            current (list[dict]): Current objects as API response dicts, e.g. from
+                CatalogMirror.get_records. All objects of the data source are fetched if not set.
+            dry_run (bool): Only compute the changes, do not post or patch anything.
+
+        Returns:
+            RDBMSDiff: Posted items, patch items, number of unchanged objects and the job results.
+
+        Raises:
+            requests.HTTPError: If the API returns a non-success status code.
+        """
+        if not items:
+            return RDBMSDiff()
+        validate_rest_payload(items, tuple(RDBMS_DIFF_TYPES))
+        # all items must be of the same type
+        item_type = type(items[0])
+        validate_rest_payload(items, (item_type,))
+        object_type = RDBMS_DIFF_TYPES[item_type][0]
+
+        if current is None:
+            current = self.get(RDBMS_SCAN_TYPES[object_type][0], query_params={'ds_id': ds_id}) or []
+
+        diff = diff_rdbms_items(items, current)
+        LOGGER.info('Syncing %s %s objects: %s to post, %s to patch, %s unchanged.',
+                    len(items), object_type, len(diff.post), len(diff.patch), diff.unchanged)
+        if dry_run:
+            return diff
+
+        post_method, patch_method = {
+            'schema': (self.post_schemas, self.patch_schemas),
+            'table': (self.post_tables, self.patch_tables),
+            'column': (self.post_columns, self.patch_columns),
+        }[object_type]
+        if diff.post:
+            diff.jobs.extend(post_method(ds_id, diff.post))
+        if diff.patch:
+            diff.jobs.extend(patch_method(ds_id, diff.patch))
+
+        return diff
+
+    def load_hierarchy(
+            self,
+            ds_id: int,
+            schemas: list[SchemaItem] = None,
+            tables: list[TableItem] = None,
+            columns: list[ColumnItem] = None,
+            child_columns: list[RootColumnChildrenPatchItem] = None,
+            max_concurrency: int = 4,
+            batch_size: int = None
+    ) -> RDBMSLoadResult:
+        """Load schemas, tables, columns and child columns with the levels of different schemas overlapping.
+
+        The objects are split into batches per schema. The table batches of a schema are posted as
+        soon as the job of its schema batch succeeded, the column batches once all table batches
+        of the schema succeeded and the child columns once all column batches of the schema
+        succeeded. Batches of other schemas keep running meanwhile. If a batch fails, the batches
+        depending on it are skipped.
+
+        Args:
+            ds_id (int): ID of the parent datasource.
+            schemas (list[SchemaItem]): Schemas to be created or updated.
+            tables (list[TableItem]): Tables to be created or updated.
+            columns (list[ColumnItem]): Columns to be created or updated.
+            child_columns (list[RootColumnChildrenPatchItem]): Child columns of STRUCT columns to be updated.
+            max_concurrency (int): Number of batches loaded at the same time across all levels.
+            batch_size (int): Maximum number of objects per job. Defaults to the page size.
+
+        Returns:
+            RDBMSLoadResult: Job details of all loaded batches, the failed batches and the skipped batches.
+
+        """
+        schemas, tables, columns, child_columns = schemas or [], tables or [], columns or [], child_columns or []
+        validate_rest_payload(schemas, (SchemaItem,))
+        validate_rest_payload(tables, (TableItem,))
+        validate_rest_payload(columns, (ColumnItem,))
+        validate_rest_payload(child_columns, (RootColumnChildrenPatchItem,))
+
+        batches = build_load_batches(schemas, tables, columns, child_columns, batch_size or self.page_size)
+        LOGGER.info('Loading %s schemas, %s tables, %s columns and %s child columns in %s batches.',
+                    len(schemas), len(tables), len(columns), len(child_columns), len(batches))
+
+        stage_methods = {
+            'schema': self.post_schemas,
+            'table': self.post_tables,
+            'column': self.post_columns,
+            'child_column': self.patch_root_child_columns,
+        }
+
+        def load_batch(batch: LoadBatch) -> list[JobDetailsRdbms]:
+            return stage_methods[batch.stage](ds_id, batch.items)
+
+        return run_load_batches(batches, load_batch, max_concurrency)
+
+    def _probe_id(self, url: str, params: dict, order_by: str) -> int | None:
+        """Return the id of the first object for the given ordering.
+
+        Args:
+            url (str): GET API Call URL.
+            params (dict): REST API Get Filter Values.
+            order_by (str): 'id' for the lowest, '-id' for the highest id.
+
+        Returns:
+            int | None: Object id or None if no object matches the filters.
+
+        """
+        probe = self.get(url, query_params={**params, 'order_by': order_by, 'limit': 1}, pagination=False)
+        if probe:
+            return probe[0]['id']
+        return None
+
+    @staticmethod
+    def _apply_projection(params: dict, model: type, fields: list[str] = None, format: str = 'objects') -> tuple | None:
+        """Restrict the API response to the projected fields.
+
+        Args:
+            params (dict): REST API Get Filter Values, updated in place.
+            model (type): Model class of the records.
+            fields (list[str]): Field names to request.
+            format (str): Requested result format.
+
+        Returns:
+            tuple | None: Projected field names or None if all fields are requested.
+
+        Raises:
+            ValueError: If a field is not a field of the model or the format is 'lazy'.
+
+        """
+        if not fields:
+            return None
+        if format == 'lazy':
+            # projected records are already lightweight, a LazyModel of a partial record would
+            # return None for every field that was not requested
+            raise ValueError("'fields' cannot be combined with format='lazy', use format='objects' or 'columnar'.")
+        projection = tuple(fields)
+        # validates the field names
+        projection_record(model, projection)
+        params['values'] = ','.join(projection)
+        return projection
+
+    @staticmethod
+    def _convert_records(records: list, model: type, format: str, projection: tuple = None) -> list | ColumnarResult:
+        """Convert API response dicts into the requested result format.
+
+        Args:
+            records (list): API response dicts.
+            model (type): Model class of the records.
+            format (str): 'objects', 'lazy' or 'columnar'.
+            projection (tuple): Field names of projected records, see _apply_projection.
+
+        Returns:
+            list | ColumnarResult: Converted records.
+
+        """
+        if projection:
+            if format == 'columnar':
+                return ColumnarResult.from_records(records or [], projection)
+            record_class = projection_record(model, projection)
+            return [record_class(*(record.get(name) for name in projection)) for record in records or []]
+        if format == 'columnar':
+            return ColumnarResult.from_records(records or [], field_names(model))
+        if format == 'lazy':
+            return [LazyModel(model, record) for record in records or []]
+        if records:
+            return [model.from_api_response(record) for record in records]
+        return []
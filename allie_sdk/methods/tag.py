@@ -4,6 +4,7 @@ import logging
 from urllib.parse import quote
 
 import requests
+from typing import Callable
 
 from ..core.custom_exceptions import InvalidPostBody, validate_query_params, validate_rest_payload
 from ..core.request_handler import RequestHandler
@@ -26,11 +27,19 @@ class AlationTag(RequestHandler):
             raise InvalidPostBody("'tag_name' must be provided.")
         return quote(tag_name, safe="")
 
-    def get_tags(self, query_params: TagParams = None) -> list[Tag]:
+    def get_tags(
+            self,
+            query_params: TagParams = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list[Tag]:
         """Get tags in the Alation catalog.
 
         Args:
             query_params (TagParams, optional): Filters for listing tags, including object scoping.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             list[Tag]: Matching tags.
@@ -42,6 +51,8 @@ class AlationTag(RequestHandler):
             url="/integration/tag/",
             query_params=params,
             pagination=False,
+            max_items=max_items,
+            stop_when=stop_when
         )
 
         if tags:
@@ -68,13 +79,18 @@ class AlationTag(RequestHandler):
         return Tag.from_api_response(tag)
 
     def get_objects_tagged_with_specific_tag(
-        self, tag_name: str, query_params: TaggedObjectParams = None
+        self, tag_name: str, query_params: TaggedObjectParams = None,
+        max_items: int = None,
+        stop_when: Callable[[dict], bool] = None
     ) -> list[TaggedObject]:
         """Get all objects tagged with a specific tag.
 
         Args:
             tag_name (str): Tag name. Special characters are URL encoded automatically.
             query_params (TaggedObjectParams, optional): Filters for the tagged object list.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             list[TaggedObject]: Tagged objects for the supplied tag name.
@@ -87,6 +103,8 @@ class AlationTag(RequestHandler):
             url=f"/integration/tag/{encoded_tag_name}/subject/",
             query_params=params,
             pagination=False,
+            max_items=max_items,
+            stop_when=stop_when
         )
 
         if objects:
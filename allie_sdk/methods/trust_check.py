@@ -2,6 +2,7 @@
 
 import logging
 import requests
+from typing import Callable
 
 from ..core.request_handler import RequestHandler
 from ..core.custom_exceptions import *
@@ -25,11 +26,19 @@ class AlationTrustChecks(RequestHandler):
         """
         super().__init__(session, host, access_token=access_token)
 
-    def get_trust_checks(self, query_params: TrustCheckFlagParams = None) -> list[TrustCheckFlag]:
+    def get_trust_checks(
+            self,
+            query_params: TrustCheckFlagParams = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list[TrustCheckFlag]:
         """Query multiple Alation Trust Check Flags.
 
         Args:
             query_params (TrustCheckParams): REST API Get Filter Values.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             list: Alation Trust Checks
@@ -38,7 +47,12 @@ class AlationTrustChecks(RequestHandler):
         try:
             validate_query_params(query_params, TrustCheckFlagParams)
             params = query_params.generate_params_dict() if query_params else None
-            trust_checks = self.get(url = '/integration/flag/', query_params=params)
+            trust_checks = self.get(
+                url = '/integration/flag/',
+                query_params=params,
+                max_items=max_items,
+                stop_when=stop_when
+            )
 
             if trust_checks:
                 return [TrustCheckFlag.from_api_response(check) for check in trust_checks]
@@ -2,6 +2,7 @@
 
 import logging
 import requests
+from typing import Callable
 
 from ..core.request_handler import RequestHandler
 from ..core.custom_exceptions import validate_query_params
@@ -34,11 +35,19 @@ class AlationUser(RequestHandler):
         else:
             self._user_endpoint = '/integration/v1/user/'
 
-    def get_users(self, query_params: UserParams = None) -> list[User]:
+    def get_users(
+            self,
+            query_params: UserParams = None,
+            max_items: int = None,
+            stop_when: Callable[[dict], bool] = None
+    ) -> list[User]:
         """Get multiple Alation Users.
 
         Args:
             query_params (UserParams): REST API Get Filter Values.
+            max_items (int): Stop paginating once this many objects were returned.
+            stop_when (Callable[[dict], bool]): Called with every API response dict. Stop paginating
+                after the first object it returns True for.
 
         Returns:
             list: Alation Users
@@ -48,7 +57,7 @@ class AlationUser(RequestHandler):
         """
         validate_query_params(query_params, UserParams)
         params = query_params.generate_params_dict() if query_params else None
-        users = self.get(self.user_endpoint, query_params=params)
+        users = self.get(self.user_endpoint, query_params=params, max_items=max_items, stop_when=stop_when)
 
         if users:
             return [User.from_api_response(user) for user in users]
@@ -1,13 +1,37 @@
 """Alation REST API Virtual Data Source Methods."""
 
 import logging
+import os
+import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Iterator
 
 from ..core.custom_exceptions import validate_query_params, validate_rest_payload
 from ..models.virtual_datasource_model import *
 from ..core.async_handler import AsyncHandler
+from ..core.jsonl import iter_jsonl_chunks, iter_jsonl_chunks_parallel
 from ..models.job_model import *
 
+VDS_OBJECT_TYPES = (
+    VirtualDataSourceSchema
+    , VirtualDataSourceTable
+    , VirtualDataSourceView
+    , VirtualDataSourceColumn
+    , VirtualDataSourceIndex
+)
+
+# load order of the object types within a partition, parents first
+VDS_OBJECT_RANK = {
+    VirtualDataSourceSchema: 0
+    , VirtualDataSourceTable: 1
+    , VirtualDataSourceView: 1
+    , VirtualDataSourceColumn: 2
+    , VirtualDataSourceIndex: 3
+}
+# 'ds_id.schema' prefix of an object key, schema names containing dots are double-quoted
+SCHEMA_KEY_PATTERN = re.compile(r'[^.]*\.(?:"(?:[^"]|"")*"|[^.]*)')
+
 LOGGER = logging.getLogger('allie_sdk_logger')
 
 
@@ -34,6 +58,8 @@ class AlationVirtualDataSource(AsyncHandler):
             , ds_id: int
             , vds_objects: list
             , query_params: VirtualDataSourceParams = None
+            , stream: bool = False
+            , workers: int = None
     ) -> list[JobDetailsVirtualDatasourcePost]:
         """Post (Create/Update/Delete) Alation Virtual Data source objects
 
@@ -45,6 +71,11 @@ class AlationVirtualDataSource(AsyncHandler):
                     query_params.set_title_descs = "true" - use to enable Title and Description updates
                     query_params.remove_not_seen = "false" - set to true to remove the metadata objects that are not
                                                             specified in the list of vds objects (delete)
+            stream (bool): Serialize the objects while uploading them with chunked transfer encoding
+                    instead of building the complete payload in memory first. vds_objects can then be any
+                    iterable (e.g. a generator). Objects are validated while they are sent.
+            workers (int): Serialize the objects in shards with this many worker processes (threads on
+                    free-threaded Python builds). The order of the objects is preserved.
 
         Returns:
             List of JobDetailsVirtualDatasourcePost: Status report of the executed background jobs.
@@ -54,42 +85,132 @@ class AlationVirtualDataSource(AsyncHandler):
         """
         validate_query_params(query_params, VirtualDataSourceParams)
         params = query_params.generate_params_dict() if query_params else None
-        validate_rest_payload(
-            vds_objects
-            , expected_types = (
-                VirtualDataSourceSchema
-                , VirtualDataSourceTable
-                , VirtualDataSourceView
-                , VirtualDataSourceColumn
-                , VirtualDataSourceIndex
-            )
-        )
+
+        if stream:
+            vds_objects = self._iter_items(vds_objects)
+        else:
+            validate_rest_payload(vds_objects, expected_types = VDS_OBJECT_TYPES)
 
         item: VirtualDataSourceItem
-        payload_d = [item.generate_api_post_payload() for item in vds_objects]
-        # add line feeds between json payload dicts for jsonl format
-        payload_jsonl = '\n'.join(json.dumps(p) for p in payload_d)
-        LOGGER.debug(payload_jsonl)
+        if workers:
+            chunks = iter_jsonl_chunks_parallel(vds_objects, workers=workers)
+            payload_jsonl = chunks if stream else b''.join(chunks)
+        elif stream:
+            payload_jsonl = iter_jsonl_chunks(item.generate_api_post_payload() for item in vds_objects)
+        else:
+            payload_d = [item.generate_api_post_payload() for item in vds_objects]
+            # add line feeds between json payload dicts for jsonl format
+            payload_jsonl = '\n'.join(json.dumps(p) for p in payload_d)
+            LOGGER.debug(payload_jsonl)
+
         async_results = self.async_post_data_payload(f'{self._vds_endpoint}{ds_id}',
                                                     data=payload_jsonl, query_params=params)
 
         return [JobDetailsVirtualDatasourcePost.from_api_response(item) for item in async_results]
 
+    def post_metadata_partitioned(
+            self
+            , ds_id: int
+            , vds_objects: list
+            , query_params: VirtualDataSourceParams = None
+            , max_partition_size: int = None
+            , max_workers: int = 1
+    ) -> list[JobDetailsVirtualDatasourcePost]:
+        """Post (Create/Update) Alation Virtual Data source objects as one job per schema
+
+        The objects are grouped by schema and every group is ordered so that schemas are loaded before
+        their tables and views, which are loaded before their columns and indexes. Each group is uploaded
+        as an independent job. Use JobDetailsVirtualDatasourcePostResult.merge to combine the results.
+
+        Args:
+            ds_id: (int): Virtual Data Source ID for the metadata objects
+            vds_objects (AlationVirtualDataSourceItem): A list of Alation virtual data source objects to
+                    be added/updated.
+            query_params: (VirtualDataSourceParams): a VirtualDataSourceParams object
+                    query_params.set_title_descs = "true" - use to enable Title and Description updates
+                    query_params.remove_not_seen is not supported, every job would remove the objects of
+                                                 all other partitions
+            max_partition_size (int): Split schemas with more objects into consecutive jobs of this size.
+                    The jobs of one schema always run one after the other.
+            max_workers (int): Number of schemas uploaded concurrently.
+
+        Returns:
+            List of JobDetailsVirtualDatasourcePost: Status report of the executed background jobs, in partition order.
+
+        Raises:
+            ValueError: If query_params.remove_not_seen is enabled.
+            requests.HTTPError: If the API returns a non-success status code.
+        """
+        validate_query_params(query_params, VirtualDataSourceParams)
+        if query_params and str(query_params.remove_not_seen).lower() == 'true':
+            raise ValueError('remove_not_seen cannot be used with partitioned uploads, '
+                             'each partition would remove the objects of all other partitions.')
+        validate_rest_payload(vds_objects, expected_types = VDS_OBJECT_TYPES)
+
+        partitions = self._partition_objects(vds_objects, max_partition_size)
+        LOGGER.info('Uploading %s virtual data source objects in %s partitions.', len(vds_objects), len(partitions))
+
+        def load_partition(batches: list) -> list:
+            results = []
+            for batch in batches:
+                results.extend(self.post_metadata(ds_id, batch, query_params=query_params))
+            return results
+
+        if max_workers > 1 and len(partitions) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                partition_results = list(executor.map(load_partition, partitions))
+        else:
+            partition_results = [load_partition(batches) for batches in partitions]
+
+        return [job for results in partition_results for job in results]
+
+    @staticmethod
+    def _partition_objects(vds_objects: list, max_partition_size: int = None) -> list[list[list]]:
+        """Group the virtual data source objects by schema with parent objects ahead of their children.
+
+        Args:
+            vds_objects (list): Alation virtual data source objects.
+            max_partition_size (int): Maximum number of objects per batch.
+
+        Returns:
+            list[list[list]]: Batches of objects per schema, in order of the first object of each schema.
+
+        """
+        schemas = {}
+        item: VirtualDataSourceItem
+        for item in vds_objects:
+            schema_key = SCHEMA_KEY_PATTERN.match(item.key or '').group(0)
+            schemas.setdefault(schema_key, []).append(item)
+
+        partitions = []
+        for items in schemas.values():
+            # stable sort, objects of the same type keep their original order
+            items.sort(key=lambda vds_object: VDS_OBJECT_RANK[type(vds_object)])
+            size = max_partition_size or len(items)
+            partitions.append([items[i:i + size] for i in range(0, len(items), size)])
+
+        return partitions
+
     def post_metadata_jsonl(
             self
             , ds_id: int
-            , payload: str
+            , payload: str | bytes | os.PathLike | IO
             , query_params: VirtualDataSourceParams = None
+            , compress: bool = False
     ) -> list[JobDetailsVirtualDatasourcePost]:
         """Post (Create/Update/Delete) Alation Virtual Data source objects
 
         Args:
             ds_id: (int): Virtual Data Source ID for the metadata objects
-            payload (str): A list of Alation virtual data source object definitions as a jsonl payload
+            payload (str | bytes | os.PathLike | IO): A list of Alation virtual data source object definitions
+                    as a jsonl payload, the path to a jsonl file (e.g. pathlib.Path) or a file object opened for
+                    reading. Files are streamed as the request body instead of being loaded into memory.
             query_params: (VirtualDataSourceParams): a VirtualDataSourceParams object
                     query_params.set_title_descs = "true" - use to enable Title and Description updates
                     query_params.remove_not_seen = "false" - set to true to remove the metadata objects that are not
                                                             specified in the list of vds objects (delete)
+            compress (bool): Gzip compress the payload on the fly and send it with 'Content-Encoding: gzip'.
+                The payload is sent again uncompressed if the server rejects compressed bodies.
 
         Returns:
             List of JobDetailsVirtualDatasourcePost: Status report of the executed background jobs.
@@ -99,10 +220,26 @@ class AlationVirtualDataSource(AsyncHandler):
         """
         validate_query_params(query_params, VirtualDataSourceParams)
         params = query_params.generate_params_dict() if query_params else None
-        async_results = self.async_post_data_payload(f'{self._vds_endpoint}{ds_id}', data=payload, query_params=params)
+        async_results = self.async_post_jsonl_payload(
+            f'{self._vds_endpoint}{ds_id}', payload, query_params=params, compress=compress)
 
         return [JobDetailsVirtualDatasourcePost.from_api_response(item) for item in async_results]
 
+    @staticmethod
+    def _iter_items(vds_objects) -> Iterator[VirtualDataSourceItem]:
+        """Validate the virtual data source objects one by one while they are consumed.
+
+        Args:
+            vds_objects (Iterable): Alation virtual data source objects.
+
+        Returns:
+            Iterator[VirtualDataSourceItem]: The validated objects.
+
+        """
+        for item in vds_objects:
+            validate_rest_payload((item,), VDS_OBJECT_TYPES)
+            yield item
+
 @property
 def vds_endpoint(self) -> str:
     """Return the Bool Config to use the Alation REST API Virtual Data Source Endpoint.
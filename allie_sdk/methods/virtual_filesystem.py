@@ -1,11 +1,15 @@
 """Alation REST API Virtual File System Methods."""
 
 import logging
+import os
 import requests
+from typing import IO, Callable, Iterator
 
 from ..core.custom_exceptions import validate_query_params, validate_rest_payload
 from ..models.virtual_filesystem_model import *
 from ..core.async_handler import AsyncHandler
+from ..core.filesystem_crawler import CrawlProgress, FileSystemCrawler
+from ..core.jsonl import iter_jsonl_chunks, iter_jsonl_chunks_parallel
 from ..models.job_model import *
 
 LOGGER = logging.getLogger('allie_sdk_logger')
@@ -28,13 +32,24 @@ class AlationVirtualFileSystem(AsyncHandler):
 
         self._vfs_endpoint = '/api/v1/bulk_metadata/file_upload/'
 
-    def post_metadata(self, fs_id: int, vfs_objects: list) -> list[JobDetails]:
+    def post_metadata(
+            self,
+            fs_id: int,
+            vfs_objects: list,
+            stream: bool = False,
+            workers: int = None
+    ) -> list[JobDetails]:
         """Post (Create/Update/Delete) Alation Virtual Data source objects
 
         Args:
             fs_id: (int): Virtual Data Source ID for the metadata objects
             vfs_objects: [AlationVirtualFileSystemItem]: A list of Alation virtual file system objects to
                     be added/updated or deleted.
+            stream (bool): Serialize the objects while uploading them with chunked transfer encoding
+                    instead of building the complete payload in memory first. vfs_objects can then be any
+                    iterable (e.g. a generator). Objects are validated while they are sent.
+            workers (int): Serialize the objects in shards with this many worker processes (threads on
+                    free-threaded Python builds). The order of the objects is preserved.
 
         Returns:
             List of JobDetails: Status report of the executed background jobs.
@@ -42,25 +57,91 @@ class AlationVirtualFileSystem(AsyncHandler):
         Raises:
             requests.HTTPError: If the API returns a non-success status code.
         """
-        # allow a list object for empty payloads
-        validate_rest_payload(vfs_objects, (VirtualFileSystemItem, list))
+        if stream:
+            vfs_objects = self._iter_items(vfs_objects)
+        else:
+            # allow a list object for empty payloads
+            validate_rest_payload(vfs_objects, (VirtualFileSystemItem, list))
+
         item: VirtualFileSystemItem
-        payload_d = [item.generate_api_post_payload() for item in vfs_objects]
-        # add line feeds between json payload dicts for jsonl format
         # add a preceding \n to force an empty payload if vds_objects is empty for delete operations
-        payload_jsonl = '\n' + '\n'.join(json.dumps(p) for p in payload_d)
+        if workers:
+            chunks = iter_jsonl_chunks_parallel(vfs_objects, workers=workers, leading_newline=True)
+            payload_jsonl = chunks if stream else b''.join(chunks)
+        elif stream:
+            payload_jsonl = iter_jsonl_chunks(
+                (item.generate_api_post_payload() for item in vfs_objects), leading_newline=True)
+        else:
+            payload_d = [item.generate_api_post_payload() for item in vfs_objects]
+            # add line feeds between json payload dicts for jsonl format
+            payload_jsonl = '\n' + '\n'.join(json.dumps(p) for p in payload_d)
+            LOGGER.debug(payload_jsonl)
 
-        LOGGER.debug(payload_jsonl)
         async_results = self.async_post_data_payload(f'{self._vfs_endpoint}{fs_id}/', data=payload_jsonl)
 
         return [JobDetails.from_api_response(item) for item in async_results]
 
-    def post_metadata_jsonl(self, fs_id: int, payload: str) -> list[JobDetails]:
+    def post_directory_tree(
+            self,
+            fs_id: int,
+            root_path: str | os.PathLike,
+            workers: int = 8,
+            mtime_index_path: str | os.PathLike = None,
+            progress_callback: Callable[[CrawlProgress], None] = None,
+            filesystem=None,
+            skip_unreadable: bool = False
+    ) -> list[JobDetails]:
+        """Crawl a directory tree and upload it as the content of an Alation Virtual File System
+
+        The directories are listed by parallel workers and the objects are streamed into a single
+        chunked upload while the crawl is running, so memory use does not grow with the number of files.
+        The crawl root becomes '/' in Alation. Objects missing from the upload are removed from the
+        virtual file system.
+
+        Args:
+            fs_id: (int): Virtual File System ID for the metadata objects
+            root_path (str | os.PathLike): Directory to crawl.
+            workers (int): Number of directories listed concurrently.
+            mtime_index_path (str | os.PathLike): SQLite file storing the directory listings. Directories that
+                were not modified since the last crawl are not scanned again.
+            progress_callback (Callable[[CrawlProgress], None]): Called with the crawl progress every 10,000 objects.
+            filesystem (any): fsspec-like filesystem object implementing ls(path, detail=True) to crawl instead
+                of the local file system.
+            skip_unreadable (bool): Leave out directories that cannot be listed. Their subtrees are
+                removed from the virtual file system. By default the crawl and the upload are aborted.
+
+        Returns:
+            List of JobDetails: Status report of the executed background jobs.
+
+        Raises:
+            requests.HTTPError: If the API returns a non-success status code.
+            UnreadableDirectory: If a directory cannot be listed and skip_unreadable is not set.
+        """
+        crawler = FileSystemCrawler(
+            root_path,
+            workers=workers,
+            mtime_index_path=mtime_index_path,
+            progress_callback=progress_callback,
+            filesystem=filesystem,
+            skip_unreadable=skip_unreadable
+        )
+        return self.post_metadata(fs_id, crawler.crawl(), stream=True)
+
+    def post_metadata_jsonl(
+            self,
+            fs_id: int,
+            payload: str | bytes | os.PathLike | IO,
+            compress: bool = False
+    ) -> list[JobDetails]:
         """Post (Create/Update/Delete) Alation Virtual Data source objects
 
         Args:
             fs_id: (int): Virtual File System ID for the metadata objects
-            payload (str): A list of Alation virtual file system object definitions as a jsonl payload
+            payload (str | bytes | os.PathLike | IO): A list of Alation virtual file system object definitions
+                as a jsonl payload, the path to a jsonl file (e.g. pathlib.Path) or a file object opened for
+                reading. Files are streamed as the request body instead of being loaded into memory.
+            compress (bool): Gzip compress the payload on the fly and send it with 'Content-Encoding: gzip'.
+                The payload is sent again uncompressed if the server rejects compressed bodies.
 
         Returns:
             List of JobDetails: Status report of the executed background jobs.
@@ -68,9 +149,24 @@ class AlationVirtualFileSystem(AsyncHandler):
         Raises:
             requests.HTTPError: If the API returns a non-success status code.
         """
-        async_results = self.async_post_data_payload(f'{self._vfs_endpoint}{fs_id}', data=payload)
+        async_results = self.async_post_jsonl_payload(f'{self._vfs_endpoint}{fs_id}', payload, compress=compress)
         return [JobDetails.from_api_response(item) for item in async_results]
 
+    @staticmethod
+    def _iter_items(vfs_objects) -> Iterator[VirtualFileSystemItem]:
+        """Validate the virtual file system objects one by one while they are consumed.
+
+        Args:
+            vfs_objects (Iterable): Alation virtual file system objects.
+
+        Returns:
+            Iterator[VirtualFileSystemItem]: The validated objects.
+
+        """
+        for item in vfs_objects:
+            validate_rest_payload((item,), (VirtualFileSystemItem,))
+            yield item
+
 @property
 def vfs_endpoint(self) -> str:
     """Return the Bool Config to use the Alation REST API Virtual Data Source Endpoint.
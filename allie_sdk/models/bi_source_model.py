@@ -214,7 +214,7 @@ class BIReportItem(BaseBISourceItemWithSharedFields):
 
 # BI REPORT COLUMNS
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BIObjectBase(BaseClass):
     """Common properties of a BI Object"""
     id: int = field(metadata={'description': 'The auto-generated id of the object'})
@@ -226,7 +226,7 @@ class BIObjectBase(BaseClass):
     bi_object_type: str = field(metadata={'description': 'The type of the object, as defined by the BI Server'})
     description_at_source: str = field(metadata={'description': 'Object description on the BI Server'})
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BIColumnObjectBase(BIObjectBase):
     """Common properties of a BI Column Object"""
     data_type: str = field(default=None, metadata={'description': 'The type of the column data.'})
@@ -234,7 +234,7 @@ class BIColumnObjectBase(BIObjectBase):
     expression: str = field(default=None, metadata={'description': 'The expression used to transform the data into a column'})
     values: list[str] = field(default_factory=list, metadata={'description': 'Sample values from the column'})
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BIReportColumn(BIColumnObjectBase):
     """Properties of a Report Column Object"""
     report: Optional[str] = field(default=None, metadata={'description': 'external_id of the parent report. Note that the report must exist on Alation to properly update this'})
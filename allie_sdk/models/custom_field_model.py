@@ -144,7 +144,7 @@ class CustomFieldParams(BaseParams):
     tooltip_text__icontains: set = field(default_factory=set)
 
 
-@dataclass(kw_only = True)
+@dataclass(kw_only = True, slots=True)
 class CustomFieldStringValue:
     value: str = field(default=None)
 
@@ -154,7 +154,7 @@ class CustomFieldStringValueItem(CustomFieldStringValue):
         return self.value
 
 
-@dataclass(kw_only = True)
+@dataclass(kw_only = True, slots=True)
 class CustomFieldDictValue:
     otype: str = field(default=None)
     oid: int = field(default=None)
@@ -168,7 +168,7 @@ class CustomFieldDictValueItem(CustomFieldDictValue):
         }
 
 
-@dataclass(kw_only = True)
+@dataclass(kw_only = True, slots=True)
 class _BaseCustomFieldValue(BaseClass):
     field_id: int = field(default=None)
     ts_updated: datetime = field(default=None)
@@ -176,7 +176,7 @@ class _BaseCustomFieldValue(BaseClass):
     oid: int = field(default=None)
 
 
-@dataclass(kw_only = True)
+@dataclass(kw_only = True, slots=True)
 class CustomFieldValue(_BaseCustomFieldValue):
     field_name:str = field(default=None) # this is only returned by some endpoints, e.g. documents API
     value: CustomFieldStringValue | list[CustomFieldStringValue | CustomFieldDictValue] = field(default=None)
@@ -2,9 +2,8 @@
 
 from dataclasses import dataclass, field
 from typing import Literal
-from ..core.data_structures import BaseClass
+from ..core.data_structures import BaseClass, init_parameters
 import json
-import inspect
 
 @dataclass
 class AsyncJobDetails(BaseClass):
@@ -47,9 +46,10 @@ class JobDetailsBIServerPostResult(BaseClass):
 
     @classmethod
     def _from_api_response(cls, body_params: dict):
+        parameters = init_parameters(cls)
         return cls(**{
             k.replace(' ', ''): v for k, v in body_params.items()
-            if k.replace(' ', '') in inspect.signature(cls).parameters
+            if k.replace(' ', '') in parameters
         })
 
 @dataclass(kw_only = True)
@@ -256,6 +256,34 @@ class JobDetailsVirtualDatasourcePostResult(BaseClass):
     error_objects:list = field(default_factory = list)
     error: str = field(default = None)
 
+    @classmethod
+    def merge(cls, jobs: list) -> 'JobDetailsVirtualDatasourcePostResult':
+        """Merge the results of several virtual data source jobs, e.g. of a partitioned upload.
+
+        Args:
+            jobs (list): JobDetailsVirtualDatasourcePost objects.
+
+        Returns:
+            JobDetailsVirtualDatasourcePostResult: Summed object counts, all error objects and errors.
+                Jobs that did not succeed and returned no result add their status and message to the errors.
+
+        """
+        merged = cls(number_received = 0, updated_objects = 0)
+        errors = []
+        for job in jobs:
+            result = job.result
+            if not isinstance(result, JobDetailsVirtualDatasourcePostResult):
+                if job.status != 'successful':
+                    errors.append(f'{job.status}: {job.msg}' if job.msg else str(job.status))
+                continue
+            merged.number_received += result.number_received or 0
+            merged.updated_objects += result.updated_objects or 0
+            merged.error_objects.extend(result.error_objects or [])
+            if result.error:
+                errors.append(str(result.error))
+        merged.error = '\n'.join(errors) if errors else None
+        return merged
+
 @dataclass(kw_only = True)
 class JobDetailsVirtualDatasourcePost(JobDetails):
     def __post_init__(self):
@@ -7,7 +7,7 @@ from ..core.custom_exceptions import InvalidPostBody, validate_rest_payload
 from ..core.data_structures import BaseClass, BaseParams
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseRDBMS(BaseClass):
     id: int = field(default=None)
     name: str = field(default=None)
@@ -60,7 +60,7 @@ class BaseRDBMSParams(BaseParams):
     ds_id__lte: set = field(default_factory=set)
     exclude_deleted_ref: bool = field(default=None)
 
-@dataclass
+@dataclass(slots=True)
 class Schema(BaseRDBMS):
     db_comment: str = field(default=None)
 
@@ -114,7 +114,7 @@ class SchemaPatchItem(BaseRDBMSItem):
 class SchemaParams(BaseRDBMSParams):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class Table(BaseRDBMS):
     table_type: str = field(default=None)
     schema_id: int = field(default=None)
@@ -234,7 +234,7 @@ class TableParams(BaseRDBMSParams):
     schema_name__iendswith: set = field(default_factory=set)
 
 
-@dataclass(kw_only = True)
+@dataclass(kw_only = True, slots=True)
 class ColumnIndex(BaseClass):
     isPrimaryKey: bool = field(default=None)
     isForeignKey: bool = field(default=None)
@@ -254,7 +254,7 @@ class ColumnIndex(BaseClass):
 
         return payload
 
-@dataclass
+@dataclass(slots=True)
 class Column(BaseRDBMS):
     column_type: str = field(default=None)
     column_comment: str = field(default=None)
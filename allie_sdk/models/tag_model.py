@@ -23,7 +23,7 @@ class Tag(BaseClass):
             self.ts_created = self.convert_timestamp(self.ts_created)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaggedObjectRef(BaseClass):
     """Reference to an Alation object tagged with a specific tag."""
 
@@ -32,7 +32,7 @@ class TaggedObjectRef(BaseClass):
     id: int | str = field(default=None)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaggedObject(BaseClass):
     """Tagged object response item."""
 
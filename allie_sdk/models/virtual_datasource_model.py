@@ -1,10 +1,9 @@
 """Alation REST API Virtual Data Source Model."""
-import dataclasses
 import json
 from dataclasses import dataclass, field
 
 from ..core.custom_exceptions import InvalidPostBody
-from ..core.data_structures import BaseClass, BaseParams
+from ..core.data_structures import BaseClass, BaseParams, non_null_fields_dict
 
 @dataclass
 class VirtualDataSource(BaseClass):
@@ -26,13 +25,13 @@ class VirtualDataSourceItem(BaseClass):
         if self.key is None:
             raise InvalidPostBody("'key' is required for metadata object payload.")
 
-        return dataclasses.asdict(self, dict_factory=lambda x: {k: v for (k, v) in x if v is not None})
+        return non_null_fields_dict(self)
 
 @dataclass
 class VirtualDataSourceSchema(VirtualDataSourceItem):
 
     def generate_api_post_payload(self) -> dict:
-        return dataclasses.asdict(self, dict_factory=lambda x: {k: v for (k, v) in x if v is not None})
+        return non_null_fields_dict(self)
 
 @dataclass
 class VirtualDataSourceTable(VirtualDataSourceItem):
@@ -51,7 +50,7 @@ class VirtualDataSourceTable(VirtualDataSourceItem):
     table_comment: str = field(default=None)
 
     def generate_api_post_payload(self) -> dict:
-        return_dict = dataclasses.asdict(self, dict_factory=lambda x: {k: v for (k, v) in x if v is not None})
+        return_dict = non_null_fields_dict(self)
         return_dict["table_type"] = self._table_type
         return return_dict
 
@@ -72,7 +71,7 @@ class VirtualDataSourceView(VirtualDataSourceItem):
     table_comment: str = field(default=None)
 
     def generate_api_post_payload(self) -> dict:
-        return_dict = dataclasses.asdict(self, dict_factory=lambda x: {k: v for (k, v) in x if v is not None})
+        return_dict = non_null_fields_dict(self)
         return_dict["table_type"] = self._table_type
         return return_dict
 
@@ -84,7 +83,7 @@ class VirtualDataSourceColumn(VirtualDataSourceItem):
     nullable: bool = field(default=None)
 
     def generate_api_post_payload(self) -> dict:
-        return dataclasses.asdict(self, dict_factory=lambda x: {k: v for (k, v) in x if v is not None})
+        return non_null_fields_dict(self)
 
 @dataclass
 class VirtualDataSourceIndex(VirtualDataSourceItem):
@@ -114,7 +113,7 @@ class VirtualDataSourceIndex(VirtualDataSourceItem):
                 raise InvalidPostBody("'foreign_key_column_names' is required for "
                                       "index POST payload, when is_foreign_key is true.")
 
-        return dataclasses.asdict(self, dict_factory=lambda x: {k: v for (k, v) in x if v is not None})
+        return non_null_fields_dict(self)
 
 
 
@@ -1,10 +1,9 @@
 """Alation REST API Virtual File System Model."""
-import dataclasses
 import json
 from dataclasses import dataclass, field
 
 from ..core.custom_exceptions import InvalidPostBody
-from ..core.data_structures import BaseClass, BaseParams
+from ..core.data_structures import BaseClass, BaseParams, non_null_fields_dict
 
 @dataclass
 class VirtualFileSystem(BaseClass):
@@ -31,6 +30,6 @@ class VirtualFileSystemItem(BaseClass):
         if self.is_directory is None:
             raise InvalidPostBody("'is_directory' is required for the POST payload")
 
-        return dataclasses.asdict(self, dict_factory=lambda x: {k: v for (k, v) in x if v is not None})
+        return non_null_fields_dict(self)
 
 
@@ -0,0 +1,146 @@
+"""Test the Catalog Mirror."""
+import requests
+
+from allie_sdk.core.catalog_mirror import CatalogMirror
+from allie_sdk.core.snapshot_diff import diff_sorted
+from allie_sdk.methods.rdbms import AlationRDBMS
+from allie_sdk.models.rdbms_model import Column, Table
+
+SCHEMAS = [{'id': 1, 'name': 'public', 'ds_id': 7, 'key': '7.public', 'custom_fields': []}]
+TABLES = [
+    {'id': 10, 'name': 'orders', 'ds_id': 7, 'key': '7.public.orders', 'schema_id': 1,
+     'custom_fields': [{'field_id': 3, 'field_name': 'title', 'value': 'Orders'}]},
+    {'id': 11, 'name': 'customers', 'ds_id': 7, 'key': '7.public.customers', 'schema_id': 1, 'custom_fields': []},
+]
+COLUMNS = [
+    {'id': 100, 'name': 'amount', 'ds_id': 7, 'key': '7.public.orders.amount', 'table_id': 10,
+     'custom_fields': []},
+]
+
+
+class TestCatalogMirror:
+
+    def setup_method(self):
+        self.rdbms = AlationRDBMS(access_token='test', session=requests.session(), host='https://test.com')
+        self.mirror = CatalogMirror(self.rdbms, ':memory:', ds_ids=[7])
+
+    def teardown_method(self):
+        self.mirror.close()
+
+    def mock_catalog(self, requests_mock, schemas=SCHEMAS, tables=TABLES, columns=COLUMNS):
+        requests_mock.get('https://test.com/integration/v2/schema/', json=schemas)
+        requests_mock.get('https://test.com/integration/v2/table/', json=tables)
+        requests_mock.get('https://test.com/integration/v2/column/', json=columns)
+
+    def test_refresh_full_sync(self, requests_mock):
+
+        self.mock_catalog(requests_mock)
+        fetched = self.mirror.refresh()
+
+        assert fetched == {'schema': 1, 'table': 2, 'column': 1}
+        assert requests_mock.request_history[0].qs == {'ds_id': ['7'], 'limit': ['1000']}
+        assert self.mirror.count('table') == 2
+
+    def test_lookups(self, requests_mock):
+
+        self.mock_catalog(requests_mock)
+        self.mirror.refresh()
+
+        table = self.mirror.get('table', 10)
+        assert isinstance(table, Table)
+        assert table.key == '7.public.orders'
+        assert self.mirror.get_by_key('column', '7.public.orders.amount') == Column.from_api_response(COLUMNS[0])
+        assert [t.id for t in self.mirror.find('table', parent_id=1)] == [10, 11]
+        assert self.mirror.find('column', ds_id=8) == []
+        assert self.mirror.get('table', 999) is None
+        assert self.mirror.get_records('table', ds_id=7) == TABLES
+
+        values = self.mirror.get_custom_field_values('table', 10)
+        assert len(values) == 1
+        assert values[0].field_id == 3
+        assert values[0].value.value == 'Orders'
+
+    def test_iter_records_diff(self, requests_mock):
+
+        self.mock_catalog(requests_mock)
+        self.mirror.refresh()
+        assert [record['id'] for record in self.mirror.iter_records('table', order_by='key')] == [11, 10]
+
+        renamed = [{**TABLES[0], 'title': 'Orders'}]
+        with CatalogMirror(self.rdbms, ':memory:', ds_ids=[7]) as newer:
+            self.mock_catalog(requests_mock, tables=renamed)
+            newer.refresh()
+            changes = list(diff_sorted(self.mirror.iter_records('table', order_by='key'),
+                                       newer.iter_records('table', order_by='key')))
+
+        assert [(change.change, change.key) for change in changes] == [
+            ('removed', '7.public.customers'), ('changed', '7.public.orders')]
+        assert changes[1].fields == {'title': (None, 'Orders')}
+
+    def test_refresh_delta_sync(self, requests_mock):
+
+        self.mock_catalog(requests_mock)
+        self.mirror.refresh()
+
+        new_table = {'id': 12, 'name': 'items', 'ds_id': 7, 'key': '7.public.items', 'schema_id': 1}
+        self.mock_catalog(requests_mock, schemas=[], tables=[new_table], columns=[])
+        fetched = self.mirror.refresh()
+
+        assert fetched == {'schema': 0, 'table': 1, 'column': 0}
+        table_request = requests_mock.request_history[-2]
+        assert table_request.qs['id__gt'] == ['11']
+        assert self.mirror.count('table') == 3
+
+        # the highest id is kept when a delta returns nothing
+        self.mock_catalog(requests_mock, schemas=[], tables=[], columns=[])
+        self.mirror.refresh()
+        assert requests_mock.request_history[-2].qs['id__gt'] == ['12']
+
+    def test_full_sync_removes_deleted_objects(self, requests_mock):
+
+        self.mock_catalog(requests_mock)
+        self.mirror.refresh()
+
+        self.mock_catalog(requests_mock, tables=TABLES[:1])
+        self.mirror.full_sync()
+
+        assert self.mirror.get('table', 11) is None
+        assert self.mirror.count('table') == 1
+
+    def test_refresh_objects(self, requests_mock):
+
+        self.mock_catalog(requests_mock)
+        self.mirror.refresh()
+
+        updated = {**TABLES[0], 'title': 'All Orders', 'custom_fields': []}
+        requests_mock.get('https://test.com/integration/v2/table/', json=[updated])
+        fetched = self.mirror.refresh_objects('table', [10, 11])
+
+        assert fetched == 1
+        assert requests_mock.last_request.qs['id'] == ['10', '11']
+        assert self.mirror.get('table', 10).title == 'All Orders'
+        assert self.mirror.get_custom_field_values('table', 10) == []
+        assert self.mirror.get('table', 11) is None
+
+    def test_refresh_objects_without_ids(self, requests_mock):
+
+        self.mock_catalog(requests_mock)
+        self.mirror.refresh()
+        requests_made = requests_mock.call_count
+
+        assert self.mirror.refresh_objects('column', []) == 0
+        assert requests_mock.call_count == requests_made
+        assert self.mirror.count('column') == 1
+
+    def test_persistent_mirror(self, requests_mock, tmp_path):
+
+        database_path = tmp_path / 'catalog.db'
+        self.mock_catalog(requests_mock)
+        with CatalogMirror(self.rdbms, database_path, ds_ids=[7]) as mirror:
+            mirror.refresh()
+
+        with CatalogMirror(self.rdbms, database_path, ds_ids=[7]) as mirror:
+            assert mirror.get('schema', 1).name == 'public'
+            self.mock_catalog(requests_mock, schemas=[], tables=[], columns=[])
+            mirror.refresh()
+            assert 'id__gt' in requests_mock.last_request.qs
@@ -0,0 +1,89 @@
+"""Test the Column-oriented Result Containers."""
+import json
+import sys
+import types
+
+import pytest
+
+from allie_sdk.core.columnar import ColumnarResult
+
+
+class TestColumnarResult:
+
+    def setup_method(self):
+        self.records = [
+            {'id': 1, 'key': '6.a', 'nullable': True},
+            {'id': 2, 'key': '6.b'},
+        ]
+
+    def test_from_records(self):
+
+        result = ColumnarResult.from_records(self.records, ['id', 'key', 'nullable'])
+
+        assert result == {'id': [1, 2], 'key': ['6.a', '6.b'], 'nullable': [True, None]}
+        assert result.num_rows == 2
+
+    def test_from_records_empty(self):
+
+        result = ColumnarResult.from_records([], ['id', 'key'])
+
+        assert result == {'id': [], 'key': []}
+        assert result.num_rows == 0
+
+    def test_to_pandas(self):
+
+        pandas = pytest.importorskip('pandas')
+        data_frame = ColumnarResult.from_records(self.records, ['id', 'key']).to_pandas()
+
+        assert isinstance(data_frame, pandas.DataFrame)
+        assert list(data_frame.columns) == ['id', 'key']
+        assert data_frame['id'].tolist() == [1, 2]
+
+    def test_to_arrow(self):
+
+        pyarrow = pytest.importorskip('pyarrow')
+        table = ColumnarResult.from_records(self.records, ['id', 'key']).to_arrow()
+
+        assert isinstance(table, pyarrow.Table)
+        assert table.column('key').to_pylist() == ['6.a', '6.b']
+
+    def test_to_arrow_nested_values(self, monkeypatch):
+
+        records = [
+            {'id': 1, 'custom_fields': [{'field_id': 3, 'value': 'Orders'}], 'index': None},
+            {'id': 2, 'custom_fields': [{'field_id': 8, 'value': [{'otype': 'user', 'oid': 1}]}],
+             'index': {'isPrimaryKey': True}},
+        ]
+        result = ColumnarResult.from_records(records, ['id', 'custom_fields', 'index'])
+        # capture the columns passed to pyarrow, so the test runs without pyarrow
+        monkeypatch.setitem(sys.modules, 'pyarrow', types.SimpleNamespace(table=lambda columns: columns))
+        columns = result.to_arrow()
+
+        assert columns['id'] == [1, 2]
+        assert [json.loads(value) for value in columns['custom_fields']] == result['custom_fields']
+        assert columns['index'] == [None, '{"isPrimaryKey": true}']
+
+    def test_to_arrow_nested_values_pyarrow(self):
+
+        pytest.importorskip('pyarrow')
+        records = [
+            {'id': 1, 'custom_fields': [{'field_id': 3, 'value': 'Orders'}]},
+            {'id': 2, 'custom_fields': [{'field_id': 8, 'value': [{'otype': 'user', 'oid': 1}]}]},
+        ]
+        table = ColumnarResult.from_records(records, ['id', 'custom_fields']).to_arrow()
+
+        assert table.num_rows == 2
+
+    def test_to_pandas_missing_dependency(self, monkeypatch):
+
+        monkeypatch.setitem(sys.modules, 'pandas', None)
+
+        with pytest.raises(ImportError):
+            ColumnarResult.from_records(self.records, ['id']).to_pandas()
+
+    def test_to_arrow_missing_dependency(self, monkeypatch):
+
+        monkeypatch.setitem(sys.modules, 'pyarrow', None)
+
+        with pytest.raises(ImportError):
+            ColumnarResult.from_records(self.records, ['id']).to_arrow()
@@ -59,5 +59,12 @@ class TestCustomExceptions:
         mock_payload = [TestPayload1(), TestPayload2()]
         validate_rest_payload(mock_payload, (TestPayload1, TestPayload2))
 
+    def test_validate_result_format_no_exception(self):
 
+        for result_format in ('objects', 'columnar', 'lazy'):
+            validate_result_format(result_format)
 
+    def test_validate_result_format_raise_exception(self):
+
+        pytest.raises(ValueError, lambda: validate_result_format('rows'))
+        pytest.raises(ValueError, lambda: validate_result_format('columnar', ('objects', 'lazy')))
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 """Test the Core Data Structure Objects."""
 
@@ -5,7 +8,9 @@ import pytest
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 
-from allie_sdk.core.data_structures import BaseClass, BaseParams
+from allie_sdk.core.data_structures import (
+    BaseClass, BaseParams, LazyModel, field_names, init_parameters, non_null_fields_dict, parse_timestamp
+)
 
 
 @dataclass
@@ -16,6 +21,18 @@ class TestClass(BaseClass):
     organization: str = field(default=None)
 
 
+@dataclass
+class TestTimestampClass(BaseClass):
+    __test__ = False
+    id: int = field(default=None)
+    ts_updated: datetime = field(default=None)
+    tags: list = field(default_factory=list)
+
+    def __post_init__(self):
+        if isinstance(self.ts_updated, str):
+            self.ts_updated = self.convert_timestamp(self.ts_updated)
+
+
 @dataclass
 class TestParams(BaseParams):
     __test__ = False
@@ -42,6 +59,21 @@ class TestBaseClass:
 
         assert mock_class == expected_class
 
+    def test_from_api_response_unexpected_values(self):
+
+        mock_api_response = {'id': 1, 'name': 'Alation', 'url': '/test/1/'}
+        mock_class = TestClass.from_api_response(mock_api_response)
+        expected_class = TestClass(id=1, name='Alation')
+
+        assert mock_class == expected_class
+
+    def test_init_parameters_cached_per_class(self):
+
+        parameters = init_parameters(TestClass)
+
+        assert parameters == frozenset({'id', 'name', 'organization'})
+        assert init_parameters(TestClass) is parameters
+
     def test_timezone_conversion_utc(self):
 
         mock_class = TestClass()
@@ -58,6 +90,99 @@ class TestBaseClass:
 
         assert parsed_time == datetime(2023, 11, 6, 8, 26, 7, 928812, tzinfo=timezone(timedelta(days=-1, seconds=57600)))
 
+    def test_timezone_conversion_short_fraction(self):
+
+        mock_class = TestClass()
+
+        assert mock_class.convert_timestamp('2022-12-27T16:44:53.41Z') == datetime(2022, 12, 27, 16, 44, 53, 410000)
+        assert mock_class.convert_timestamp('2023-11-06T08:26:07.9+0530') == datetime(
+            2023, 11, 6, 8, 26, 7, 900000, tzinfo=timezone(timedelta(hours=5, minutes=30)))
+
+    def test_timezone_conversion_unsupported_format(self):
+
+        mock_class = TestClass()
+
+        assert mock_class.convert_timestamp('2022-12-27T16:44:53Z') is None
+        assert mock_class.convert_timestamp('2022-12-27T16:44:53.4141251Z') is None
+        assert mock_class.convert_timestamp('2022-12-27') is None
+        assert mock_class.convert_timestamp(None) is None
+
+    def test_timezone_conversion_memoized(self):
+
+        mock_time = '2021-01-02T03:04:05.123456Z'
+
+        assert parse_timestamp(mock_time) is parse_timestamp(mock_time)
+
+
+class TestPayloadHelpers:
+
+    def test_field_names(self):
+
+        assert field_names(TestClass) == ('id', 'name', 'organization')
+
+    def test_non_null_fields_dict(self):
+
+        tags = ['a', 'b']
+        mock_class = TestTimestampClass(id=1, tags=tags)
+        payload = non_null_fields_dict(mock_class)
+
+        assert payload == {'id': 1, 'tags': ['a', 'b']}
+        # values are not deep copied
+        assert payload['tags'] is tags
+
+
+class TestLazyModel:
+
+    def test_attribute_access(self):
+
+        mock_api_response = {'id': 1, 'ts_updated': '2022-12-27T16:44:53.414125Z'}
+        lazy_model = LazyModel(TestTimestampClass, mock_api_response)
+
+        assert lazy_model.id == 1
+        assert lazy_model.ts_updated == datetime(2022, 12, 27, 16, 44, 53, 414125)
+        assert lazy_model.tags == []
+        assert lazy_model.raw is mock_api_response
+
+    def test_attribute_parsed_once(self):
+
+        lazy_model = LazyModel(TestTimestampClass, {'ts_updated': '2022-12-27T16:44:53.414125Z'})
+
+        assert lazy_model.ts_updated is lazy_model.ts_updated
+
+    def test_unknown_attribute(self):
+
+        lazy_model = LazyModel(TestTimestampClass, {'id': 1, 'unexpected': True})
+
+        with pytest.raises(AttributeError):
+            lazy_model.unexpected
+
+    def test_to_model(self):
+
+        mock_api_response = {'id': 1, 'ts_updated': '2022-12-27T16:44:53.414125Z'}
+        lazy_model = LazyModel(TestTimestampClass, mock_api_response)
+        expected_class = TestTimestampClass.from_api_response(mock_api_response)
+
+        assert lazy_model.to_model() == expected_class
+        assert lazy_model == expected_class
+
+
+    def test_copy(self):
+
+        lazy_model = LazyModel(TestTimestampClass, {'id': 1, 'ts_updated': '2022-12-27T16:44:53.414125Z'})
+        copied = copy.copy(lazy_model)
+
+        assert copied.id == 1
+        assert copied == lazy_model
+        assert copy.deepcopy(lazy_model).raw == lazy_model.raw
+
+    def test_pickle(self):
+
+        lazy_model = LazyModel(TestTimestampClass, {'id': 1, 'ts_updated': '2022-12-27T16:44:53.414125Z'})
+        unpickled = pickle.loads(pickle.dumps(lazy_model))
+
+        assert unpickled.model_class is TestTimestampClass
+        assert unpickled.ts_updated == datetime(2022, 12, 27, 16, 44, 53, 414125)
+
 
 class TestBaseParams:
 
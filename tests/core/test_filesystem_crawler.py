@@ -0,0 +1,114 @@
+"""Test the File System Crawler."""
+import os
+
+import pytest
+
+from allie_sdk.core.custom_exceptions import UnreadableDirectory
+from allie_sdk.core.filesystem_crawler import CrawlProgress, FileSystemCrawler
+
+
+@pytest.fixture
+def directory_tree(tmp_path):
+    (tmp_path / 'var' / 'log').mkdir(parents=True)
+    (tmp_path / 'var' / 'log' / 'boot.log').write_text('booted')
+    (tmp_path / 'var' / 'data.csv').write_text('a,b')
+    (tmp_path / 'etc').mkdir()
+    return tmp_path
+
+
+class FakeFileSystem:
+
+    def __init__(self, listings: dict):
+        self.listings = listings
+
+    def ls(self, path, detail=True):
+        if self.listings[path] is None:
+            raise PermissionError(f'Permission denied: {path}')
+        return self.listings[path]
+
+
+class TestFileSystemCrawler:
+
+    def test_crawl(self, directory_tree):
+
+        items = list(FileSystemCrawler(directory_tree, workers=2).crawl())
+
+        assert [(item.path, item.name, item.is_directory) for item in items] == [
+            ('/', 'etc', True),
+            ('/', 'var', True),
+            ('/var', 'data.csv', False),
+            ('/var', 'log', True),
+            ('/var/log', 'boot.log', False),
+        ]
+        assert items[4].size_in_bytes == 6
+        assert items[4].generate_api_post_payload()['ts_last_modified']
+        assert items[1].size_in_bytes is None
+
+    def test_crawl_progress(self, directory_tree):
+
+        reports = []
+        crawler = FileSystemCrawler(directory_tree, progress_callback=reports.append, progress_interval=2)
+        list(crawler.crawl())
+
+        assert len(reports) >= 2
+        assert crawler.progress == CrawlProgress(directories=4, files=2)
+
+    def test_crawl_mtime_index(self, directory_tree, tmp_path_factory):
+
+        index_path = tmp_path_factory.mktemp('index') / 'mtime_index.sqlite'
+        crawler = FileSystemCrawler(directory_tree, mtime_index_path=index_path)
+        first = list(crawler.crawl())
+        assert crawler.progress.reused_directories == 0
+
+        second = list(crawler.crawl())
+        assert second == first
+        assert crawler.progress.reused_directories == 4
+
+        (directory_tree / 'var' / 'log' / 'kern.log').write_text('kernel')
+        os.utime(directory_tree / 'var' / 'log', ns=(0, 0))
+        third = list(crawler.crawl())
+        assert [item.name for item in third if item.path == '/var/log'] == ['boot.log', 'kern.log']
+        assert crawler.progress.reused_directories == 3
+
+    def test_crawl_filesystem_object(self):
+
+        filesystem = FakeFileSystem({
+            'bucket': [
+                {'name': 'bucket/raw', 'type': 'directory', 'size': 0},
+                {'name': 'bucket/readme.md', 'type': 'file', 'size': 12, 'mtime': 0},
+            ],
+            'bucket/raw': [{'name': 'bucket/raw/a.parquet', 'type': 'file', 'size': 100}],
+        })
+
+        items = list(FileSystemCrawler('bucket', filesystem=filesystem).crawl())
+
+        assert [(item.path, item.name, item.size_in_bytes) for item in items] == [
+            ('/', 'raw', None),
+            ('/', 'readme.md', 12),
+            ('/raw', 'a.parquet', 100),
+        ]
+        assert items[1].ts_last_modified == '1970-01-01 00:00:00'
+
+    def test_crawl_filesystem_object_mtime_index(self):
+
+        with pytest.raises(ValueError):
+            FileSystemCrawler('bucket', filesystem=FakeFileSystem({}), mtime_index_path='index.sqlite')
+
+    def test_crawl_unreadable_directory(self):
+
+        filesystem = FakeFileSystem({
+            'bucket': [
+                {'name': 'bucket/private', 'type': 'directory', 'size': 0},
+                {'name': 'bucket/readme.md', 'type': 'file', 'size': 12},
+            ],
+            'bucket/private': None,
+        })
+
+        with pytest.raises(UnreadableDirectory):
+            list(FileSystemCrawler('bucket', filesystem=filesystem).crawl())
+
+        crawler = FileSystemCrawler('bucket', filesystem=filesystem, skip_unreadable=True)
+        items = list(crawler.crawl())
+
+        assert [item.name for item in items] == ['private', 'readme.md']
+        assert crawler.progress.failed_directories == 1
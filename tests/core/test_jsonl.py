@@ -0,0 +1,98 @@
+"""Test the JSON Lines Streaming Helpers."""
+import gzip
+import io
+import json
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from allie_sdk.core.jsonl import (
+    _create_executor, iter_file_chunks, iter_gzip_chunks, iter_jsonl_chunks, iter_jsonl_chunks_parallel
+)
+from allie_sdk.models.virtual_datasource_model import VirtualDataSourceColumn
+
+
+class TestJsonl:
+
+    def test_iter_jsonl_chunks(self):
+
+        payloads = [{'key': '1.a'}, {'key': '1.a.b', 'title': 'B'}]
+        body = b''.join(iter_jsonl_chunks(payloads))
+
+        assert body == '\n'.join(json.dumps(p) for p in payloads).encode('utf-8')
+
+    def test_iter_jsonl_chunks_chunk_size(self):
+
+        payloads = ({'key': f'1.schema_{i}'} for i in range(100))
+        chunks = list(iter_jsonl_chunks(payloads, chunk_size=256))
+
+        assert len(chunks) > 1
+        assert all(len(chunk) < 256 + 32 for chunk in chunks)
+        assert [json.loads(line) for line in b''.join(chunks).split(b'\n')] == \
+               [{'key': f'1.schema_{i}'} for i in range(100)]
+
+    def test_iter_jsonl_chunks_leading_newline(self):
+
+        assert b''.join(iter_jsonl_chunks([{'name': 'a'}], leading_newline=True)) == b'\n{"name": "a"}'
+        assert list(iter_jsonl_chunks([], leading_newline=True)) == [b'\n']
+
+    def test_iter_jsonl_chunks_empty(self):
+
+        assert list(iter_jsonl_chunks([])) == []
+
+    def test_iter_jsonl_chunks_non_ascii(self):
+
+        body = b''.join(iter_jsonl_chunks([{'title': 'Überblick'}]))
+
+        assert json.loads(body.decode('utf-8')) == {'title': 'Überblick'}
+
+    def test_iter_file_chunks(self):
+
+        assert list(iter_file_chunks(io.BytesIO(b'{"a": 1}\n{"b": 2}'), chunk_size=8)) == \
+               [b'{"a": 1}', b'\n{"b": 2', b'}']
+        assert list(iter_file_chunks(io.StringIO('{"name": "\u00e9"}'))) == ['{"name": "\u00e9"}'.encode('utf-8')]
+        assert list(iter_file_chunks(io.BytesIO(b''))) == []
+
+    def test_iter_gzip_chunks(self):
+
+        chunks = [json.dumps({'key': f'1.schema_{i}'}).encode('utf-8') for i in range(100)]
+
+        assert gzip.decompress(b''.join(iter_gzip_chunks(chunks))) == b''.join(chunks)
+        assert gzip.decompress(b''.join(iter_gzip_chunks([]))) == b''
+
+    def test_iter_jsonl_chunks_parallel_keeps_order(self):
+
+        items = [VirtualDataSourceColumn(key=f'1.s.t.column_{i}', column_type='INT') for i in range(250)]
+        chunks = list(iter_jsonl_chunks_parallel((item for item in items), workers=2, shard_size=20))
+
+        assert len(chunks) == 13
+        assert b''.join(chunks) == b''.join(iter_jsonl_chunks(item.generate_api_post_payload() for item in items))
+
+    def test_iter_jsonl_chunks_parallel_leading_newline(self):
+
+        items = [VirtualDataSourceColumn(key='1.s.t.a', column_type='INT')]
+
+        assert b''.join(iter_jsonl_chunks_parallel(items, workers=1, leading_newline=True)) == \
+               b''.join(iter_jsonl_chunks((item.generate_api_post_payload() for item in items), leading_newline=True))
+        assert list(iter_jsonl_chunks_parallel([], workers=1, leading_newline=True)) == [b'\n']
+
+    @pytest.mark.skipif(not getattr(sys, '_is_gil_enabled', lambda: True)(), reason='threads are used without the GIL')
+    def test_iter_jsonl_chunks_parallel_processes_from_threads(self):
+
+        with _create_executor(2) as executor:
+            assert isinstance(executor, ProcessPoolExecutor)
+            assert executor._mp_context.get_start_method() != 'fork'
+
+        items = [VirtualDataSourceColumn(key=f'1.s.t.column_{i}', column_type='INT') for i in range(100)]
+        expected = b''.join(iter_jsonl_chunks(item.generate_api_post_payload() for item in items))
+
+        # partitioned uploads serialize their partitions from several threads
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+            with ThreadPoolExecutor(max_workers=2) as threads:
+                results = list(threads.map(
+                    lambda _: b''.join(iter_jsonl_chunks_parallel(items, workers=2, shard_size=30)), range(2)))
+
+        assert results == [expected, expected]
@@ -0,0 +1,117 @@
+"""Test the Key Resolver."""
+import requests
+
+from allie_sdk.core.key_resolver import KeyResolver, LRUCache, split_key
+from allie_sdk.methods.rdbms import AlationRDBMS
+
+COLUMN_URL = 'https://test.com/integration/v2/column/'
+
+
+class TestKeyResolver:
+
+    def setup_method(self):
+        self.rdbms = AlationRDBMS(access_token='test', session=requests.session(), host='https://test.com')
+        self.resolver = KeyResolver(self.rdbms, max_url_length=100, bulk_load_threshold=5)
+
+    def test_split_key(self):
+
+        assert split_key('7.sales.public.orders') == ['7', 'sales', 'public', 'orders']
+        assert split_key('7.public."a.b".c') == ['7', 'public', 'a.b', 'c']
+        assert split_key('7."say ""hi"""') == ['7', 'say "hi"']
+
+    def test_lru_cache(self):
+
+        cache = LRUCache(max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+
+    def test_lru_cache_ttl(self):
+
+        cache = LRUCache(max_size=2, ttl=0)
+        cache.put('a', 1)
+
+        assert cache.get('a') is None
+
+    def test_resolve_by_name(self, requests_mock):
+
+        requests_mock.get(COLUMN_URL, json=[
+            {'id': 1, 'key': '7.public.orders.amount'},
+            {'id': 2, 'key': '7.public.refunds.amount'},
+            {'id': 3, 'key': '7.public.orders.id'},
+        ])
+        resolved = self.resolver.resolve('column', ['7.public.orders.amount', '7.public.orders.id', '7.x.y.missing'])
+
+        assert resolved == {'7.public.orders.amount': 1, '7.public.orders.id': 3}
+        # the three names do not fit into one URL of 100 characters
+        assert requests_mock.call_count == 2
+        lookups = sorted(requests_mock.request_history, key=lambda request: len(request.qs['name']), reverse=True)
+        assert lookups[0].qs['ds_id'] == ['7']
+        assert lookups[0].qs['name'] == ['amount', 'id']
+        assert lookups[0].qs['values'] == ['id,key']
+        assert lookups[1].qs['name'] == ['missing']
+        assert all(len(request.url) <= 100 for request in lookups)
+
+    def test_resolve_cached(self, requests_mock):
+
+        requests_mock.get(COLUMN_URL, json=[{'id': 1, 'key': '7.public.orders.amount'}])
+        self.resolver.resolve('column', ['7.public.orders.amount'])
+
+        assert self.resolver.resolve_one('column', '7.public.orders.amount') == 1
+        assert requests_mock.call_count == 1
+
+    def test_resolve_bulk_load(self, requests_mock):
+
+        key_map = [{'id': i, 'key': f'7.public.orders.c{i}'} for i in range(10)]
+        requests_mock.get(COLUMN_URL, json=key_map)
+        keys = [f'7.public.orders.c{i}' for i in range(6)]
+
+        assert self.resolver.resolve('column', keys) == {key: i for i, key in enumerate(keys)}
+        assert requests_mock.call_count == 1
+        assert 'name' not in requests_mock.last_request.qs
+
+        # keys of a loaded data source are resolved from memory, also if they do not exist
+        assert self.resolver.resolve('column', ['7.public.orders.c9', '7.public.orders.nope']) == \
+               {'7.public.orders.c9': 9}
+        assert requests_mock.call_count == 1
+
+    def test_resolve_several_datasources(self, requests_mock):
+
+        requests_mock.get(COLUMN_URL, [
+            {'json': [{'id': 1, 'key': '7.public.orders.amount'}]},
+            {'json': [{'id': 2, 'key': '8.public.orders.amount'}]},
+        ])
+        resolved = self.resolver.resolve('column', ['7.public.orders.amount', '8.public.orders.amount'])
+
+        assert resolved == {'7.public.orders.amount': 1, '8.public.orders.amount': 2}
+        assert [r.qs['ds_id'] for r in requests_mock.request_history] == [['7'], ['8']]
+
+    def test_resolve_schema(self, requests_mock):
+
+        requests_mock.get('https://test.com/integration/v2/schema/', json=[{'id': 4, 'key': '7.sales.public'}])
+
+        assert self.resolver.resolve_one('schema', '7.sales.public') == 4
+        assert requests_mock.last_request.qs['name'] == ['sales.public']
+
+    def test_resolve_ids(self, requests_mock):
+
+        requests_mock.get(COLUMN_URL, json=[{'id': 1, 'key': '7.public.orders.amount'}])
+
+        assert self.resolver.resolve_ids('column', [1]) == {1: '7.public.orders.amount'}
+        assert requests_mock.last_request.qs['id'] == ['1']
+        assert self.resolver.resolve_one('column', '7.public.orders.amount') == 1
+        assert requests_mock.call_count == 1
+
+    def test_invalidate(self, requests_mock):
+
+        requests_mock.get(COLUMN_URL, json=[{'id': 1, 'key': '7.public.orders.amount'}])
+        self.resolver.resolve('column', ['7.public.orders.amount'])
+        self.resolver.invalidate()
+        self.resolver.resolve('column', ['7.public.orders.amount'])
+
+        assert requests_mock.call_count == 2
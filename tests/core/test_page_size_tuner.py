@@ -0,0 +1,130 @@
+"""Test the Page Size Tuner."""
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from allie_sdk.core.page_size_tuner import PageSizeTuner
+
+
+class TestPageSizeTuner:
+
+    def test_endpoint_key(self):
+
+        assert PageSizeTuner.endpoint_key('/integration/v2/table/?limit=100') == '/integration/v2/table/'
+        assert PageSizeTuner.endpoint_key('/integration/v2/folder/12/document/') == \
+               '/integration/v2/folder/{id}/document/'
+
+    def test_initial_page_size(self):
+
+        tuner = PageSizeTuner(initial_page_size=1000)
+
+        assert tuner.page_size('/integration/v2/table/') == 1000
+
+    def test_grow_small_objects(self):
+
+        tuner = PageSizeTuner(initial_page_size=1000, target_page_bytes=1024 * 1024, target_page_seconds=10)
+        # 100 bytes per object, fast responses
+        page_size = tuner.record('/integration/v2/tag/', 1000, 1000, 100 * 1000, 0.1, True)
+
+        assert page_size == 2000
+        assert tuner.page_size('/integration/v2/tag/') == 2000
+
+    def test_shrink_large_objects(self):
+
+        tuner = PageSizeTuner(initial_page_size=1000, target_page_bytes=1024 * 1024, target_page_seconds=10)
+        # 4 KB per object
+        page_size = tuner.record('/integration/v2/document/', 1000, 1000, 4096 * 1000, 1.0, True)
+
+        assert page_size == 500
+        page_size = tuner.record('/integration/v2/document/', 500, 500, 4096 * 500, 0.5, True)
+
+        assert page_size == 256
+
+    def test_slow_responses(self):
+
+        tuner = PageSizeTuner(initial_page_size=1000, target_page_bytes=100 * 1024 * 1024, target_page_seconds=2)
+        page_size = tuner.record('/integration/v2/table/', 1000, 1000, 1000, 4.0, True)
+
+        assert page_size == 500
+
+    def test_bounds(self):
+
+        tuner = PageSizeTuner(initial_page_size=1000, min_page_size=400, max_page_size=1500)
+
+        assert tuner.record('/a/', 1000, 1000, 100, 0.01, True) == 1500
+        assert tuner.record('/b/', 1000, 1000, 100 * 1024 * 1024, 60, True) == 500
+        assert tuner.record('/b/', 500, 500, 100 * 1024 * 1024, 60, True) == 400
+
+    def test_bounds_relative_to_page_size(self):
+
+        tuner = PageSizeTuner(initial_page_size=1000, min_page_size=1, target_page_seconds=1000)
+        # 200 KB per object, only a few objects fit into the target page size
+        page_size = tuner.record('/a/', 1000, 300, 300 * 200 * 1024, 0.01, True)
+
+        # halved from the current page size of 1000 (not from the 300 objects) and capped by the server limit
+        assert page_size == 300
+        assert tuner.record('/a/', 300, 300, 300 * 200 * 1024, 0.01, True) == 150
+
+    def test_server_max(self):
+
+        tuner = PageSizeTuner(initial_page_size=1000)
+        # the server only returned 250 objects although 1000 were requested
+        page_size = tuner.record('/integration/v1/user/', 1000, 250, 250, 0.01, True)
+
+        assert page_size == 250
+        assert tuner.profiles['/integration/v1/user/'].server_max == 250
+
+    def test_last_page_ignored(self):
+
+        tuner = PageSizeTuner(initial_page_size=1000)
+
+        assert tuner.record('/integration/v2/tag/', 1000, 3, 300, 0.01, False) == 1000
+        assert tuner.profiles['/integration/v2/tag/'].pages == 0
+
+    def test_profile(self, tmp_path):
+
+        profile_path = tmp_path / 'page_sizes.json'
+        tuner = PageSizeTuner(initial_page_size=1000, profile_path=profile_path)
+        tuner.record('/integration/v2/tag/', 1000, 1000, 1000, 0.01, True)
+        tuner.save()
+
+        stored = json.loads(profile_path.read_text())
+        assert stored['/integration/v2/tag/']['page_size'] == 2000
+
+        reloaded = PageSizeTuner(initial_page_size=1000, profile_path=profile_path)
+        assert reloaded.page_size('/integration/v2/tag/') == 2000
+
+    def test_save_only_when_changed(self, tmp_path):
+
+        profile_path = tmp_path / 'page_sizes.json'
+        tuner = PageSizeTuner(initial_page_size=1000, profile_path=profile_path)
+        tuner.record('/integration/v2/tag/', 1000, 1000, 1000, 0.01, True)
+        tuner.save()
+        profile_path.unlink()
+
+        tuner.save()
+        assert not profile_path.exists()
+
+    def test_concurrent_save(self, tmp_path):
+
+        profile_path = tmp_path / 'page_sizes.json'
+        tuner = PageSizeTuner(initial_page_size=100, min_page_size=1, profile_path=profile_path)
+
+        def record_and_save(number: int):
+            for page in range(50):
+                tuner.record(f'/integration/v2/endpoint{number}/', 100, 100, 100, 0.01, True)
+                tuner.save()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(record_and_save, range(8)))
+
+        stored = json.loads(profile_path.read_text())
+        assert len(stored) == 8
+        assert [path.name for path in tmp_path.iterdir()] == ['page_sizes.json']
+
+    def test_invalid_profile(self, tmp_path):
+
+        profile_path = tmp_path / 'page_sizes.json'
+        profile_path.write_text('not json')
+        tuner = PageSizeTuner(initial_page_size=1000, profile_path=profile_path)
+
+        assert tuner.page_size('/integration/v2/tag/') == 1000
@@ -0,0 +1,111 @@
+"""Test the RDBMS Desired State Diff."""
+from allie_sdk.core.rdbms_diff import coalesce_patch_items, content_hash, diff_rdbms_items
+from allie_sdk.models.custom_field_model import (
+    CustomFieldDictValueItem, CustomFieldStringValueItem, CustomFieldValueItem
+)
+from allie_sdk.models.rdbms_model import ColumnItem, ColumnPatchItem, TableItem, TablePatchItem
+
+CURRENT_TABLES = [
+    {'id': 1, 'key': '7.public.orders', 'title': 'Orders', 'description': 'All orders',
+     'custom_fields': [{'field_id': 10, 'field_name': 'Steward', 'value': [{'otype': 'user', 'oid': 3}]},
+                       {'field_id': 11, 'field_name': 'Status', 'value': 'Approved'}]},
+    {'id': 2, 'key': '7.public.customers', 'title': 'Customers', 'custom_fields': []},
+]
+
+
+def steward(oid: int) -> CustomFieldValueItem:
+    return CustomFieldValueItem(field_id=10, value=[CustomFieldDictValueItem(otype='USER', oid=oid)])
+
+
+class TestRDBMSDiff:
+
+    def test_content_hash(self):
+
+        assert content_hash({'a': 1, 'b': [{'otype': 'USER'}]}) == content_hash({'b': [{'otype': 'user'}], 'a': 1})
+        assert content_hash({'a': 1}) != content_hash({'a': 2})
+
+    def test_unchanged(self):
+
+        desired = [
+            TableItem(key='7.public.orders', title='Orders', description='All orders', custom_fields=[steward(3)]),
+            TableItem(key='7.public.customers', title='Customers'),
+        ]
+        diff = diff_rdbms_items(desired, CURRENT_TABLES)
+
+        assert diff.post == []
+        assert diff.patch == []
+        assert diff.unchanged == 2
+
+    def test_fields_not_returned_are_not_compared(self):
+
+        # the table API does not return the owner or the table type name
+        desired = [TableItem(key='7.public.customers', title='Customers', owner='dbo', table_type_name='BASE TABLE')]
+        diff = diff_rdbms_items(desired, CURRENT_TABLES)
+
+        assert diff.patch == []
+        assert diff.post == []
+        assert diff.unchanged == 1
+
+    def test_new_object(self):
+
+        new_table = TableItem(key='7.public.items', title='Items')
+        diff = diff_rdbms_items([new_table], CURRENT_TABLES)
+
+        assert diff.post == [new_table]
+        assert diff.patch == []
+
+    def test_changed_fields_only(self):
+
+        desired = [TableItem(key='7.public.orders', title='All Orders', description='All orders',
+                             custom_fields=[steward(4)])]
+        diff = diff_rdbms_items(desired, CURRENT_TABLES)
+
+        assert diff.post == []
+        assert diff.patch == [TablePatchItem(id=1, key='7.public.orders', title='All Orders',
+                                             custom_fields=[steward(4)])]
+        assert diff.patch[0].generate_api_patch_payload() == {
+            'id': 1, 'key': '7.public.orders', 'title': 'All Orders',
+            'custom_fields': [{'field_id': 10, 'value': [{'otype': 'user', 'oid': 4}]}]
+        }
+
+    def test_changed_custom_field(self):
+
+        status = CustomFieldValueItem(field_id=11, value=CustomFieldStringValueItem(value='Deprecated'))
+        desired = [TableItem(key='7.public.orders', custom_fields=[steward(3), status])]
+        diff = diff_rdbms_items(desired, CURRENT_TABLES)
+
+        assert diff.patch == [TablePatchItem(id=1, key='7.public.orders', custom_fields=[status])]
+
+    def test_unpatchable_field_is_posted(self):
+
+        current = [{'id': 5, 'key': '7.public.orders.amount', 'column_type': 'int', 'title': 'Amount'}]
+        changed_type = ColumnItem(key='7.public.orders.amount', column_type='bigint', title='Amount')
+        changed_title = ColumnItem(key='7.public.orders.amount', column_type='int', title='Order Amount')
+
+        assert diff_rdbms_items([changed_type], current).post == [changed_type]
+        assert diff_rdbms_items([changed_title], current).patch == [
+            ColumnPatchItem(id=5, key='7.public.orders.amount', title='Order Amount')]
+
+    def test_coalesce_patch_items(self):
+
+        status = CustomFieldValueItem(field_id=11, value=CustomFieldStringValueItem(value='Deprecated'))
+        items = [
+            ColumnPatchItem(id=5, title='Amount'),
+            ColumnPatchItem(key='7.public.orders.id', description='Order id'),
+            ColumnPatchItem(id=5, key='7.public.orders.amount', description='Order amount', custom_fields=[steward(3)]),
+            ColumnPatchItem(key='7.public.orders.amount', nullable=False, custom_fields=[steward(4), status]),
+            ColumnPatchItem(id=5, title=''),
+        ]
+        coalesced = coalesce_patch_items(items)
+
+        assert len(coalesced) == 2
+        assert coalesced[0].generate_api_patch_payload() == {
+            'id': 5, 'key': '7.public.orders.amount', 'title': 'Amount', 'description': 'Order amount',
+            'nullable': False,
+            'custom_fields': [{'field_id': 10, 'value': [{'otype': 'user', 'oid': 4}]},
+                              {'field_id': 11, 'value': 'Deprecated'}],
+        }
+        assert coalesced[1] == items[1]
+        # the passed items are not modified
+        assert items[0].description is None
+        assert items[2].custom_fields == [steward(3)]
@@ -0,0 +1,132 @@
+"""Test the RDBMS Hierarchy Loader."""
+import threading
+import time
+
+from allie_sdk.core.rdbms_loader import build_load_batches, parent_key, run_load_batches
+from allie_sdk.models.job_model import JobDetailsRdbms
+from allie_sdk.models.rdbms_model import ColumnItem, RootColumnChildrenPatchItem, SchemaItem, TableItem
+
+SCHEMAS = [SchemaItem(key='7.sales.public'), SchemaItem(key='7.hr')]
+TABLES = [
+    TableItem(key='7.sales.public.orders'),
+    TableItem(key='7.sales.public.items'),
+    TableItem(key='7.hr.people'),
+]
+COLUMNS = [
+    ColumnItem(key='7.sales.public.orders.amount', column_type='int'),
+    ColumnItem(key='7.hr.people.address', column_type='struct'),
+]
+CHILD_COLUMNS = [RootColumnChildrenPatchItem(parent_key='7.hr.people.address', key='7.hr.people.address.city')]
+
+
+def successful_load(batch) -> list:
+    return [JobDetailsRdbms(status='successful', result=[])]
+
+
+class TestRDBMSLoader:
+
+    def test_parent_key(self):
+
+        assert parent_key('7.sales.public.orders', ['7.sales.public', '7.sales']) == '7.sales.public'
+        assert parent_key('7.other.orders', ['7.sales.public']) is None
+
+    def test_build_load_batches(self):
+
+        batches = build_load_batches(SCHEMAS, TABLES, COLUMNS, CHILD_COLUMNS, batch_size=1)
+        by_stage = {}
+        for batch in batches:
+            by_stage.setdefault(batch.stage, []).append(batch)
+
+        assert [len(by_stage[stage]) for stage in ('schema', 'table', 'column', 'child_column')] == [2, 3, 2, 1]
+        sales_tables = [batch for batch in by_stage['table'] if batch.schema_key == '7.sales.public']
+        assert len(sales_tables) == 2
+        assert all(batch.depends_on == [by_stage['schema'][0]] for batch in sales_tables)
+
+        sales_columns = next(batch for batch in by_stage['column'] if batch.schema_key == '7.sales.public')
+        assert sales_columns.depends_on == sales_tables
+
+        hr_columns = next(batch for batch in by_stage['column'] if batch.schema_key == '7.hr')
+        assert by_stage['child_column'][0].depends_on == [hr_columns]
+
+    def test_build_load_batches_existing_parents(self):
+
+        # the tables exist already, the columns only depend on their schema
+        batches = build_load_batches(SCHEMAS[:1], [], COLUMNS[:1], [], batch_size=10)
+
+        assert batches[1].stage == 'column'
+        assert batches[1].schema_key == '7.sales.public'
+        assert batches[1].depends_on == [batches[0]]
+
+        # nothing is loaded above the columns
+        assert build_load_batches([], [], COLUMNS, [], batch_size=10)[0].depends_on == []
+
+    def test_run_load_batches_order(self):
+
+        batches = build_load_batches(SCHEMAS, TABLES, COLUMNS, CHILD_COLUMNS, batch_size=1)
+        finished = []
+        lock = threading.Lock()
+
+        def load(batch):
+            time.sleep(0.01)
+            with lock:
+                assert all(dependency in finished for dependency in batch.depends_on)
+                finished.append(batch)
+            return successful_load(batch)
+
+        result = run_load_batches(batches, load, max_concurrency=3)
+
+        assert len(finished) == len(batches)
+        assert len(result.jobs) == len(batches)
+        assert result.successful
+
+    def test_run_load_batches_concurrency_limit(self):
+
+        batches = build_load_batches([], TABLES, [], [], batch_size=1)
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def load(batch):
+            with lock:
+                running.append(batch)
+                peak.append(len(running))
+            time.sleep(0.02)
+            with lock:
+                running.remove(batch)
+            return successful_load(batch)
+
+        run_load_batches(batches, load, max_concurrency=2)
+
+        assert max(peak) == 2
+
+    def test_run_load_batches_failure(self):
+
+        batches = build_load_batches(SCHEMAS, TABLES, COLUMNS, CHILD_COLUMNS, batch_size=10)
+
+        def load(batch):
+            if batch.stage == 'table' and batch.schema_key == '7.hr':
+                return [JobDetailsRdbms(status='failed', result=[])]
+            return successful_load(batch)
+
+        result = run_load_batches(batches, load, max_concurrency=2)
+
+        assert not result.successful
+        assert [batch.schema_key for batch in result.failed_batches] == ['7.hr']
+        assert {(batch.stage, batch.schema_key) for batch in result.skipped_batches} == \
+               {('column', '7.hr'), ('child_column', '7.hr')}
+        # the other schema was loaded completely
+        assert len(result.jobs) == 4
+
+    def test_run_load_batches_exception(self):
+
+        batches = build_load_batches(SCHEMAS[:1], TABLES[:1], [], [], batch_size=10)
+
+        def load(batch):
+            if batch.stage == 'schema':
+                raise ValueError('boom')
+            return successful_load(batch)
+
+        result = run_load_batches(batches, load, max_concurrency=2)
+
+        assert result.failed_batches == batches[:1]
+        assert result.skipped_batches == batches[1:]
@@ -1,7 +1,12 @@
+import gzip
+import io
+import json
+
 import pytest
 import requests
 from requests import HTTPError
 
+from allie_sdk.core.page_size_tuner import PageSizeTuner
 from allie_sdk.core.request_handler import RequestHandler
 
 class TestRequestHandler:
@@ -57,6 +62,89 @@ class TestRequestHandler:
         assert result == [{'id': 1, 'name': 'Test 1'}, {'id': 2, 'name': 'Test 2'}]
         assert requests_mock.call_count == 2
 
+    def test_get_with_max_items(self, requests_mock):
+        requests_mock.get('https://test.alation.com/test/get', json=[{'id': 1}, {'id': 2}],
+              headers={'X-Next-Page': '/test/get?page=2'})
+        requests_mock.get('https://test.alation.com/test/get?page=2', json=[{'id': 3}, {'id': 4}],
+              headers={'X-Next-Page': '/test/get?page=3'})
+        result = self.handler.get('/test/get', max_items=3)
+        assert result == [{'id': 1}, {'id': 2}, {'id': 3}]
+        assert requests_mock.call_count == 2
+        assert requests_mock.request_history[0].qs['limit'] == ['3']
+
+    def test_get_with_stop_when(self, requests_mock):
+        requests_mock.get('https://test.alation.com/test/get', json=[{'id': 1}, {'id': 2}, {'id': 3}],
+              headers={'X-Next-Page': '/test/get?page=2'})
+        result = self.handler.get('/test/get', stop_when=lambda item: item['id'] == 2)
+        assert result == [{'id': 1}, {'id': 2}]
+        assert requests_mock.call_count == 1
+        assert requests_mock.request_history[0].qs['limit'] == ['1000']
+
+    def test_get_with_page_size_tuner(self, requests_mock, tmp_path):
+        profile_path = tmp_path / 'page_sizes.json'
+        self.handler.page_size_tuner = PageSizeTuner(
+            initial_page_size=2, min_page_size=1, target_page_seconds=1000, profile_path=profile_path)
+        requests_mock.get('https://test.alation.com/test/get?limit=2', json=[{'id': 1}, {'id': 2}],
+              headers={'X-Next-Page': '/test/get?limit=2&skip=2'})
+        requests_mock.get('https://test.alation.com/test/get?limit=4&skip=2', json=[{'id': 3}])
+        result = self.handler.get('/test/get')
+        assert result == [{'id': 1}, {'id': 2}, {'id': 3}]
+        assert requests_mock.request_history[1].qs == {'limit': ['4'], 'skip': ['2']}
+        assert json.loads(profile_path.read_text())['/test/get']['page_size'] == 4
+
+        # the learned page size is used for the first page of the next call
+        requests_mock.get('https://test.alation.com/test/get?limit=4', json=[{'id': 1}])
+        self.handler.get('/test/get')
+        assert requests_mock.last_request.qs == {'limit': ['4']}
+
+    def test_get_with_page_size_tuner_max_items(self, requests_mock, tmp_path):
+        profile_path = tmp_path / 'page_sizes.json'
+        self.handler.page_size_tuner = PageSizeTuner(initial_page_size=1000, profile_path=profile_path)
+        requests_mock.get('https://test.alation.com/test/get', json=[{'id': 1}],
+              headers={'X-Next-Page': '/test/get?limit=1&skip=1'})
+        requests_mock.get('https://test.alation.com/test/get?skip=1', json=[{'id': 2}],
+              headers={'X-Next-Page': '/test/get?limit=1&skip=2'})
+
+        assert self.handler.get('/test/get', max_items=1) == [{'id': 1}]
+        assert self.handler.get('/test/get', stop_when=lambda item: True) == [{'id': 1}]
+        # pages cut short by max_items or stop_when do not change the page size
+        assert self.handler.page_size_tuner.page_size('/test/get') == 1000
+        assert not profile_path.exists()
+
+    def test_replace_limit(self):
+        assert RequestHandler._replace_limit('/test/get?limit=100&skip=100', 250) == '/test/get?limit=250&skip=100'
+        assert RequestHandler._replace_limit('/test/get?cursor=abc', 250) == '/test/get?cursor=abc'
+
+    def test_get_many_by_id(self, requests_mock):
+        def records(request, context):
+            # every chunk also returns object 1 to check the deduplication
+            return [{'id': 1}] + [{'id': int(object_id)} for object_id in request.qs['id']]
+
+        requests_mock.get('https://test.alation.com/test/get', json=records)
+        ids = list(range(1, 501))
+        result = self.handler.get_many_by_id('/test/get', {'id': set(ids), 'ds_id': 7}, max_url_length=500)
+
+        assert sorted(item['id'] for item in result) == ids
+        assert requests_mock.call_count > 1
+        for request in requests_mock.request_history:
+            assert len(request.url) <= 500
+            assert request.qs['ds_id'] == ['7']
+
+    def test_get_many_by_id_without_values(self, requests_mock):
+        requests_mock.get('https://test.alation.com/test/get', json=[{'id': 1}])
+        assert self.handler.get_many_by_id('/test/get', {'ds_id': 7}) == [{'id': 1}]
+        assert 'id' not in requests_mock.last_request.qs
+
+    def test_get_many_by_id_empty_values(self, requests_mock):
+        requests_mock.get('https://test.alation.com/test/get', json=[{'id': 1}])
+        assert self.handler.get_many_by_id('/test/get', {'id': [], 'ds_id': 7}) == []
+        assert self.handler.get_many_by_id('/test/get', {'name': set()}, chunk_field='name') == []
+        assert not requests_mock.called
+
+    def test_get_many_by_id_url_too_long(self):
+        with pytest.raises(ValueError):
+            self.handler.get_many_by_id('/test/get', {'id': [1], 'name': 'x' * 100}, max_url_length=50)
+
     
     def test_get_with_pagination_error(self, requests_mock):
         requests_mock.get('https://test.alation.com/test/get', json=[{'id': 1, 'name': 'Test 1'}],
@@ -143,3 +231,78 @@ class TestRequestHandler:
         with pytest.raises(HTTPError) as context:
             self.handler.put('/test/put', {'name': 'Put Test'})
         assert context.value.response.status_code == 404
+
+    def test_post_compressed(self, requests_mock):
+        requests_mock.post('https://test.alation.com/test/post', json={'id': 2})
+        self.handler.compress_requests = True
+        self.handler.compression_threshold = 100
+        body = [{'name': f'Test {i}'} for i in range(100)]
+
+        self.handler.post('/test/post', body)
+
+        assert requests_mock.last_request.headers['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(requests_mock.last_request.body)) == body
+
+    def test_post_below_compression_threshold(self, requests_mock):
+        requests_mock.post('https://test.alation.com/test/post', json={'id': 2})
+        self.handler.compress_requests = True
+
+        self.handler.post('/test/post', {'name': 'New Test'})
+
+        assert 'Content-Encoding' not in requests_mock.last_request.headers
+        assert requests_mock.last_request.body == '{"name": "New Test"}'
+
+    def test_patch_compressed_stream(self, requests_mock):
+        requests_mock.patch('https://test.alation.com/test/patch', json={'id': 1})
+        self.handler.compress_requests = True
+
+        self.handler.patch('/test/patch', (chunk for chunk in [b'{"a": 1}', b'\n{"b": 2}']))
+
+        assert requests_mock.last_request.headers['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(b''.join(requests_mock.last_request.body)) == b'{"a": 1}\n{"b": 2}'
+
+    def test_put_compression_rejected(self, requests_mock):
+        requests_mock.put('https://test.alation.com/test/put', [
+            {'json': {'detail': 'Unsupported media type'}, 'status_code': 415},
+            {'json': {'id': 3, 'name': 'Put Test'}, 'status_code': 200},
+        ])
+        self.handler.compress_requests = True
+        self.handler.compression_threshold = 0
+
+        result = self.handler.put('/test/put', {'name': 'Put Test'})
+
+        assert result == {'id': 3, 'name': 'Put Test'}
+        assert requests_mock.request_history[0].headers['Content-Encoding'] == 'gzip'
+        assert 'Content-Encoding' not in requests_mock.last_request.headers
+        assert requests_mock.last_request.body == '{"name": "Put Test"}'
+        assert self.handler.compress_requests is False
+
+    def test_patch_compression_rejected_file(self, requests_mock):
+        uploaded = []
+
+        def read_body(request, context):
+            body = request.body
+            uploaded.append(body.read() if hasattr(body, 'read') else b''.join(body))
+            context.status_code = 415 if 'Content-Encoding' in request.headers else 200
+            return {'id': 1}
+
+        requests_mock.patch('https://test.alation.com/test/patch', json=read_body)
+        self.handler.compress_requests = True
+
+        result = self.handler.patch('/test/patch', io.BytesIO(b'{"a": 1}\n{"b": 2}'))
+
+        assert result == {'id': 1}
+        assert uploaded[1] == b'{"a": 1}\n{"b": 2}'
+        assert 'Content-Encoding' not in requests_mock.last_request.headers
+
+    def test_patch_compression_rejected_stream(self, requests_mock):
+        requests_mock.patch('https://test.alation.com/test/patch', json={'detail': 'Unsupported media type'},
+              status_code=415)
+        self.handler.compress_requests = True
+
+        with pytest.raises(requests.HTTPError, match='compress=False') as http_error:
+            self.handler.patch('/test/patch', (chunk for chunk in [b'{"a": 1}', b'\n{"b": 2}']))
+
+        assert http_error.value.response.status_code == 415
+        assert requests_mock.call_count == 1
+        assert self.handler.compress_requests is False
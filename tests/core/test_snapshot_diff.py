@@ -0,0 +1,75 @@
+import gzip
+import json
+
+import pytest
+
+from allie_sdk.core.snapshot_diff import diff_snapshots, diff_sorted, field_changes, write_changes
+
+OLD = [
+    {'id': 1, 'key': '7.public', 'title': 'Public'},
+    {'id': 2, 'key': '7.public.orders', 'title': 'Orders',
+     'custom_fields': [{'field_id': 3, 'value': 'A'}, {'field_id': 4, 'value': 'B'}]},
+    {'id': 3, 'key': '7.public.returns', 'title': 'Returns'},
+]
+NEW = [
+    {'id': 1, 'key': '7.public', 'title': 'Public'},
+    {'id': 2, 'key': '7.public.orders', 'title': 'All Orders',
+     'custom_fields': [{'field_id': 4, 'value': 'B'}, {'field_id': 3, 'value': 'C'}]},
+    {'id': 4, 'key': '7.public.refunds', 'title': 'Refunds'},
+]
+
+
+def summarize(changes) -> dict:
+    return {(change.change, change.key): change.fields for change in changes}
+
+
+EXPECTED = {
+    ('changed', '7.public.orders'): {'title': ('Orders', 'All Orders'), 'custom_fields.3': ('A', 'C')},
+    ('removed', '7.public.returns'): {},
+    ('added', '7.public.refunds'): {},
+}
+
+
+class TestSnapshotDiff:
+
+    def test_field_changes(self):
+        assert field_changes({'a': 1, 'b': 2}, {'a': 1, 'c': 3}) == {'b': (2, None), 'c': (None, 3)}
+        assert field_changes({'a': 1, 'ts': 1}, {'a': 1, 'ts': 2}, ignore_fields=('ts',)) == {}
+
+    def test_diff_sorted(self):
+        changes = list(diff_sorted(OLD, NEW))
+        assert summarize(changes) == EXPECTED
+        # changes are returned in key order
+        assert [change.key for change in changes] == ['7.public.orders', '7.public.refunds', '7.public.returns']
+
+    def test_diff_sorted_unordered(self):
+        with pytest.raises(ValueError):
+            list(diff_sorted(list(reversed(OLD)), NEW))
+
+    def test_diff_snapshots(self, tmp_path):
+        changes = list(diff_snapshots(reversed(OLD), NEW, partitions=3, work_dir=tmp_path))
+        assert summarize(changes) == EXPECTED
+        # the partition files are removed
+        assert list(tmp_path.iterdir()) == []
+
+    def test_diff_snapshots_composite_key(self):
+        old = [{'otype': 'table', 'oid': 1, 'field_id': 3, 'value': 'A'}]
+        new = [{'otype': 'table', 'oid': 1, 'field_id': 3, 'value': 'B'},
+               {'otype': 'table', 'oid': 2, 'field_id': 3, 'value': 'A'}]
+        changes = list(diff_snapshots(old, new, key=('otype', 'oid', 'field_id'), partitions=2))
+        assert summarize(changes) == {
+            ('changed', ('table', 1, 3)): {'value': ('A', 'B')},
+            ('added', ('table', 2, 3)): {},
+        }
+
+    def test_diff_snapshots_duplicate_key(self):
+        with pytest.raises(ValueError):
+            list(diff_snapshots(OLD + OLD[:1], NEW))
+
+    def test_write_changes(self, tmp_path):
+        path = tmp_path / 'changes.jsonl.gz'
+        counts = write_changes(diff_sorted(OLD, NEW), path)
+        assert counts == {'added': 1, 'removed': 1, 'changed': 1}
+        with gzip.open(path, 'rt') as changes_file:
+            lines = [json.loads(line) for line in changes_file]
+        assert lines[0]['fields']['title'] == {'old': 'Orders', 'new': 'All Orders'}
@@ -0,0 +1,128 @@
+import gzip
+import json
+
+import pytest
+
+from allie_sdk.alation import Alation
+from allie_sdk.core.snapshot_export import SnapshotExporter, iter_snapshot_records
+
+SCHEMAS = [{'id': 5, 'key': '7.public', 'ds_id': 7, 'custom_fields': []}]
+TABLES = [
+    {'id': 10, 'key': '7.public.orders', 'ds_id': 7,
+     'custom_fields': [{'field_id': 3, 'value': 'Orders'}]},
+    {'id': 25, 'key': '7.public.customers', 'ds_id': 7, 'custom_fields': []},
+]
+COLUMNS = [{'id': 30, 'key': '7.public.orders.amount', 'ds_id': 7,
+            'custom_fields': [{'field_id': 8, 'value': [{'otype': 'user', 'oid': 1}]}]}]
+
+
+def rdbms_callback(records: list):
+    def callback(request, context):
+        ordering = request.qs.get('order_by', [None])[0]
+        if ordering == 'id':
+            return records[:1]
+        if ordering == '-id':
+            return records[-1:]
+        lower = int(request.qs['id__gte'][0])
+        upper = int(request.qs['id__lt'][0])
+        return [record for record in records if lower <= record['id'] < upper]
+    return callback
+
+
+class TestSnapshotExporter:
+
+    def setup_method(self):
+        self.alation = Alation(host='https://test.com', disable_authentication=True)
+
+    def mock_rdbms(self, requests_mock):
+        requests_mock.get('https://test.com/integration/v2/schema/', json=rdbms_callback(SCHEMAS))
+        requests_mock.get('https://test.com/integration/v2/table/', json=rdbms_callback(TABLES))
+        requests_mock.get('https://test.com/integration/v2/column/', json=rdbms_callback(COLUMNS))
+
+    def test_export_jsonl(self, requests_mock, tmp_path):
+        self.mock_rdbms(requests_mock)
+        exporter = SnapshotExporter(self.alation, tmp_path, shard_size=20)
+        result = exporter.export(7, datasets=('schema', 'table', 'column', 'custom_field_value'))
+
+        assert result.successful
+        assert result.exported_shards == 4  # schema 0, table 0 and 1, column 1
+        assert result.rows == {'schema': 1, 'table': 2, 'column': 1, 'custom_field_value': 2}
+        assert list(iter_snapshot_records(tmp_path, 'table')) == TABLES
+        assert list(iter_snapshot_records(tmp_path, 'custom_field_value')) == [
+            {'otype': 'attribute', 'oid': 30, 'field_id': 8, 'value': [{'otype': 'user', 'oid': 1}]},
+            {'otype': 'table', 'oid': 10, 'field_id': 3, 'value': 'Orders'},
+        ]
+        with gzip.open(tmp_path / 'table' / 'part-000001.jsonl.gz', 'rt') as part_file:
+            assert [json.loads(line)['id'] for line in part_file] == [25]
+        assert json.loads((tmp_path / 'manifest.json').read_text())['completed_at'] is not None
+
+    def test_export_resumes(self, requests_mock, tmp_path):
+        self.mock_rdbms(requests_mock)
+
+        def failing_columns(request, context):
+            if 'order_by' in request.qs:
+                return COLUMNS[:1]
+            context.status_code = 400
+            return {'detail': 'Bad Request'}
+
+        requests_mock.get('https://test.com/integration/v2/column/', json=failing_columns)
+        result = SnapshotExporter(self.alation, tmp_path, shard_size=20).export(7, datasets=('table', 'column'))
+        assert result.failed_shards == ['column/000001']
+        assert json.loads((tmp_path / 'manifest.json').read_text())['completed_at'] is None
+
+        self.mock_rdbms(requests_mock)
+        result = SnapshotExporter(self.alation, tmp_path, shard_size=20).export(7, datasets=('table', 'column'))
+        assert result.resumed_shards == 2
+        assert result.exported_shards == 1
+        assert result.successful
+        assert [record['id'] for record in iter_snapshot_records(tmp_path, 'column')] == [30]
+        # the table shards were only fetched by the first export
+        table_shard_requests = [request for request in requests_mock.request_history
+                                if request.path == '/integration/v2/table/' and 'id__gte' in request.qs]
+        assert len(table_shard_requests) == 2
+
+    def test_export_tags(self, requests_mock, tmp_path):
+        requests_mock.get('https://test.com/integration/tag/', json=[{'id': 1, 'name': 'pii'}])
+        requests_mock.get('https://test.com/integration/tag/pii/subject/', json=[
+            {'ts_tagged': '2024-01-02T03:04:05.000000Z', 'subject': {'otype': 'table', 'id': 10}},
+            {'ts_tagged': '2024-01-02T03:04:05.000000Z', 'subject': {'otype': 'table', 'id': 99}},
+            {'ts_tagged': '2024-01-02T03:04:05.000000Z', 'subject': {'otype': 'data', 'id': 7}},
+            {'ts_tagged': '2024-01-02T03:04:05.000000Z', 'subject': {'otype': 'article', 'id': 10}},
+        ])
+        # table 99 belongs to another data source
+        requests_mock.get('https://test.com/integration/v2/table/', json=[{'id': 10}])
+
+        result = SnapshotExporter(self.alation, tmp_path).export(7, datasets=('tag',))
+
+        assert result.rows == {'tag': 2}
+        assert [(row['otype'], row['oid']) for row in iter_snapshot_records(tmp_path, 'tag')] == [
+            ('table', 10), ('data', 7)]
+        assert requests_mock.last_request.qs['ds_id'] == ['7']
+
+    def test_export_dataflows(self, requests_mock, tmp_path):
+        requests_mock.get('https://test.com/integration/v2/dataflow/', json={
+            'dataflow_objects': [{'id': 1, 'external_id': 'api/etl', 'title': 'ETL'}],
+            'paths': [[[{'otype': 'table', 'key': '7.public.orders'}], [{'otype': 'dataflow', 'key': 'api/etl'}]]],
+        })
+        result = SnapshotExporter(self.alation, tmp_path).export(7, datasets=('dataflow',), dataflow_ids=[1])
+
+        assert result.rows == {'dataflow': 1, 'dataflow_path': 1}
+        assert [row['external_id'] for row in iter_snapshot_records(tmp_path, 'dataflow')] == ['api/etl']
+        assert requests_mock.last_request.json() == [1]
+
+    def test_export_other_snapshot(self, requests_mock, tmp_path):
+        self.mock_rdbms(requests_mock)
+        SnapshotExporter(self.alation, tmp_path).export(7, datasets=('schema',))
+        with pytest.raises(ValueError):
+            SnapshotExporter(self.alation, tmp_path).export(8, datasets=('schema',))
+
+    def test_unsupported_dataset(self, tmp_path):
+        with pytest.raises(ValueError):
+            SnapshotExporter(self.alation, tmp_path).export(7, datasets=('query',))
+
+    def test_parquet(self, requests_mock, tmp_path):
+        pytest.importorskip('pyarrow')
+        self.mock_rdbms(requests_mock)
+        SnapshotExporter(self.alation, tmp_path, format='parquet', shard_size=20).export(
+            7, datasets=('column', 'custom_field_value'))
+        assert list(iter_snapshot_records(tmp_path, 'column')) == COLUMNS
@@ -70,6 +70,36 @@ class TestCustomField:
 
         assert mock_values == field_values
 
+    def test_success_get_custom_field_values_columnar(self, requests_mock):
+        success_response = [
+            {
+                "field_id": 10006,
+                "oid": 12,
+                "otype": "table",
+                "ts_updated": "2023-07-17T23:59:31.113261Z",
+                "value": [{"otype": "groupprofile", "oid": 8}]
+            },
+            {
+                "field_id": 4,
+                "oid": 13,
+                "otype": "table",
+                "value": "PII"
+            }
+        ]
+        requests_mock.register_uri('GET', '/integration/v2/custom_field_value/', json=success_response)
+        field_values = self.mock_custom_field.get_custom_field_values(format='columnar')
+
+        assert field_values.num_rows == 2
+        assert field_values['field_id'] == [10006, 4]
+        assert field_values['oid'] == [12, 13]
+        assert field_values['ts_updated'] == ["2023-07-17T23:59:31.113261Z", None]
+        assert field_values['value'] == [[{"otype": "groupprofile", "oid": 8}], "PII"]
+        assert field_values['field_name'] == [None, None]
+
+    def test_get_custom_field_values_unsupported_format(self):
+        with pytest.raises(ValueError):
+            self.mock_custom_field.get_custom_field_values(format='rows')
+
 
     def test_failed_get_custom_field_values(self, requests_mock):
         failed_response = {
@@ -67,6 +67,43 @@ class TestDocument:
         assert success_documents == documents
         
     
+    def test_get_documents_lazy(self, requests_mock):
+        # --- PREPARE THE TEST SETUP --- #
+        document_api_response = [
+            {
+                "id": 1,
+                "ts_created": "2022-07-05T15:09:40.421916Z",
+                "title": "Sales",
+                "custom_fields": [
+                    {
+                        "field_id": 1,
+                        "value": ["red", "orange", "green"]
+                    }
+                ]
+            }
+        ]
+
+        requests_mock.register_uri(
+            method='GET',
+            url='/integration/v2/document/',
+            json=document_api_response,
+            status_code=200
+        )
+
+        # --- TEST THE FUNCTION --- #
+        documents = self.mock_user.get_documents(format='lazy')
+
+        assert documents[0].id == 1
+        assert documents[0].title == "Sales"
+        assert documents[0].deleted is False
+        assert documents[0].ts_created == Document.convert_timestamp("2022-07-05T15:09:40.421916Z")
+        assert documents == [Document.from_api_response(item) for item in document_api_response]
+
+    def test_get_documents_unsupported_format(self):
+
+        with pytest.raises(ValueError):
+            self.mock_user.get_documents(format='columnar')
+
     def test_empty_get_documents(self, requests_mock):
         # --- PREPARE THE TEST SETUP --- #
         empty_response = []
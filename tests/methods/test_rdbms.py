@@ -1,7 +1,8 @@
 """Test the Alation REST API Relational Integration Methods."""
 import pytest
 from allie_sdk.methods.rdbms import *
-from allie_sdk.core.custom_exceptions import InvalidPostBody
+from allie_sdk.core.custom_exceptions import InvalidPostBody, UnsupportedPostBody
+from allie_sdk.models.custom_field_model import CustomFieldValue, CustomFieldStringValue
 
 class TestRDBMS:
 
@@ -537,6 +538,72 @@ class TestRDBMS:
 
         assert success_columns == columns
 
+    def test_success_get_columns_columnar(self, requests_mock):
+
+        success_response = [
+            {
+                "id": 1613,
+                "name": "CUSTOMER_NAME",
+                "ds_id": 6,
+                "key": "6.SUPERSTORE.PUBLIC.SUPERSTORE_REPORTING.CUSTOMER_NAME",
+                "column_type": "VARCHAR(100)",
+                "nullable": True,
+                "position": 7
+            },
+            {
+                "id": 1614,
+                "name": "CUSTOMER_ID",
+                "ds_id": 6,
+                "key": "6.SUPERSTORE.PUBLIC.SUPERSTORE_REPORTING.CUSTOMER_ID",
+                "column_type": "INTEGER",
+                "nullable": False,
+                "position": 8,
+                "unexpected": "ignored"
+            }
+        ]
+        requests_mock.register_uri('GET', '/integration/v2/column/', json=success_response)
+        columns = self.mock_user.get_columns(format='columnar')
+
+        assert tuple(columns.keys()) == field_names(Column)
+        assert columns.num_rows == 2
+        assert columns['id'] == [1613, 1614]
+        assert columns['column_type'] == ['VARCHAR(100)', 'INTEGER']
+        assert columns['nullable'] == [True, False]
+        assert columns['table_id'] == [None, None]
+        assert 'unexpected' not in columns
+
+    def test_success_get_tables_lazy(self, requests_mock):
+
+        success_response = [
+            {
+                "id": 91,
+                "name": "superstore_reporting",
+                "ds_id": 6,
+                "key": "6.superstore.public.superstore_reporting",
+                "custom_fields": [
+                    {"value": "PII", "field_id": 10087, "field_name": "PII"}
+                ]
+            }
+        ]
+        requests_mock.register_uri('GET', '/integration/v2/table/', json=success_response)
+        tables = self.mock_user.get_tables(format='lazy')
+
+        assert len(tables) == 1
+        assert tables[0].id == 91
+        assert tables[0].key == "6.superstore.public.superstore_reporting"
+        assert tables[0].custom_fields == [
+            CustomFieldValue(field_id=10087, field_name="PII", value=CustomFieldStringValue(value="PII"))
+        ]
+        assert tables[0] == Table.from_api_response(success_response[0])
+
+    def test_success_get_schemas_columnar_empty(self, requests_mock):
+
+        requests_mock.register_uri('GET', '/integration/v2/schema/', json=[])
+        schemas = self.mock_user.get_schemas(format='columnar')
+
+        assert schemas.num_rows == 0
+        assert schemas['id'] == []
+
     def test_success_get_columns_with_common_query_params(self, requests_mock):
 
         mock_params = ColumnParams(
@@ -992,6 +1059,25 @@ class TestRDBMS:
         assert "'id' or 'key' is a required field for Column PATCH payload body" in str(context.value)
         assert requests_mock.called is False
 
+    def test_patch_columns_coalesce(self, requests_mock):
+        columns = [
+            ColumnPatchItem(id=1, title='Refund Id'),
+            ColumnPatchItem(id=2, title='Amount'),
+            ColumnPatchItem(id=1, description='Id of the refund'),
+        ]
+        requests_mock.register_uri('PATCH', '/integration/v2/column/?ds_id=1', json={'job_id': 27809}, status_code=202)
+        requests_mock.register_uri('GET', '/api/v1/bulk_metadata/job/?id=27809', json={
+            'status': 'successful', 'msg': '', 'result': [{'response': 'Updated 2 attribute objects.'}]})
+
+        self.mock_user.patch_columns(ds_id=1, columns=columns)
+        assert requests_mock.request_history[0].json() == [
+            {'id': 1, 'title': 'Refund Id', 'description': 'Id of the refund'},
+            {'id': 2, 'title': 'Amount'},
+        ]
+
+        self.mock_user.patch_columns(ds_id=1, columns=columns, coalesce=False)
+        assert len(requests_mock.request_history[2].json()) == 3
+
     def test_failed_patch_child_columns(self, requests_mock):
         mock_child_column = ChildColumnPatchItem()
         mock_child_column_list = [mock_child_column]
@@ -1011,3 +1097,195 @@ class TestRDBMS:
 
         assert "'parent_key' is a required field for Root Column Children PATCH payload body" in str(context.value)
         assert requests_mock.called is False
+
+    @staticmethod
+    def _register_table_store(requests_mock, table_ids: list):
+        tables = [{'id': table_id, 'name': f'table_{table_id}', 'ds_id': 1} for table_id in table_ids]
+
+        def filter_tables(request, context):
+            matches = tables
+            if 'id__gte' in request.qs:
+                lower, upper = int(request.qs['id__gte'][0]), int(request.qs['id__lt'][0])
+                matches = [table for table in matches if lower <= table['id'] < upper]
+            if 'order_by' in request.qs:
+                matches = sorted(matches, key=lambda table: table['id'], reverse=request.qs['order_by'][0] == '-id')
+                matches = matches[:int(request.qs['limit'][0])]
+            else:
+                # shards come back in an arbitrary order
+                matches = list(reversed(matches))
+            return matches
+
+        requests_mock.register_uri('GET', '/integration/v2/table/', json=filter_tables)
+        return tables
+
+    def test_success_parallel_scan(self, requests_mock):
+
+        tables = self._register_table_store(requests_mock, [3, 4, 10, 11, 12, 40, 41, 99])
+
+        result = self.mock_user.parallel_scan('table', TableParams(ds_id={1}), shards=4)
+
+        assert result == [Table.from_api_response(table) for table in tables]
+        shard_requests = [request.qs for request in requests_mock.request_history if 'id__gte' in request.qs]
+        assert len(shard_requests) == 4
+        assert all(request['ds_id'] == ['1'] for request in shard_requests)
+
+    def test_success_parallel_scan_unordered(self, requests_mock):
+
+        tables = self._register_table_store(requests_mock, list(range(1, 51)))
+
+        result = self.mock_user.parallel_scan('table', shards=3, ordered=False, format='columnar')
+
+        assert sorted(result['id']) == [table['id'] for table in tables]
+
+    def test_success_parallel_scan_empty(self, requests_mock):
+
+        self._register_table_store(requests_mock, [])
+
+        assert self.mock_user.parallel_scan('table') == []
+        assert len(requests_mock.request_history) == 1
+
+    def test_failed_parallel_scan_object_type(self):
+
+        with pytest.raises(ValueError):
+            self.mock_user.parallel_scan('view')
+
+    def test_success_get_tables_max_items(self, requests_mock):
+
+        requests_mock.register_uri(
+            'GET', '/integration/v2/table/',
+            json=[{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}],
+            headers={'X-Next-Page': '/integration/v2/table/?skip=2'}
+        )
+
+        tables = self.mock_user.get_tables(max_items=1)
+
+        assert tables == [Table(id=1, name='a')]
+        assert len(requests_mock.request_history) == 1
+
+    def _register_table_jobs(self, requests_mock, method: str, job_id: int):
+
+        requests_mock.register_uri(method, '/integration/v2/table/?ds_id=7', json={'job_id': job_id}, status_code=202)
+        requests_mock.register_uri(
+            'GET', f'/api/v1/bulk_metadata/job/?id={job_id}',
+            json={'status': 'successful', 'msg': '', 'result': [{'response': 'ok', 'mapping': [], 'errors': []}]}
+        )
+
+    def test_success_sync_metadata(self, requests_mock):
+
+        requests_mock.register_uri('GET', '/integration/v2/table/', json=[
+            {'id': 1, 'key': '7.public.orders', 'title': 'Orders', 'custom_fields': []},
+            {'id': 2, 'key': '7.public.customers', 'title': 'Customers', 'custom_fields': []},
+        ])
+        self._register_table_jobs(requests_mock, 'POST', 1)
+        self._register_table_jobs(requests_mock, 'PATCH', 2)
+
+        diff = self.mock_user.sync_metadata(7, [
+            TableItem(key='7.public.orders', title='Orders'),
+            TableItem(key='7.public.customers', title='All Customers'),
+            TableItem(key='7.public.items', title='Items'),
+        ])
+
+        assert diff.unchanged == 1
+        assert len(diff.jobs) == 2
+        assert requests_mock.request_history[0].qs['ds_id'] == ['7']
+        post_request = next(r for r in requests_mock.request_history if r.method == 'POST')
+        patch_request = next(r for r in requests_mock.request_history if r.method == 'PATCH')
+        assert post_request.json() == [{'key': '7.public.items', 'title': 'Items'}]
+        assert patch_request.json() == [{'id': 2, 'key': '7.public.customers', 'title': 'All Customers'}]
+
+    def test_success_sync_metadata_dry_run(self, requests_mock):
+
+        current = [{'id': 1, 'key': '7.public.orders', 'title': 'Orders'}]
+
+        diff = self.mock_user.sync_metadata(7, [TableItem(key='7.public.orders', title='New')],
+                                            current=current, dry_run=True)
+
+        assert diff.patch == [TablePatchItem(id=1, key='7.public.orders', title='New')]
+        assert diff.jobs == []
+        assert len(requests_mock.request_history) == 0
+
+    def test_failed_sync_metadata_mixed_types(self):
+
+        with pytest.raises(UnsupportedPostBody):
+            self.mock_user.sync_metadata(7, [TableItem(key='7.a.b'), ColumnItem(key='7.a.b.c')], current=[])
+
+    def test_success_load_hierarchy(self, requests_mock):
+
+        for job_id, object_type in enumerate(('schema', 'table', 'column'), start=1):
+            requests_mock.register_uri('POST', f'/integration/v2/{object_type}/?ds_id=7',
+                                       json={'job_id': job_id}, status_code=202)
+            requests_mock.register_uri(
+                'GET', f'/api/v1/bulk_metadata/job/?id={job_id}',
+                json={'status': 'successful', 'msg': '', 'result': [{'response': 'ok', 'mapping': [], 'errors': []}]}
+            )
+
+        result = self.mock_user.load_hierarchy(
+            7,
+            schemas=[SchemaItem(key='7.public')],
+            tables=[TableItem(key='7.public.orders')],
+            columns=[ColumnItem(key='7.public.orders.amount', column_type='int')]
+        )
+
+        assert result.successful
+        assert len(result.jobs) == 3
+        posts = [request.path for request in requests_mock.request_history if request.method == 'POST']
+        assert posts == ['/integration/v2/schema/', '/integration/v2/table/', '/integration/v2/column/']
+
+    def test_success_get_child_columns_many(self, requests_mock):
+
+        for column_id in range(1, 21):
+            requests_mock.register_uri(
+                'GET', f'/integration/v2/column/{column_id}/children/',
+                json={'ds_id': 1, 'parent_fully_qualified_name': f'1.s.t.c{column_id}', 'children': []}
+            )
+
+        results = dict(self.mock_user.get_child_columns_many(
+            (column_id for column_id in list(range(1, 21)) * 2), max_workers=3))
+
+        assert sorted(results) == list(range(1, 21))
+        assert results[7] == ColumnChildren(ds_id=1, parent_fully_qualified_name='1.s.t.c7', children=[])
+        # duplicate ids are fetched once
+        assert len(requests_mock.request_history) == 20
+
+    def test_failed_get_child_columns_many(self, requests_mock):
+
+        requests_mock.register_uri('GET', '/integration/v2/column/1/children/', json={}, status_code=404)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            list(self.mock_user.get_child_columns_many([1]))
+
+    def test_success_get_columns_projection(self, requests_mock):
+
+        requests_mock.register_uri('GET', '/integration/v2/column/', json=[
+            {'id': 1, 'key': '7.public.orders.amount', 'column_type': 'int'},
+            {'id': 2, 'key': '7.public.orders.id'},
+        ])
+
+        columns = self.mock_user.get_columns(ColumnParams(ds_id={7}), fields=['id', 'key', 'column_type'])
+
+        assert requests_mock.last_request.qs['values'] == ['id,key,column_type']
+        assert requests_mock.last_request.qs['ds_id'] == ['7']
+        assert columns == [(1, '7.public.orders.amount', 'int'), (2, '7.public.orders.id', None)]
+        assert type(columns[0]).__name__ == 'ColumnRecord'
+        assert columns[0].key == '7.public.orders.amount'
+
+    def test_success_get_tables_projection_columnar(self, requests_mock):
+
+        requests_mock.register_uri('GET', '/integration/v2/table/', json=[{'id': 1, 'key': '7.s.t'}])
+
+        tables = self.mock_user.get_tables(fields=['id', 'key'], format='columnar')
+
+        assert tables == {'id': [1], 'key': ['7.s.t']}
+
+    def test_failed_get_schemas_projection_unknown_field(self):
+
+        with pytest.raises(ValueError):
+            self.mock_user.get_schemas(fields=['id', 'owner'])
+
+    def test_failed_get_tables_projection_lazy(self, requests_mock):
+
+        requests_mock.register_uri('GET', '/integration/v2/table/', json=[{'id': 1, 'key': '7.s.t'}])
+
+        with pytest.raises(ValueError):
+            self.mock_user.get_tables(fields=['id', 'key'], format='lazy')
+        assert not requests_mock.called
@@ -1,5 +1,7 @@
 """Test the Alation REST API Virtual Data Source Methods."""
+import gzip
 import pytest
+from allie_sdk.core.custom_exceptions import UnsupportedPostBody
 from allie_sdk.methods.virtual_datasource import *
 
 MOCK_VIRTUAL_DATA_SOURCE = AlationVirtualDataSource(
@@ -68,6 +70,206 @@ class TestVirtualDataSource:
         assert expected_job_response == async_result
 
     
+    def test_success_post_virtual_datasource_stream(self, requests_mock):
+
+        vds_id = 99
+        mock_vds_list = [
+            VirtualDataSourceSchema(key="99.TestSchema", title='Testing Schema'),
+            VirtualDataSourceTable(key='99.TestSchema.TestTable'),
+            VirtualDataSourceColumn(key="99.TestSchema.TestTable.Column1", column_type='INT'),
+        ]
+
+        async_response = {
+            "job_name": "MetadataExtraction2336_Virtual_9999"
+        }
+        job_response = {
+            "status": "successful",
+            "msg": "Job finished in 1.0 seconds at 2024-06-05 17:25:48.469169+00:00",
+            "result": "{\"number_received\": 3, \"updated_objects\": 3, \"error_objects\": [], \"error\": null}"
+        }
+
+        requests_mock.register_uri('POST', f'/api/v1/bulk_metadata/extraction/{vds_id}', json=async_response)
+        requests_mock.register_uri('GET','/api/v1/bulk_metadata/job/?name=MetadataExtraction2336_Virtual_9999', json=job_response)
+        async_result = MOCK_VIRTUAL_DATA_SOURCE.post_metadata(
+            ds_id=vds_id, vds_objects=(item for item in mock_vds_list), stream=True
+        )
+
+        post_request = requests_mock.request_history[0]
+        assert post_request.headers['Transfer-Encoding'] == 'chunked'
+        assert b''.join(post_request.body).decode('utf-8') == '\n'.join(
+            json.dumps(item.generate_api_post_payload()) for item in mock_vds_list
+        )
+        assert async_result[0].result.number_received == 3
+
+    def test_failed_post_virtual_datasource_stream(self, requests_mock):
+
+        def consume_body(request, context):
+            # the transport reads the streamed body while sending it
+            b''.join(request.body)
+            return {"job_name": "MetadataExtraction2336_Virtual_9999"}
+
+        requests_mock.register_uri('POST', '/api/v1/bulk_metadata/extraction/99', json=consume_body)
+
+        with pytest.raises(UnsupportedPostBody):
+            MOCK_VIRTUAL_DATA_SOURCE.post_metadata(
+                ds_id=99, vds_objects=[VirtualDataSourceSchema(key="99.TestSchema"), 'bad'], stream=True
+            )
+        with pytest.raises(UnsupportedPostBody):
+            MOCK_VIRTUAL_DATA_SOURCE.post_metadata(
+                ds_id=99, vds_objects=[VirtualDataSourceSchema(key="99.TestSchema"), 'bad']
+            )
+
+    def test_success_post_virtual_datasource_workers(self, requests_mock):
+
+        vds_id = 99
+        mock_vds_list = [VirtualDataSourceSchema(key="99.TestSchema", title='Testing Schema')] + [
+            VirtualDataSourceColumn(key=f"99.TestSchema.TestTable.Column{i}", column_type='INT') for i in range(50)
+        ]
+
+        async_response = {
+            "job_name": "MetadataExtraction2336_Virtual_9999"
+        }
+        job_response = {
+            "status": "successful",
+            "msg": "Job finished in 1.0 seconds at 2024-06-05 17:25:48.469169+00:00",
+            "result": "{\"number_received\": 51, \"updated_objects\": 51, \"error_objects\": [], \"error\": null}"
+        }
+
+        requests_mock.register_uri('POST', f'/api/v1/bulk_metadata/extraction/{vds_id}', json=async_response)
+        requests_mock.register_uri('GET','/api/v1/bulk_metadata/job/?name=MetadataExtraction2336_Virtual_9999', json=job_response)
+        async_result = MOCK_VIRTUAL_DATA_SOURCE.post_metadata(ds_id=vds_id, vds_objects=mock_vds_list, workers=2)
+
+        assert requests_mock.request_history[0].body.decode('utf-8') == '\n'.join(
+            json.dumps(item.generate_api_post_payload()) for item in mock_vds_list
+        )
+        assert async_result[0].result.number_received == 51
+
+    def test_success_post_virtual_datasource_jsonl_file(self, requests_mock, tmp_path):
+
+        vds_id = 99
+        jsonl_file = tmp_path / 'vds.jsonl'
+        jsonl_file.write_text('{"key": "99.TestSchema"}\n{"key": "99.TestSchema.TestTable"}')
+
+        async_response = {
+            "job_name": "MetadataExtraction2336_Virtual_9999"
+        }
+        job_response = {
+            "status": "successful",
+            "msg": "Job finished in 1.0 seconds at 2024-06-05 17:25:48.469169+00:00",
+            "result": "{\"number_received\": 2, \"updated_objects\": 2, \"error_objects\": [], \"error\": null}"
+        }
+
+        uploaded = []
+
+        def read_body(request, context):
+            # the file is closed once the upload returns, so the body is read while the request is sent
+            uploaded.append(b''.join(request.body))
+            return async_response
+
+        requests_mock.register_uri('POST', f'/api/v1/bulk_metadata/extraction/{vds_id}', json=read_body)
+        requests_mock.register_uri('GET','/api/v1/bulk_metadata/job/?name=MetadataExtraction2336_Virtual_9999', json=job_response)
+        async_result = MOCK_VIRTUAL_DATA_SOURCE.post_metadata_jsonl(
+            ds_id=vds_id, payload=jsonl_file, query_params=VirtualDataSourceParams(set_title_descs='true'), compress=True
+        )
+
+        post_request = requests_mock.request_history[0]
+        assert post_request.headers['Content-Encoding'] == 'gzip'
+        assert post_request.qs == {'set_title_descs': ['true']}
+        assert gzip.decompress(uploaded[0]) == jsonl_file.read_bytes()
+        assert async_result[0].result.number_received == 2
+
+    def test_success_post_virtual_datasource_jsonl_file_compression_rejected(self, requests_mock, tmp_path):
+
+        vds_id = 99
+        jsonl_file = tmp_path / 'vds.jsonl'
+        jsonl_file.write_text('{"key": "99.TestSchema"}\n{"key": "99.TestSchema.TestTable"}')
+
+        job_response = {
+            "status": "successful",
+            "msg": "Job finished in 1.0 seconds at 2024-06-05 17:25:48.469169+00:00",
+            "result": "{\"number_received\": 2, \"updated_objects\": 2, \"error_objects\": [], \"error\": null}"
+        }
+
+        uploaded = []
+
+        def read_body(request, context):
+            body = request.body
+            uploaded.append(body.read() if hasattr(body, 'read') else b''.join(body))
+            if 'Content-Encoding' in request.headers:
+                context.status_code = 415
+                return {'detail': 'Unsupported media type'}
+            return {"job_name": "MetadataExtraction2336_Virtual_9999"}
+
+        requests_mock.register_uri('POST', f'/api/v1/bulk_metadata/extraction/{vds_id}', json=read_body)
+        requests_mock.register_uri('GET','/api/v1/bulk_metadata/job/?name=MetadataExtraction2336_Virtual_9999', json=job_response)
+        async_result = MOCK_VIRTUAL_DATA_SOURCE.post_metadata_jsonl(ds_id=vds_id, payload=jsonl_file, compress=True)
+
+        # the file is sent again without compression
+        assert 'Content-Encoding' not in requests_mock.request_history[1].headers
+        assert uploaded[1] == jsonl_file.read_bytes()
+        assert async_result[0].result.number_received == 2
+
+    def test_partition_objects(self):
+
+        schema_a = VirtualDataSourceSchema(key='99.a')
+        table_a = VirtualDataSourceTable(key='99.a.t')
+        column_a = VirtualDataSourceColumn(key='99.a.t.c', column_type='INT')
+        schema_b = VirtualDataSourceSchema(key='99."b.x"')
+        view_b = VirtualDataSourceView(key='99."b.x".v', view_sql='select 1')
+        column_b = VirtualDataSourceColumn(key='99."b.x".v.c', column_type='INT')
+
+        partitions = AlationVirtualDataSource._partition_objects(
+            [column_a, schema_b, table_a, column_b, schema_a, view_b], max_partition_size=2
+        )
+
+        assert partitions == [
+            [[schema_a, table_a], [column_a]],
+            [[schema_b, view_b], [column_b]],
+        ]
+
+    def test_success_post_virtual_datasource_partitioned(self, requests_mock):
+
+        vds_id = 99
+        mock_vds_list = [
+            VirtualDataSourceColumn(key='99.a.t.c', column_type='INT'),
+            VirtualDataSourceTable(key='99.a.t'),
+            VirtualDataSourceSchema(key='99.a'),
+            VirtualDataSourceSchema(key='99.b'),
+            VirtualDataSourceTable(key='99.b.t'),
+        ]
+
+        async_response = {
+            "job_name": "MetadataExtraction2336_Virtual_9999"
+        }
+        job_response = {
+            "status": "successful",
+            "msg": "Job finished in 1.0 seconds at 2024-06-05 17:25:48.469169+00:00",
+            "result": "{\"number_received\": 2, \"updated_objects\": 2, \"error_objects\": [], \"error\": null}"
+        }
+
+        requests_mock.register_uri('POST', f'/api/v1/bulk_metadata/extraction/{vds_id}', json=async_response)
+        requests_mock.register_uri('GET','/api/v1/bulk_metadata/job/?name=MetadataExtraction2336_Virtual_9999', json=job_response)
+        async_result = MOCK_VIRTUAL_DATA_SOURCE.post_metadata_partitioned(
+            ds_id=vds_id, vds_objects=mock_vds_list, max_partition_size=2, max_workers=2
+        )
+
+        post_bodies = sorted(
+            [json.loads(line)['key'] for line in request.body.split('\n')]
+            for request in requests_mock.request_history if request.method == 'POST'
+        )
+        assert post_bodies == [['99.a', '99.a.t'], ['99.a.t.c'], ['99.b', '99.b.t']]
+        assert len(async_result) == 3
+        assert JobDetailsVirtualDatasourcePostResult.merge(async_result).number_received == 6
+
+    def test_failed_post_virtual_datasource_partitioned_remove_not_seen(self):
+
+        with pytest.raises(ValueError):
+            MOCK_VIRTUAL_DATA_SOURCE.post_metadata_partitioned(
+                ds_id=99,
+                vds_objects=[VirtualDataSourceSchema(key='99.a')],
+                query_params=VirtualDataSourceParams(remove_not_seen='true')
+            )
+
     def test_failed_post_virtual_datasource_no_query_params(self, requests_mock):
 
         vds_id = 99
@@ -1,5 +1,8 @@
 """Test the Alation REST API Virtual Data Source Methods."""
+import io
+import os
 import pytest
+from allie_sdk.core.custom_exceptions import UnreadableDirectory, UnsupportedPostBody
 from allie_sdk.methods.virtual_filesystem import *
 
 MOCK_VIRTUAL_DATA_SOURCE = AlationVirtualFileSystem(
@@ -59,6 +62,152 @@ class TestVirtualFileSystem:
         assert expected_job_response == async_result
 
     
+    def test_failed_post_virtual_filesystem_stream(self, requests_mock):
+
+        def consume_body(request, context):
+            # the transport reads the streamed body while sending it
+            b''.join(request.body)
+            return {'job': {'id': 14391}}
+
+        requests_mock.register_uri('POST', '/api/v1/bulk_metadata/file_upload/42/', json=consume_body)
+
+        with pytest.raises(UnsupportedPostBody):
+            MOCK_VIRTUAL_DATA_SOURCE.post_metadata(
+                fs_id=42, vfs_objects=[VirtualFileSystemItem(path="/", name="var", is_directory=True), 'bad'],
+                stream=True
+            )
+
+    def test_success_post_virtual_filesystem_stream(self, requests_mock):
+        vfs_id = 42
+        mock_vfs_list = [
+            VirtualFileSystemItem(path="/", name="var", is_directory=True),
+            VirtualFileSystemItem(path="/var", name="File 2", is_directory=False, size_in_bytes=653),
+        ]
+
+        async_response = {'job': {'id': 14391, 'url': '/api/job/14391/', 'errors_url': '/api/job_error/?job_id=14391'}}
+
+        job_response = {
+            "status": "successful",
+            "msg": "Job finished in 0.359308 seconds at 2024-06-05 17:25:48.469169+00:00",
+            "result": ['Uploaded 2 directories and files.']
+        }
+
+        requests_mock.register_uri(
+            method='POST'
+            , url=f'/api/v1/bulk_metadata/file_upload/{vfs_id}/'
+            , json=async_response
+            , status_code=200
+        )
+        requests_mock.register_uri(
+            method='GET'
+            , url='/api/v1/bulk_metadata/job/?id=14391'
+            , json=job_response
+            , status_code=200
+        )
+        async_result = MOCK_VIRTUAL_DATA_SOURCE.post_metadata(fs_id=vfs_id, vfs_objects=mock_vfs_list, stream=True)
+
+        post_request = requests_mock.request_history[0]
+        assert b''.join(post_request.body).decode('utf-8') == '\n' + '\n'.join(
+            json.dumps(item.generate_api_post_payload()) for item in mock_vfs_list
+        )
+        assert async_result[0].status == "successful"
+
+    def test_success_post_virtual_filesystem_jsonl_file_object(self, requests_mock):
+        vfs_id = 42
+        payload = '{"path": "/", "name": "var", "is_directory": true}\n'
+
+        async_response = {'job': {'id': 14391, 'url': '/api/job/14391/', 'errors_url': '/api/job_error/?job_id=14391'}}
+
+        job_response = {
+            "status": "successful",
+            "msg": "Job finished in 0.359308 seconds at 2024-06-05 17:25:48.469169+00:00",
+            "result": ['Uploaded 1 directories and files.']
+        }
+
+        requests_mock.register_uri(
+            method='POST'
+            , url=f'/api/v1/bulk_metadata/file_upload/{vfs_id}'
+            , json=async_response
+            , status_code=200
+        )
+        requests_mock.register_uri(
+            method='GET'
+            , url='/api/v1/bulk_metadata/job/?id=14391'
+            , json=job_response
+            , status_code=200
+        )
+        async_result = MOCK_VIRTUAL_DATA_SOURCE.post_metadata_jsonl(fs_id=vfs_id, payload=io.StringIO(payload))
+
+        post_request = requests_mock.request_history[0]
+        assert 'Content-Encoding' not in post_request.headers
+        assert b''.join(post_request.body) == payload.encode('utf-8')
+        assert async_result[0].status == "successful"
+
+    def test_success_post_directory_tree(self, requests_mock, tmp_path):
+        vfs_id = 42
+        (tmp_path / 'var').mkdir()
+        (tmp_path / 'var' / 'boot.log').write_text('booted')
+
+        async_response = {'job': {'id': 14391, 'url': '/api/job/14391/', 'errors_url': '/api/job_error/?job_id=14391'}}
+
+        job_response = {
+            "status": "successful",
+            "msg": "Job finished in 0.359308 seconds at 2024-06-05 17:25:48.469169+00:00",
+            "result": ['Uploaded 2 directories and files.']
+        }
+
+        uploaded = []
+
+        def read_body(request, context):
+            uploaded.append(b''.join(request.body))
+            return async_response
+
+        requests_mock.register_uri(
+            method='POST'
+            , url=f'/api/v1/bulk_metadata/file_upload/{vfs_id}/'
+            , json=read_body
+            , status_code=200
+        )
+        requests_mock.register_uri(
+            method='GET'
+            , url='/api/v1/bulk_metadata/job/?id=14391'
+            , json=job_response
+            , status_code=200
+        )
+        async_result = MOCK_VIRTUAL_DATA_SOURCE.post_directory_tree(fs_id=vfs_id, root_path=tmp_path)
+
+        lines = uploaded[0].decode('utf-8').split('\n')
+        assert lines[0] == ''
+        assert [(json.loads(line)['path'], json.loads(line)['name']) for line in lines[1:]] == [
+            ('/', 'var'), ('/var', 'boot.log')
+        ]
+        assert async_result[0].status == "successful"
+
+    def test_fail_post_directory_tree_unreadable_directory(self, requests_mock, tmp_path, monkeypatch):
+        vfs_id = 42
+        (tmp_path / 'private').mkdir()
+        scandir = os.scandir
+
+        def failing_scandir(path):
+            if os.path.basename(path) == 'private':
+                raise PermissionError(f'Permission denied: {path}')
+            return scandir(path)
+
+        def read_body(request, context):
+            b''.join(request.body)
+            return {'job': {'id': 14391}}
+
+        monkeypatch.setattr(os, 'scandir', failing_scandir)
+        requests_mock.register_uri(
+            method='POST'
+            , url=f'/api/v1/bulk_metadata/file_upload/{vfs_id}/'
+            , json=read_body
+            , status_code=200
+        )
+
+        with pytest.raises(UnreadableDirectory):
+            MOCK_VIRTUAL_DATA_SOURCE.post_directory_tree(fs_id=vfs_id, root_path=tmp_path)
+
     def test_fail_post_virtual_filesystem(self, requests_mock):
         """
         MAKE IT FAIL:
@@ -682,4 +682,44 @@ class TestGroupModels:
             )
         )
 
-        assert input_transformed == output
\ No newline at end of file
+        assert input_transformed == output
+
+
+class TestJobModels:
+
+    def test_merge_virtual_datasource_post_results(self):
+
+        jobs = [
+            JobDetailsVirtualDatasourcePost(
+                status='successful'
+                , msg='Job finished'
+                , result='{"number_received": 3, "updated_objects": 2, "error_objects": ["1.a.b"], "error": null}'
+            ),
+            JobDetailsVirtualDatasourcePost(
+                status='failed'
+                , msg='Job failed'
+                , result='{"number_received": 4, "updated_objects": 0, "error_objects": [], "error": "invalid key"}'
+            ),
+            JobDetailsVirtualDatasourcePost(status='failed', msg='Job failed', result=None),
+        ]
+
+        assert JobDetailsVirtualDatasourcePostResult.merge(jobs) == JobDetailsVirtualDatasourcePostResult(
+            number_received=7, updated_objects=2, error_objects=['1.a.b'], error='invalid key\nfailed: Job failed'
+        )
+
+    def test_merge_virtual_datasource_post_results_without_result(self):
+
+        jobs = [
+            JobDetailsVirtualDatasourcePost(
+                status='successful'
+                , msg='Job finished'
+                , result='{"number_received": 3, "updated_objects": 3, "error_objects": [], "error": null}'
+            ),
+            JobDetailsVirtualDatasourcePost(status='failed', msg='Partition upload failed', result=None),
+            JobDetailsVirtualDatasourcePost(status='successful', msg='Job finished', result=None),
+        ]
+
+        merged = JobDetailsVirtualDatasourcePostResult.merge(jobs)
+
+        assert merged.number_received == 3
+        assert merged.error == 'failed: Partition upload failed'
@@ -621,3 +621,18 @@ class TestRDBMSModels:
         ]
 
         assert mock_base.custom_fields == expected_custom_fields
+
+    def test_column_uses_slots(self):
+
+        column = Column.from_api_response({
+            "id": 3,
+            "key": "7.test_name.table.column",
+            "custom_fields": [{"value": "PII", "field_id": 10087}],
+            "index": {"isPrimaryKey": True}
+        })
+
+        assert not hasattr(column, "__dict__")
+        assert not hasattr(column.custom_fields[0], "__dict__")
+        assert not hasattr(column.index, "__dict__")
+        with pytest.raises(AttributeError):
+            column.unexpected_attribute = True